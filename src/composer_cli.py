@@ -3,78 +3,98 @@
 """Command-line interface for the AI Music Composer."""
 
 import os
+import re
 import sys
-from typing import List, Optional
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
-from rich.prompt import Prompt
+from rich.text import Text
 
 # Add src directory to Python path when running directly
 if __name__ == "__main__":
     src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, src_dir)
 
-from .config import get_default_bpm
+from .config import get_default_bpm, get_scheduling_lookahead_beats
 from .logging_config import setup_logging
-from .midi_generator import InstrumentManager, MIDIControllerAdapter, SequencerAdapter
-from .midi_generator.midi_controller import MIDIController
-from .midi_generator.sequencer import MIDISequencer
-from .midi_generator.structures import Note, Sequence
-from .midi_generator.transport import PreciseTransport
-
-console = Console()
+from .midi_generator.parsing import parse_sequence
 
+# The MIDI stack (mido, the transport thread machinery) is only needed once the
+# REPL starts, so it is imported in main() and `composer --help` stays fast
+if TYPE_CHECKING:
+    from .midi_generator import InstrumentManager
+    from .midi_generator.midi_controller import MIDIController
+    from .midi_generator.sequencer import MIDISequencer
+    from .midi_generator.transport import PreciseTransport
 
-def parse_sequence(sequence_str: str) -> Sequence:
-    """Parse a sequence string into a Sequence object.
+console = Console()
 
-    Format: note,velocity,channel,duration;note,velocity,channel,duration;...
+# Static messages are built once as styled Text objects: printing them skips
+# Rich's markup parser, and literal "[optional]" arguments are shown as-is
+# instead of being mistaken for markup tags.
+_USAGE_NOTE = Text("Usage: note <note> <velocity> [channel] [duration]", style="red")
+_INVALID_NOTE_PARAMS = Text(
+    "Invalid params: Note and velocity must be 0-127, channel 0-15", style="red"
+)
+_USAGE_SEQUENCE = Text("Usage: sequence <note_sequence> [--loop]", style="red")
+_SEQUENCE_EXAMPLE = Text("Example: sequence 60,100,0,0.5;67,100,0,0.5;72,100,0,0.5")
+_USAGE_CONNECT = Text("Usage: connect <port_number>", style="red")
+_PORT_NOT_INTEGER = Text("Port number must be an integer!", style="red")
+_USAGE_STOPLOOP = Text("Usage: stoploop <sequence_id>", style="red")
+_SEQUENCE_ID_NOT_NUMBER = Text("Sequence ID must be a number", style="red")
+_USAGE_INSTRUMENT = Text(
+    "Usage: instrument <create|list|remove> [args...]", style="red"
+)
+_USAGE_INSTRUMENT_CREATE = Text(
+    "Usage: instrument create <name> <channel> [velocity] [transpose]", style="red"
+)
+_INVALID_INSTRUMENT_PARAMS = Text(
+    "Invalid parameters. Channel: 0-15, Velocity: 0-127, Transpose: -127 to 127",
+    style="red",
+)
+_USAGE_INSTRUMENT_REMOVE = Text("Usage: instrument remove <name>", style="red")
+_USAGE_PLAY = Text(
+    "Usage: play <instrument_name> <note> [velocity] [duration]", style="red"
+)
+_USAGE_PLAYSEQ = Text(
+    "Usage: playseq <instrument_name> <note_sequence> [--loop]", style="red"
+)
+_USAGE_STOPINST = Text("Usage: stopinst <instrument_name>", style="red")
+_STOPPED_ALL = Text("Stopped all sequences and instruments", style="yellow")
+_USE_EXIT = Text("\nUse 'exit' to quit", style="yellow")
+_GOODBYE = Text("Goodbye!", style="blue")
+# The REPL prompt, rendered the same way Prompt.ask displayed it
+_PROMPT = Text.assemble("\n", ("composer>", "bold green"), ": ")
+
+# A standalone --loop token anywhere in a sequence argument, in any case
+_LOOP_FLAG = re.compile(r"(?:^|\s)--loop(?=\s|$)", re.IGNORECASE)
+
+
+def _tokenize(line: str) -> List[str]:
+    """Split a line of REPL input into lowercase tokens.
+
+    ``str.split()`` with no separator already drops leading and trailing
+    whitespace, so no separate ``strip()`` copy is made.
 
     Args:
-        sequence_str: String containing semicolon-separated note definitions.
+        line: Raw input line.
 
     Returns:
-        Sequence object containing the parsed notes.
-
-    Raises:
-        ValueError: If the sequence format is invalid.
+        Lowercased whitespace-separated tokens (empty for a blank line). The
+        command keyword is interned, so looking it up among the interned
+        dispatch-table keys matches on identity.
     """
-    notes = []
-    current_beat = 0.0
-    note_parts = sequence_str.split(";")
-
-    for note_str in note_parts:
-        if not note_str.strip():
-            continue
-        parts = note_str.split(",")
-        if len(parts) < 2:
-            raise ValueError("Each note must have at least note and velocity values")
-
-        note_num = int(parts[0])
-        velocity = int(parts[1])
-        channel = int(parts[2]) if len(parts) > 2 else 0
-        duration = float(parts[3]) if len(parts) > 3 else 0.5
-
-        if not (0 <= note_num <= 127 and 0 <= velocity <= 127 and 0 <= channel <= 15):
-            raise ValueError("Invalid note parameters")
-
-        note = Note(
-            pitch=note_num,
-            velocity=velocity,
-            duration=duration,
-            start_beat=current_beat,
-            channel=channel,
-        )
-        notes.append(note)
-        current_beat += duration
-
-    return Sequence(notes=notes)
+    parts = line.lower().split()
+    if parts:
+        parts[0] = sys.intern(parts[0])
+    return parts
 
 
-def print_help():
-    """Print available commands."""
-    help_text = """
+_HELP_TEXT = Text.from_markup(
+    r"""
 [bold]Available Commands:[/bold]
 
 [bold cyan]MIDI & Transport:[/bold cyan]
@@ -84,16 +104,16 @@ def print_help():
     [yellow]stop[/yellow] - Stop all playing sequences
 
 [bold cyan]Direct MIDI:[/bold cyan]
-    [yellow]note <note> <velocity> [channel] [duration][/yellow] - Send a MIDI note
+    [yellow]note <note> <velocity> \[channel] \[duration][/yellow] - Send a MIDI note
     [yellow]sequence <note_sequence> [--loop][/yellow] - Schedule a sequence of notes
     [yellow]stoploop <sequence_id>[/yellow] - Stop a looping sequence
 
 [bold cyan]Instruments:[/bold cyan]
-    [yellow]instrument create <name> <channel> [velocity] [transpose][/yellow]
+    [yellow]instrument create <name> <channel> \[velocity] \[transpose][/yellow]
         - Create instrument
     [yellow]instrument list[/yellow] - List all instruments
     [yellow]instrument remove <name>[/yellow] - Remove an instrument
-    [yellow]play <instrument_name> <note> [velocity] [duration][/yellow]
+    [yellow]play <instrument_name> <note> \[velocity] \[duration][/yellow]
         - Play note on instrument
     [yellow]playseq <instrument_name> <note_sequence> [--loop][/yellow]
         - Play sequence on instrument
@@ -112,11 +132,16 @@ def print_help():
     - Add --loop flag to sequence commands to make them loop indefinitely
     - Instrument transpose: positive values transpose up, negative down
     - Channel range: 0-15, Note/Velocity range: 0-127
-    """
-    console.print(help_text)
+"""
+)
 
 
-def handle_note_command(controller: MIDIController, parts: List[str]) -> None:
+def print_help():
+    """Print available commands."""
+    console.print(_HELP_TEXT)
+
+
+def handle_note_command(controller: "MIDIController", parts: List[str]) -> None:
     """Handle the note command.
 
     Args:
@@ -124,7 +149,7 @@ def handle_note_command(controller: MIDIController, parts: List[str]) -> None:
         parts: Command parts (note, velocity, optional channel and duration).
     """
     if len(parts) < 3:
-        console.print("[red]Usage: note <note> <velocity> [channel] [duration][/red]")
+        console.print(_USAGE_NOTE)
         return
 
     try:
@@ -133,34 +158,34 @@ def handle_note_command(controller: MIDIController, parts: List[str]) -> None:
         channel = int(parts[3]) if len(parts) > 3 else 0
         duration = float(parts[4]) if len(parts) > 4 else 0.5
 
-        if not (0 <= note <= 127 and 0 <= velocity <= 127 and 0 <= channel <= 15):
+        # Same bit-width test as sequence parsing: note/velocity fit in 7 bits,
+        # channel in 4, and negative values always have high bits set
+        if (note | velocity) >> 7 or channel >> 4:
             raise ValueError
 
         controller.send_note(note, velocity, channel, duration)
     except ValueError:
-        msg = (
-            "[red]Invalid params: Note and velocity must be 0-127, "
-            "channel 0-15[/red]"
-        )
-        console.print(msg)
+        console.print(_INVALID_NOTE_PARAMS)
 
 
-def handle_sequence_command(sequencer: MIDISequencer, parts: List[str]) -> None:
+def handle_sequence_command(
+    sequencer: "MIDISequencer", parts: List[str], raw: str
+) -> None:
     """Handle the sequence command.
 
     Args:
         sequencer: The MIDI sequencer instance.
         parts: Command parts (sequence string and optional --loop flag).
+        raw: The command line as entered.
     """
     if len(parts) < 2:
-        console.print("[red]Usage: sequence <note_sequence> [--loop][/red]")
-        console.print("Example: sequence 60,100,0,0.5;67,100,0,0.5;72,100,0,0.5")
+        console.print(_USAGE_SEQUENCE)
+        console.print(_SEQUENCE_EXAMPLE)
         return
 
     try:
         # Check for --loop flag
-        loop = "--loop" in parts
-        sequence_str = " ".join(p for p in parts[1:] if p != "--loop")
+        sequence_str, loop = _split_loop_flag(raw.split(None, 1)[1])
         sequence = parse_sequence(sequence_str)
 
         # Set loop property on the sequence
@@ -175,7 +200,22 @@ def handle_sequence_command(sequencer: MIDISequencer, parts: List[str]) -> None:
         console.print(f"[red]Error in sequence format: {str(e)}[/red]")
 
 
-def handle_connect_command(controller: MIDIController, parts: List[str]) -> None:
+def _split_loop_flag(sequence_str: str) -> Tuple[str, bool]:
+    """Remove the ``--loop`` flag from a sequence argument.
+
+    Args:
+        sequence_str: Everything after the command keyword(s).
+
+    Returns:
+        Tuple of (sequence string without the flag, whether looping was
+        requested).
+    """
+    # The common unflagged case costs a single scan of the string
+    sequence_str, count = _LOOP_FLAG.subn(" ", sequence_str)
+    return sequence_str.strip(), count > 0
+
+
+def handle_connect_command(controller: "MIDIController", parts: List[str]) -> None:
     """Handle the connect command.
 
     Args:
@@ -183,16 +223,16 @@ def handle_connect_command(controller: MIDIController, parts: List[str]) -> None
         parts: Command parts (port number).
     """
     if len(parts) != 2:
-        console.print("[red]Usage: connect <port_number>[/red]")
+        console.print(_USAGE_CONNECT)
         return
     try:
         port_num = int(parts[1])
         controller.connect_port(port_num)
     except ValueError:
-        console.print("[red]Port number must be an integer![/red]")
+        console.print(_PORT_NOT_INTEGER)
 
 
-def handle_stoploop_command(sequencer: MIDISequencer, parts: List[str]) -> None:
+def handle_stoploop_command(sequencer: "MIDISequencer", parts: List[str]) -> None:
     """Handle the stoploop command.
 
     Args:
@@ -200,7 +240,7 @@ def handle_stoploop_command(sequencer: MIDISequencer, parts: List[str]) -> None:
         parts: Command parts (sequence ID).
     """
     if len(parts) != 2:
-        console.print("[red]Usage: stoploop <sequence_id>[/red]")
+        console.print(_USAGE_STOPLOOP)
         return
 
     try:
@@ -208,13 +248,13 @@ def handle_stoploop_command(sequencer: MIDISequencer, parts: List[str]) -> None:
         sequencer.stop_loop(sequence_id)
         console.print(f"[green]Stopped looping sequence {sequence_id}[/green]")
     except ValueError:
-        console.print("[red]Sequence ID must be a number[/red]")
+        console.print(_SEQUENCE_ID_NOT_NUMBER)
     except KeyError:
         console.print(f"[red]No looping sequence found with ID {sequence_id}[/red]")
 
 
 def handle_instrument_command(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str]
 ) -> None:
     """Handle instrument management commands.
 
@@ -223,30 +263,23 @@ def handle_instrument_command(
         parts: Command parts.
     """
     if len(parts) < 2:
-        console.print("[red]Usage: instrument <create|list|remove> [args...][/red]")
+        console.print(_USAGE_INSTRUMENT)
         return
 
     subcommand = parts[1]
-
-    if subcommand == "create":
-        _handle_instrument_create(instrument_manager, parts)
-    elif subcommand == "list":
-        instrument_manager.print_instruments_table()
-    elif subcommand == "remove":
-        _handle_instrument_remove(instrument_manager, parts)
+    handler = _INSTRUMENT_HANDLERS.get(subcommand)
+    if handler:
+        handler(instrument_manager, parts)
     else:
         console.print(f"[red]Unknown instrument command: {subcommand}[/red]")
 
 
 def _handle_instrument_create(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str]
 ) -> None:
     """Handle instrument creation command."""
     if len(parts) < 4:
-        console.print(
-            "[red]Usage: instrument create <name> <channel> [velocity] "
-            "[transpose][/red]"
-        )
+        console.print(_USAGE_INSTRUMENT_CREATE)
         return
 
     try:
@@ -270,18 +303,15 @@ def _handle_instrument_create(
             )
 
     except ValueError:
-        console.print(
-            "[red]Invalid parameters. Channel: 0-15, Velocity: 0-127, "
-            "Transpose: -127 to 127[/red]"
-        )
+        console.print(_INVALID_INSTRUMENT_PARAMS)
 
 
 def _handle_instrument_remove(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str]
 ) -> None:
     """Handle instrument removal command."""
     if len(parts) != 3:
-        console.print("[red]Usage: instrument remove <name>[/red]")
+        console.print(_USAGE_INSTRUMENT_REMOVE)
         return
 
     name = parts[2]
@@ -291,8 +321,17 @@ def _handle_instrument_remove(
         console.print(f"[red]Instrument '{name}' not found[/red]")
 
 
+_INSTRUMENT_HANDLERS: Dict[str, Callable[["InstrumentManager", List[str]], None]] = {
+    "create": _handle_instrument_create,
+    "list": lambda instrument_manager, parts: (
+        instrument_manager.print_instruments_table()
+    ),
+    "remove": _handle_instrument_remove,
+}
+
+
 def handle_play_command(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str]
 ) -> None:
     """Handle playing a note on an instrument.
 
@@ -301,9 +340,7 @@ def handle_play_command(
         parts: Command parts.
     """
     if len(parts) < 3:
-        console.print(
-            "[red]Usage: play <instrument_name> <note> [velocity] [duration][/red]"
-        )
+        console.print(_USAGE_PLAY)
         return
 
     instrument_name = parts[1]
@@ -329,18 +366,17 @@ def handle_play_command(
 
 
 def handle_playseq_command(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str], raw: str
 ) -> None:
     """Handle playing a sequence on an instrument.
 
     Args:
         instrument_manager: The instrument manager instance.
         parts: Command parts.
+        raw: The command line as entered.
     """
     if len(parts) < 3:
-        console.print(
-            "[red]Usage: playseq <instrument_name> <note_sequence> [--loop][/red]"
-        )
+        console.print(_USAGE_PLAYSEQ)
         return
 
     instrument_name = parts[1]
@@ -352,8 +388,7 @@ def handle_playseq_command(
 
     try:
         # Check for --loop flag
-        loop = "--loop" in parts
-        sequence_str = " ".join(p for p in parts[2:] if p != "--loop")
+        sequence_str, loop = _split_loop_flag(raw.split(None, 2)[2])
         sequence = parse_sequence(sequence_str)
 
         # Set loop property on the sequence
@@ -372,7 +407,7 @@ def handle_playseq_command(
 
 
 def handle_stopinst_command(
-    instrument_manager: InstrumentManager, parts: List[str]
+    instrument_manager: "InstrumentManager", parts: List[str]
 ) -> None:
     """Handle stopping all sequences on an instrument.
 
@@ -381,7 +416,7 @@ def handle_stopinst_command(
         parts: Command parts.
     """
     if len(parts) != 2:
-        console.print("[red]Usage: stopinst <instrument_name>[/red]")
+        console.print(_USAGE_STOPINST)
         return
 
     instrument_name = parts[1]
@@ -398,49 +433,40 @@ def handle_stopinst_command(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class CommandContext:
+    """Components that command handlers operate on."""
+
+    controller: "MIDIController"
+    sequencer: "MIDISequencer"
+    transport: "PreciseTransport"
+    instrument_manager: "InstrumentManager"
+
+
 def handle_command(
-    controller: MIDIController,
-    sequencer: MIDISequencer,
-    transport: PreciseTransport,
-    instrument_manager: InstrumentManager,
-    command: str,
-    parts: List[str],
+    ctx: CommandContext, parts: List[str], raw: Optional[str] = None
 ) -> Optional[bool]:
     """Handle a single command.
 
     Args:
-        controller: The MIDI controller instance.
-        sequencer: The MIDI sequencer instance.
-        transport: The PreciseTransport instance.
-        instrument_manager: The instrument manager instance.
-        command: The full command string.
-        parts: The command split into parts.
+        ctx: The components the command operates on.
+        parts: The command split into parts; the first is the command keyword.
+        raw: The command line as entered. Handlers that take free-form
+            arguments, such as sequence strings, slice it directly instead of
+            re-joining ``parts``. Defaults to ``parts`` joined by spaces.
 
     Returns:
         True if should exit, None otherwise.
     """
+    command = parts[0]
     if command == "exit":
-        return _handle_exit_command(instrument_manager, sequencer, transport)
-
-    # Handle other commands
-    command_handlers = {
-        "help": lambda: print_help(),
-        "list": lambda: controller.list_ports(),
-        "connect": lambda: handle_connect_command(controller, parts),
-        "note": lambda: handle_note_command(controller, parts),
-        "sequence": lambda: handle_sequence_command(sequencer, parts),
-        "stoploop": lambda: handle_stoploop_command(sequencer, parts),
-        "instrument": lambda: handle_instrument_command(instrument_manager, parts),
-        "play": lambda: handle_play_command(instrument_manager, parts),
-        "playseq": lambda: handle_playseq_command(instrument_manager, parts),
-        "stopinst": lambda: handle_stopinst_command(instrument_manager, parts),
-        "start": lambda: transport.start(),
-        "stop": lambda: _handle_stop_command(instrument_manager, sequencer),
-    }
-
-    handler = command_handlers.get(command)
+        return _handle_exit_command(
+            ctx.instrument_manager, ctx.sequencer, ctx.transport
+        )
+
+    handler = _COMMAND_HANDLERS.get(command)
     if handler:
-        handler()
+        handler(ctx, parts, " ".join(parts) if raw is None else raw)
     else:
         console.print(f"[red]Unknown command: {command}[/red]")
         print_help()
@@ -449,9 +475,9 @@ def handle_command(
 
 
 def _handle_exit_command(
-    instrument_manager: InstrumentManager,
-    sequencer: MIDISequencer,
-    transport: PreciseTransport,
+    instrument_manager: "InstrumentManager",
+    sequencer: "MIDISequencer",
+    transport: "PreciseTransport",
 ) -> bool:
     """Handle the exit command."""
     # Stop all instruments and sequences
@@ -462,15 +488,42 @@ def _handle_exit_command(
 
 
 def _handle_stop_command(
-    instrument_manager: InstrumentManager,
-    sequencer: MIDISequencer,
+    instrument_manager: "InstrumentManager",
+    sequencer: "MIDISequencer",
 ) -> None:
     """Handle the stop command."""
     # Stop all instruments and sequences
     instrument_manager.stop_all_instruments()
     sequencer.clear_all_sequences()
     sequencer.all_notes_off()
-    console.print("[yellow]Stopped all sequences and instruments[/yellow]")
+    console.print(_STOPPED_ALL)
+
+
+# Built once at import time so dispatching a command allocates nothing.
+_COMMAND_HANDLERS: Dict[str, Callable[[CommandContext, List[str], str], object]] = {
+    "help": lambda ctx, parts, raw: print_help(),
+    "list": lambda ctx, parts, raw: ctx.controller.list_ports(),
+    "connect": lambda ctx, parts, raw: handle_connect_command(ctx.controller, parts),
+    "note": lambda ctx, parts, raw: handle_note_command(ctx.controller, parts),
+    "sequence": lambda ctx, parts, raw: handle_sequence_command(
+        ctx.sequencer, parts, raw
+    ),
+    "stoploop": lambda ctx, parts, raw: handle_stoploop_command(ctx.sequencer, parts),
+    "instrument": lambda ctx, parts, raw: handle_instrument_command(
+        ctx.instrument_manager, parts
+    ),
+    "play": lambda ctx, parts, raw: handle_play_command(ctx.instrument_manager, parts),
+    "playseq": lambda ctx, parts, raw: handle_playseq_command(
+        ctx.instrument_manager, parts, raw
+    ),
+    "stopinst": lambda ctx, parts, raw: handle_stopinst_command(
+        ctx.instrument_manager, parts
+    ),
+    "start": lambda ctx, parts, raw: ctx.transport.start(),
+    "stop": lambda ctx, parts, raw: _handle_stop_command(
+        ctx.instrument_manager, ctx.sequencer
+    ),
+}
 
 
 @click.command()
@@ -496,38 +549,49 @@ def main():
     # Initialize logging
     setup_logging()
 
+    from .midi_generator import (
+        InstrumentManager,
+        MIDIControllerAdapter,
+        SequencerAdapter,
+    )
+    from .midi_generator.midi_controller import MIDIController
+    from .midi_generator.sequencer import MIDISequencer
+    from .midi_generator.transport import PreciseTransport
+
     controller = MIDIController()
     transport = PreciseTransport(initial_bpm=get_default_bpm())
-    sequencer = MIDISequencer(controller, transport)
+    sequencer = MIDISequencer(
+        controller, transport, lookahead_beats=get_scheduling_lookahead_beats()
+    )
 
     # Create adapters and instrument manager
     note_player = MIDIControllerAdapter(controller)
     sequence_player = SequencerAdapter(sequencer)
     instrument_manager = InstrumentManager(note_player, sequence_player)
+    ctx = CommandContext(controller, sequencer, transport, instrument_manager)
+
+    # When commands are piped in, buffer each command's output and write it in
+    # one go instead of flushing after every console.print call
+    output_buffer = nullcontext() if sys.stdin.isatty() else console
 
     try:
         while True:
             try:
-                command = (
-                    Prompt.ask("\n[bold green]composer>[/bold green]").strip().lower()
-                )
-                parts = command.split()
+                line = console.input(_PROMPT)
+                parts = _tokenize(line)
 
                 if not parts:
                     continue
 
-                if handle_command(
-                    controller,
-                    sequencer,
-                    transport,
-                    instrument_manager,
-                    parts[0],
-                    parts,
-                ):
-                    break
+                with output_buffer:
+                    if handle_command(ctx, parts, line):
+                        break
 
+            except EOFError:
+                # End of scripted input
+                break
             except KeyboardInterrupt:
-                console.print("\n[yellow]Use 'exit' to quit[/yellow]")
+                console.print(_USE_EXIT)
             except Exception as e:
                 console.print(f"[red]Error: {str(e)}[/red]")
     finally:
@@ -541,7 +605,7 @@ def main():
             console.print(f"[red]Error during cleanup: {str(e)}[/red]")
 
         controller.close()
-        console.print("[blue]Goodbye![/blue]")
+        console.print(_GOODBYE)
 
 
 if __name__ == "__main__":
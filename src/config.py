@@ -5,43 +5,57 @@ environment variables, and secrets used throughout the application.
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
-    """Neo4j database configuration."""
+    """Neo4j database configuration.
+
+    Instances are immutable, so the complete database URL is built once on
+    construction; use ``dataclasses.replace`` to derive a changed config.
+    """
 
     host: str = "localhost"
     port: int = 7687
     username: str = "neo4j"
     password: str = "musiccomposer"
     scheme: str = "bolt"
+    # Complete database URL (set on init)
+    url: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def url(self) -> str:
-        """Get the complete database URL."""
-        return (
-            f"{self.scheme}://{self.username}:{self.password}@{self.host}:{self.port}"
+    def __post_init__(self):
+        """Build the database URL from the connection settings."""
+        object.__setattr__(
+            self,
+            "url",
+            f"{self.scheme}://{self.username}:{self.password}@{self.host}:{self.port}",
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM and AI configuration."""
 
     openai_api_key: Optional[str] = None
     openai_organization_id: Optional[str] = None
     model_name: str = "gpt-4o-mini"
+    # Cheaper model for simple single-command prompts (None disables routing)
+    fast_model_name: Optional[str] = None
     temperature: float = 0.7
     max_tokens: int = 1000
+    # Estimated prompt size above which optional memory context is dropped
+    max_prompt_tokens: int = 3000
     timeout: int = 30
+    # Number of LLM responses kept for repeated prompts (0 disables the cache)
+    response_cache_size: int = 128
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDIConfig:
     """MIDI system configuration."""
 
@@ -56,7 +70,7 @@ class MIDIConfig:
     scheduling_lookahead_beats: float = 0.1  # How far ahead to schedule events
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -71,7 +85,64 @@ class LoggingConfig:
     database_log_level: str = level
 
 
-@dataclass
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment flag such as "true", "1", "yes" or "on"."""
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+# (section of AppConfig or None for AppConfig itself, field, environment
+# variable, parser) for every setting that can be overridden from the environment
+_ENV_OVERRIDES: Tuple[Tuple[Optional[str], str, str, Callable[[str], Any]], ...] = (
+    # Database configuration
+    ("database", "host", "NEO4J_HOST", str),
+    ("database", "port", "NEO4J_PORT", int),
+    ("database", "username", "NEO4J_USERNAME", str),
+    ("database", "password", "NEO4J_PASSWORD", str),
+    ("database", "scheme", "NEO4J_SCHEME", str),
+    # LLM configuration
+    ("llm", "openai_api_key", "OPENAI_API_KEY", str),
+    ("llm", "openai_organization_id", "OPENAI_ORGANIZATION_ID", str),
+    ("llm", "model_name", "OPENAI_MODEL_NAME", str),
+    ("llm", "fast_model_name", "OPENAI_FAST_MODEL_NAME", str),
+    ("llm", "temperature", "OPENAI_TEMPERATURE", float),
+    ("llm", "max_tokens", "OPENAI_MAX_TOKENS", int),
+    ("llm", "max_prompt_tokens", "OPENAI_MAX_PROMPT_TOKENS", int),
+    ("llm", "timeout", "OPENAI_TIMEOUT", int),
+    ("llm", "response_cache_size", "OPENAI_RESPONSE_CACHE_SIZE", int),
+    # MIDI configuration
+    ("midi", "default_bpm", "MIDI_DEFAULT_BPM", float),
+    ("midi", "default_velocity", "MIDI_DEFAULT_VELOCITY", int),
+    ("midi", "default_channel", "MIDI_DEFAULT_CHANNEL", int),
+    ("midi", "default_duration", "MIDI_DEFAULT_DURATION", float),
+    ("midi", "max_sequence_loops", "MIDI_MAX_SEQUENCE_LOOPS", int),
+    ("midi", "timing_precision_ms", "MIDI_TIMING_PRECISION_MS", float),
+    ("midi", "scheduling_lookahead_beats", "MIDI_SCHEDULING_LOOKAHEAD_BEATS", float),
+    # Logging configuration
+    ("logging", "level", "LOG_LEVEL", str.upper),
+    ("logging", "midi_log_level", "MIDI_LOG_LEVEL", str.upper),
+    ("logging", "sequencer_log_level", "SEQUENCER_LOG_LEVEL", str.upper),
+    ("logging", "transport_log_level", "TRANSPORT_LOG_LEVEL", str.upper),
+    ("logging", "llm_log_level", "LLM_LOG_LEVEL", str.upper),
+    ("logging", "database_log_level", "DATABASE_LOG_LEVEL", str.upper),
+    # Application settings
+    (None, "debug", "DEBUG", _parse_bool),
+)
+
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# (environment variable, getter) for each log level validated on construction
+_LOG_LEVEL_FIELDS = (
+    ("LOG_LEVEL", attrgetter("logging.level")),
+    ("MIDI_LOG_LEVEL", attrgetter("logging.midi_log_level")),
+    ("SEQUENCER_LOG_LEVEL", attrgetter("logging.sequencer_log_level")),
+    ("TRANSPORT_LOG_LEVEL", attrgetter("logging.transport_log_level")),
+    ("LLM_LOG_LEVEL", attrgetter("logging.llm_log_level")),
+    ("DATABASE_LOG_LEVEL", attrgetter("logging.database_log_level")),
+)
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
 
@@ -93,74 +164,23 @@ class AppConfig:
 
     def _load_from_environment(self):
         """Load configuration from environment variables."""
-        # Load .env file if it exists
-        load_dotenv()
-
-        # Database configuration
-        self.database.host = os.getenv("NEO4J_HOST", self.database.host)
-        self.database.port = int(os.getenv("NEO4J_PORT", str(self.database.port)))
-        self.database.username = os.getenv("NEO4J_USERNAME", self.database.username)
-        self.database.password = os.getenv("NEO4J_PASSWORD", self.database.password)
-        self.database.scheme = os.getenv("NEO4J_SCHEME", self.database.scheme)
-
-        # LLM configuration
-        self.llm.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.llm.openai_organization_id = os.getenv("OPENAI_ORGANIZATION_ID")
-        self.llm.model_name = os.getenv("OPENAI_MODEL_NAME", self.llm.model_name)
-        self.llm.temperature = float(
-            os.getenv("OPENAI_TEMPERATURE", str(self.llm.temperature))
-        )
-        self.llm.max_tokens = int(
-            os.getenv("OPENAI_MAX_TOKENS", str(self.llm.max_tokens))
-        )
-        self.llm.timeout = int(os.getenv("OPENAI_TIMEOUT", str(self.llm.timeout)))
-
-        # MIDI configuration
-        self.midi.default_bpm = float(
-            os.getenv("MIDI_DEFAULT_BPM", str(self.midi.default_bpm))
-        )
-        self.midi.default_velocity = int(
-            os.getenv("MIDI_DEFAULT_VELOCITY", str(self.midi.default_velocity))
-        )
-        self.midi.default_channel = int(
-            os.getenv("MIDI_DEFAULT_CHANNEL", str(self.midi.default_channel))
-        )
-        self.midi.default_duration = float(
-            os.getenv("MIDI_DEFAULT_DURATION", str(self.midi.default_duration))
-        )
-        self.midi.max_sequence_loops = int(
-            os.getenv("MIDI_MAX_SEQUENCE_LOOPS", str(self.midi.max_sequence_loops))
-        )
-        self.midi.timing_precision_ms = float(
-            os.getenv("MIDI_TIMING_PRECISION_MS", str(self.midi.timing_precision_ms))
-        )
-        self.midi.scheduling_lookahead_beats = float(
-            os.getenv(
-                "MIDI_SCHEDULING_LOOKAHEAD_BEATS",
-                str(self.midi.scheduling_lookahead_beats),
-            )
-        )
-
-        # Logging configuration
-        self.logging.level = os.getenv("LOG_LEVEL", self.logging.level).upper()
-        self.logging.midi_log_level = os.getenv(
-            "MIDI_LOG_LEVEL", self.logging.midi_log_level
-        ).upper()
-        self.logging.sequencer_log_level = os.getenv(
-            "SEQUENCER_LOG_LEVEL", self.logging.sequencer_log_level
-        ).upper()
-        self.logging.transport_log_level = os.getenv(
-            "TRANSPORT_LOG_LEVEL", self.logging.transport_log_level
-        ).upper()
-        self.logging.llm_log_level = os.getenv(
-            "LLM_LOG_LEVEL", self.logging.llm_log_level
-        ).upper()
-        self.logging.database_log_level = os.getenv(
-            "DATABASE_LOG_LEVEL", self.logging.database_log_level
-        ).upper()
-
-        # Application settings
-        self.debug = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes", "on")
+        # Only variables that are actually set are parsed; everything else
+        # keeps its dataclass default
+        env = os.environ
+        overrides: Dict[Optional[str], Dict[str, Any]] = {}
+        for section, name, key, parse in _ENV_OVERRIDES:
+            value = env.get(key)
+            if value is not None:
+                overrides.setdefault(section, {})[name] = parse(value)
+
+        for section, values in overrides.items():
+            if section is None:
+                for name, value in values.items():
+                    setattr(self, name, value)
+            else:
+                # Sections are rebuilt rather than mutated so that values
+                # derived on init, such as DatabaseConfig.url, stay in sync
+                setattr(self, section, replace(getattr(self, section), **values))
 
     def _validate_config(self):
         """Validate configuration values."""
@@ -187,21 +207,19 @@ class AppConfig:
             )
 
         # Validate logging levels
-        valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        for level_name, level_value in [
-            ("LOG_LEVEL", self.logging.level),
-            ("MIDI_LOG_LEVEL", self.logging.midi_log_level),
-            ("SEQUENCER_LOG_LEVEL", self.logging.sequencer_log_level),
-            ("TRANSPORT_LOG_LEVEL", self.logging.transport_log_level),
-            ("LLM_LOG_LEVEL", self.logging.llm_log_level),
-            ("DATABASE_LOG_LEVEL", self.logging.database_log_level),
-        ]:
-            if level_value not in valid_log_levels:
+        for level_name, get_level in _LOG_LEVEL_FIELDS:
+            level_value = get_level(self)
+            if level_value not in _VALID_LOG_LEVELS:
                 raise ValueError(
-                    f"Invalid {level_name}: {level_value}. Must be one of {valid_log_levels}."
+                    f"Invalid {level_name}: {level_value}. "
+                    f"Must be one of {', '.join(sorted(_VALID_LOG_LEVELS))}."
                 )
 
 
+# Load .env file if it exists. This happens once per process rather than on
+# every AppConfig construction; see reload_config(reload_dotenv=True).
+load_dotenv()
+
 # Global configuration instance
 config = AppConfig()
 
@@ -211,9 +229,16 @@ def get_config() -> AppConfig:
     return config
 
 
-def reload_config():
-    """Reload configuration from environment variables."""
+def reload_config(reload_dotenv: bool = False):
+    """Reload configuration from environment variables.
+
+    Args:
+        reload_dotenv: Re-read the .env file first, letting its values
+            override variables already in the environment.
+    """
     global config
+    if reload_dotenv:
+        load_dotenv(override=True)
     config = AppConfig()
     return config
 
@@ -234,6 +259,11 @@ def get_default_bpm() -> float:
     return config.midi.default_bpm
 
 
+def get_scheduling_lookahead_beats() -> float:
+    """Get how many beats ahead of playback sequences are scheduled."""
+    return config.midi.scheduling_lookahead_beats
+
+
 def is_debug_mode() -> bool:
     """Check if debug mode is enabled."""
     return config.debug
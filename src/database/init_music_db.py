@@ -1,9 +1,11 @@
 """Database initialization module for setting up the music theory database."""
 
-from typing import Dict, List
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, List, Tuple, Type
 
-from music21 import chord, interval, pitch, scale
-from neomodel import config, db
+from neo4j.exceptions import ClientError
+from neomodel import StructuredNode, config, db
 
 from ..logging_config import get_logger
 from .models import (
@@ -70,7 +72,127 @@ CHORD_TYPES = [
     "diminished-seventh",
 ]
 
+_CHORD_TYPE_SET = frozenset(CHORD_TYPES)
 
+# Neo4j status codes for a schema rule that is already covered by another
+_SCHEMA_ALREADY_EXISTS_CODES = frozenset(
+    (
+        "Neo.ClientError.Schema.EquivalentSchemaRuleAlreadyExists",
+        "Neo.ClientError.Schema.IndexAlreadyExists",
+        "Neo.ClientError.Schema.ConstraintAlreadyExists",
+    )
+)
+
+# Chord type -> interval names above the root. The tuples are handed out
+# as-is, so repeated lookups allocate nothing.
+_CHORD_INTERVALS = {
+    "major": ("P1", "M3", "P5"),
+    "minor": ("P1", "m3", "P5"),
+    "diminished": ("P1", "m3", "d5"),
+    "augmented": ("P1", "M3", "A5"),
+    "dominant-seventh": ("P1", "M3", "P5", "m7"),
+    "major-seventh": ("P1", "M3", "P5", "M7"),
+    "minor-seventh": ("P1", "m3", "P5", "m7"),
+    "half-diminished-seventh": ("P1", "m3", "d5", "m7"),
+    "diminished-seventh": ("P1", "m3", "d5", "d7"),
+}
+_UNKNOWN_CHORD_INTERVALS = ("P1",)
+
+# Spelling tables for naming the interval between two TONICS entries without
+# building music21 objects. Semitones above C for each natural letter double
+# as the size of the major/perfect interval spanning that many letter steps.
+_LETTERS = "CDEFGAB"
+_NATURAL_SEMITONES = (0, 2, 4, 5, 7, 9, 11)
+_ACCIDENTAL_SEMITONES = {"": 0, "#": 1, "b": -1}
+_PERFECT_STEPS = frozenset((0, 3, 4))  # unison, fourth, fifth
+_PERFECT_QUALITIES = {0: "P", 1: "A", -1: "d", 2: "AA", -2: "dd"}
+_MAJOR_QUALITIES = {0: "M", -1: "m", 1: "A", -2: "d", 2: "AA", -3: "dd"}
+
+
+def _tonic_pitch_class(note_name: str) -> int:
+    """Get the pitch class of a letter plus optional # or b from the tables."""
+    semitones = _NATURAL_SEMITONES[_LETTERS.index(note_name[0])]
+    return (semitones + _ACCIDENTAL_SEMITONES[note_name[1:]]) % 12
+
+
+# Pitch class -> first TONICS name with that pitch class (the simplest
+# spelling). Iterating in reverse lets earlier names overwrite later ones.
+_CHROMA_TO_TONIC = {_tonic_pitch_class(tonic): tonic for tonic in reversed(TONICS)}
+
+
+def _interval_semitones(name: str) -> int:
+    """Get the size in semitones of a simple interval name such as "m7"."""
+    quality, steps = name[:-1], int(name[-1]) - 1
+    qualities = _PERFECT_QUALITIES if steps in _PERFECT_STEPS else _MAJOR_QUALITIES
+    deviation = next(dev for dev, q in qualities.items() if q == quality)
+    return _NATURAL_SEMITONES[steps] + deviation
+
+
+def _pitch_class_mask(semitones) -> int:
+    """Pack semitone offsets above a root into a 12-bit pitch-class set.
+
+    Bit i is set when the note i semitones above the root is a member.
+    """
+    mask = 0
+    for semitone in semitones:
+        mask |= 1 << semitone % 12
+    return mask
+
+
+# Chord and scale types as pitch-class sets above their root. Every member
+# lies within an octave of the root, so listing the set bits in order yields
+# the notes in ascending order.
+_CHORD_MASKS = {
+    chord_type: _pitch_class_mask(map(_interval_semitones, intervals))
+    for chord_type, intervals in _CHORD_INTERVALS.items()
+}
+_SCALE_MASKS = {
+    "major": _pitch_class_mask((0, 2, 4, 5, 7, 9, 11)),
+    "minor": _pitch_class_mask((0, 2, 3, 5, 7, 8, 10)),
+    "harmonicMinor": _pitch_class_mask((0, 2, 3, 5, 7, 8, 11)),
+    "melodicMinor": _pitch_class_mask((0, 2, 3, 5, 7, 9, 11)),  # ascending form
+    "dorian": _pitch_class_mask((0, 2, 3, 5, 7, 9, 10)),
+    "phrygian": _pitch_class_mask((0, 1, 3, 5, 7, 8, 10)),
+    "lydian": _pitch_class_mask((0, 2, 4, 6, 7, 9, 11)),
+    "mixolydian": _pitch_class_mask((0, 2, 4, 5, 7, 9, 10)),
+    "locrian": _pitch_class_mask((0, 1, 3, 5, 6, 8, 10)),
+}
+
+
+def _mask_notes(tonic: str, mask: int) -> Tuple[str, ...]:
+    """Name the members of a pitch-class set transposed onto a tonic.
+
+    Args:
+        tonic: The root note.
+        mask: Pitch-class set relative to the root (see _pitch_class_mask).
+
+    Returns:
+        TONICS names of the members, ascending from the root.
+    """
+    root = get_note_chroma(tonic)
+    return tuple(
+        _CHROMA_TO_TONIC[(root + semitone) % 12]
+        for semitone in range(12)
+        if mask >> semitone & 1
+    )
+
+
+@lru_cache(maxsize=None)
+def _m21() -> SimpleNamespace:
+    """Import the music21 modules used here on first use.
+
+    music21 takes the better part of a second to import, and chord and scale
+    notes are computed without it, so only arbitrary note spellings pay for it.
+
+    Returns:
+        Namespace with the pitch module.
+    """
+    from music21 import pitch
+
+    return SimpleNamespace(pitch=pitch)
+
+
+@lru_cache(maxsize=256)
 def get_note_chroma(note_name: str) -> int:
     """Get the pitch class (chroma) of a note.
 
@@ -80,7 +202,11 @@ def get_note_chroma(note_name: str) -> int:
     Returns:
         Integer representing the pitch class (0-11).
     """
-    return pitch.Pitch(note_name).pitchClass
+    try:
+        return _tonic_pitch_class(note_name)
+    except (ValueError, KeyError, IndexError):
+        # Spellings outside the tables, such as double sharps, need music21
+        return _m21().pitch.Pitch(note_name).pitchClass
 
 
 def get_scale_notes(tonic: str, scale_type: str) -> List[str]:
@@ -96,30 +222,21 @@ def get_scale_notes(tonic: str, scale_type: str) -> List[str]:
     Raises:
         ValueError: If the scale type is not supported.
     """
-    if scale_type == "major":
-        sc = scale.MajorScale(tonic)
-    elif scale_type == "minor":
-        sc = scale.MinorScale(tonic)
-    elif scale_type == "harmonicMinor":
-        sc = scale.HarmonicMinorScale(tonic)
-    elif scale_type == "melodicMinor":
-        sc = scale.MelodicMinorScale(tonic)
-    elif scale_type == "dorian":
-        sc = scale.DorianScale(tonic)
-    elif scale_type == "phrygian":
-        sc = scale.PhrygianScale(tonic)
-    elif scale_type == "lydian":
-        sc = scale.LydianScale(tonic)
-    elif scale_type == "mixolydian":
-        sc = scale.MixolydianScale(tonic)
-    elif scale_type == "locrian":
-        sc = scale.LocrianScale(tonic)
-    else:
+    if scale_type not in _SCALE_MASKS:
         raise ValueError(f"Unsupported scale type: {scale_type}")
+    # Callers get their own list; the cached tuple is never handed out
+    return list(_scale_notes(tonic, scale_type))
+
 
-    return [normalize_note_name(p.name) for p in sc.getPitches()]
+@lru_cache(maxsize=512)
+def _scale_notes(tonic: str, scale_type: str) -> Tuple[str, ...]:
+    """Build the normalized notes of a supported scale once per tonic and type."""
+    notes = _mask_notes(tonic, _SCALE_MASKS[scale_type])
+    # Scales are listed up to the tonic an octave above
+    return notes + notes[:1]
 
 
+@lru_cache(maxsize=256)
 def normalize_note_name(note_name: str) -> str:
     """Convert complex note names to simpler enharmonic equivalents.
 
@@ -129,16 +246,9 @@ def normalize_note_name(note_name: str) -> str:
     Returns:
         Simplified note name from the TONICS list.
     """
-    # Use music21's pitch object to normalize the note name
-    p = pitch.Pitch(note_name)
-    # Get the pitch class number (0-11)
-    pc = p.pitchClass
-    # Find the simplest note name for this pitch class from our TONICS list
-    for note in TONICS:
-        if pitch.Pitch(note).pitchClass == pc:
-            return note
-    # If no match found (shouldn't happen), return original
-    return note_name
+    # Only a few dozen spellings ever occur, so after the first call per
+    # spelling this is a cache hit
+    return _CHROMA_TO_TONIC.get(get_note_chroma(note_name), note_name)
 
 
 def get_chord_notes(tonic: str, chord_type: str) -> List[str]:
@@ -154,117 +264,27 @@ def get_chord_notes(tonic: str, chord_type: str) -> List[str]:
     Raises:
         ValueError: If the chord type is not supported.
     """
-    if chord_type == "major":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("M3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("P5").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "minor":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("m3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("P5").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "diminished":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("m3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("d5").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "augmented":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("M3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("A5").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "dominant-seventh":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("M3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("P5").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("m7").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "major-seventh":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("M3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("P5").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("M7").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "minor-seventh":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("m3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("P5").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("m7").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "half-diminished-seventh":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("m3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("d5").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("m7").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    elif chord_type == "diminished-seventh":
-        ch = chord.Chord(
-            [
-                tonic,
-                interval.Interval("m3").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("d5").transposePitch(pitch.Pitch(tonic)),
-                interval.Interval("d7").transposePitch(pitch.Pitch(tonic)),
-            ]
-        )
-    else:
+    if chord_type not in _CHORD_TYPE_SET:
         raise ValueError(f"Unsupported chord type: {chord_type}")
+    return list(_chord_notes(tonic, chord_type))
 
-    return [normalize_note_name(p.name) for p in ch.pitches]
 
+@lru_cache(maxsize=512)
+def _chord_notes(tonic: str, chord_type: str) -> Tuple[str, ...]:
+    """Build the normalized notes of a supported chord once per tonic and type."""
+    return _mask_notes(tonic, _CHORD_MASKS[chord_type])
 
-def get_chord_intervals(chord_type: str) -> List[str]:
+
+def get_chord_intervals(chord_type: str) -> Tuple[str, ...]:
     """Get the intervals in a chord type.
 
     Args:
         chord_type: The type of chord (e.g. 'major', 'minor').
 
     Returns:
-        List of interval names in the chord.
+        Tuple of interval names in the chord, shared between calls.
     """
-    if chord_type == "major":
-        return ["P1", "M3", "P5"]
-    elif chord_type == "minor":
-        return ["P1", "m3", "P5"]
-    elif chord_type == "diminished":
-        return ["P1", "m3", "d5"]
-    elif chord_type == "augmented":
-        return ["P1", "M3", "A5"]
-    elif chord_type == "dominant-seventh":
-        return ["P1", "M3", "P5", "m7"]
-    elif chord_type == "major-seventh":
-        return ["P1", "M3", "P5", "M7"]
-    elif chord_type == "minor-seventh":
-        return ["P1", "m3", "P5", "m7"]
-    elif chord_type == "half-diminished-seventh":
-        return ["P1", "m3", "d5", "m7"]
-    elif chord_type == "diminished-seventh":
-        return ["P1", "m3", "d5", "d7"]
-    return ["P1"]  # Default for unknown chord types
+    return _CHORD_INTERVALS.get(chord_type, _UNKNOWN_CHORD_INTERVALS)
 
 
 def clear_database() -> None:
@@ -274,114 +294,232 @@ def clear_database() -> None:
 
 
 def init_indexes() -> None:
-    """Create indexes for all node labels."""
-    indexes = ["Interval", "Tone", "Scale", "Chord", "ChordInstance", "ScaleInstance"]
-    for label in indexes:
+    """Create a uniqueness constraint, and with it an index, on each label's name."""
+    for node_class in (Interval, Tone, Scale, Chord, ChordInstance, ScaleInstance):
+        label = node_class.__label__
+        # Named the way neomodel names the constraints it installs for
+        # unique_index properties, so either one satisfies IF NOT EXISTS
         try:
-            db.cypher_query(f"CREATE INDEX ON :{label}(name)")
-        except Exception:  # Replace bare except with Exception
-            # Index might already exist
-            pass
+            db.cypher_query(
+                f"CREATE CONSTRAINT constraint_unique_{label}_name IF NOT EXISTS "
+                f"FOR (n:{label}) REQUIRE n.name IS UNIQUE"
+            )
+        except ClientError as e:
+            # A plain index left on name by an older setup blocks the
+            # constraint but still serves lookups; anything else is a real
+            # failure and propagates
+            if e.code not in _SCHEMA_ALREADY_EXISTS_CODES:
+                raise
+            logger.warning(f"Kept existing index on :{label}(name): {e.message}")
     logger.info("Indexes created successfully")
 
 
+def _create_named_nodes(node_class: Type[StructuredNode], names: List[str]) -> None:
+    """Create one node per name in a single query instead of one save() each.
+
+    Args:
+        node_class: Model whose label the nodes get.
+        names: Values for each node's ``name`` property.
+    """
+    db.cypher_query(
+        f"UNWIND $names AS name CREATE (:{node_class.__label__} {{name: name}})",
+        {"names": names},
+    )
+
+
 def init_intervals() -> None:
     """Initialize musical intervals in the database."""
-    for interval_name in INTERVALS:
-        Interval(name=interval_name).save()
+    _create_named_nodes(Interval, INTERVALS)
     logger.info("Intervals initialized")
 
 
 def init_notes() -> None:
     """Initialize musical notes/tones in the database."""
-    for note_name in TONICS:
-        Tone(
-            name=note_name,
-            chroma=get_note_chroma(note_name),
-            alternative_name=get_alternative_name(note_name),
-        ).save()
+    rows = [
+        {
+            "name": note_name,
+            "chroma": get_note_chroma(note_name),
+            "alternative_name": get_alternative_name(note_name),
+        }
+        for note_name in TONICS
+    ]
+    db.cypher_query(
+        "UNWIND $rows AS row "
+        f"CREATE (:{Tone.__label__} {{name: row.name, chroma: row.chroma, "
+        "alternative_name: row.alternative_name})",
+        {"rows": rows},
+    )
     logger.info("Notes initialized")
 
 
 def init_scales() -> None:
     """Initialize scale types in the database."""
-    for scale_name in SCALE_TYPES:
-        Scale(name=scale_name).save()
+    _create_named_nodes(Scale, SCALE_TYPES)
     logger.info("Scales initialized")
 
 
 def init_chords() -> None:
     """Initialize chord types in the database."""
-    for chord_name in CHORD_TYPES:
-        Chord(name=chord_name).save()
+    _create_named_nodes(Chord, CHORD_TYPES)
     logger.info("Chords initialized")
 
 
+def init_type_nodes() -> None:
+    """Initialize intervals, scales and chord types in one round trip.
+
+    The three batches are independent, so each runs as a unit subquery of a
+    single statement instead of paying a network round trip apiece.
+    """
+    batches = ((Interval, INTERVALS), (Scale, SCALE_TYPES), (Chord, CHORD_TYPES))
+    db.cypher_query(
+        " ".join(
+            f"CALL {{ UNWIND $names{i} AS name "
+            f"CREATE (:{node_class.__label__} {{name: name}}) }}"
+            for i, (node_class, _) in enumerate(batches)
+        ),
+        {f"names{i}": names for i, (_, names) in enumerate(batches)},
+    )
+    logger.info("Intervals, scales and chords initialized")
+
+
 def connect_chord_intervals(chord_intervals: Dict[str, List[str]]) -> None:
     """Connect chords to their intervals in the database."""
-    for chord_name, intervals in chord_intervals.items():
-        chord_obj = Chord.nodes.get(name=chord_name)
-        for interval_name in intervals:
-            interval_node = Interval.nodes.get(name=interval_name)
-            chord_obj.contains.connect(interval_node)
+    # The nodes are matched inside one query rather than fetched with a
+    # lookup per chord and per interval before each connect()
+    rows = [
+        {"chord": chord_name, "interval": interval_name}
+        for chord_name, intervals in chord_intervals.items()
+        for interval_name in intervals
+    ]
+    db.cypher_query(
+        "UNWIND $rows AS row "
+        f"MATCH (chord:{Chord.__label__} {{name: row.chord}}), "
+        f"(interval:{Interval.__label__} {{name: row.interval}}) "
+        "MERGE (chord)-[:CONTAINS]->(interval)",
+        {"rows": rows},
+    )
     logger.info("Chord intervals connected")
 
 
+def _interval_name(start: str, end: str) -> str:
+    """Name the interval between two note names in the same octave.
+
+    Matches ``interval.Interval(noteStart=Pitch(start), noteEnd=Pitch(end))
+    .name`` for TONICS spellings: the generic size comes from the letter
+    distance and the quality from the semitone distance, so enharmonic
+    spellings stay distinct (A to A# is A1, A to Bb is m2).
+
+    Args:
+        start: Name of the first note (letter plus optional # or b).
+        end: Name of the second note.
+
+    Returns:
+        Interval name such as "M3" or "d5".
+    """
+    start_letter = _LETTERS.index(start[0])
+    end_letter = _LETTERS.index(end[0])
+    steps = end_letter - start_letter
+    semitones = (
+        _NATURAL_SEMITONES[end_letter]
+        + _ACCIDENTAL_SEMITONES[end[1:]]
+        - _NATURAL_SEMITONES[start_letter]
+        - _ACCIDENTAL_SEMITONES[start[1:]]
+    )
+    # A descending interval has the same name as the ascending one between
+    # the same notes; only unisons keep their direction (a lowered one is d1)
+    if steps < 0:
+        steps, semitones = -steps, -semitones
+
+    deviation = semitones - _NATURAL_SEMITONES[steps]
+    if steps in _PERFECT_STEPS:
+        quality = _PERFECT_QUALITIES[deviation]
+    else:
+        quality = _MAJOR_QUALITIES[deviation]
+    return f"{quality}{steps + 1}"
+
+
+# "start|end" -> interval name for every ordered pair of TONICS spellings.
+# Keyed by spelling rather than pitch class, since enharmonic spellings name
+# different intervals; there are only 17 x 17 pairs, so they are named once.
+_NOTE_DISTANCES = {
+    f"{start}|{end}": _interval_name(start, end) for start in TONICS for end in TONICS
+}
+
+
 def generate_note_distances() -> None:
     """Create interval relationships between all notes in the database."""
-    notes = Tone.nodes.all()
-    for note1 in notes:
-        for note2 in notes:
-            # Create interval between notes
-            i = interval.Interval(
-                noteStart=pitch.Pitch(note1.name), noteEnd=pitch.Pitch(note2.name)
-            )
-            note1.intervals.connect(note2, {"distance": i.name})
+    # Neo4j pairs the tones itself and looks each pair's name up in the
+    # precomputed table, so the write is one statement with no per-pair rows
+    db.cypher_query(
+        f"MATCH (source:{Tone.__label__}), (target:{Tone.__label__}) "
+        "WITH source, target, "
+        "$distances[source.name + '|' + target.name] AS distance "
+        "WHERE distance IS NOT NULL "
+        "MERGE (source)-[:INTERVAL {distance: distance}]->(target)",
+        {"distances": _NOTE_DISTANCES},
+    )
     logger.info("Note distances generated")
 
 
 def init_chord_instances() -> None:
     """Initialize chord instances for each tonic and chord type."""
-    for tonic in TONICS:
-        for chord_type in CHORD_TYPES:
-            chord_name = f"{tonic}-{chord_type}"
-            chord_instance = ChordInstance(name=chord_name).save()
-            chord_obj = Chord.nodes.get(name=chord_type)
-            chord_instance.instance_of.connect(chord_obj)
-
-            # Connect tonic
-            tonic_obj = Tone.nodes.get(name=tonic)
-            chord_instance.has_tonic.connect(tonic_obj)
-
-            # Get and connect notes
-            chord_notes = get_chord_notes(tonic, chord_type)
-            for note_name in chord_notes:
-                note_obj = Tone.nodes.get(name=note_name)
-                note_obj.in_chords.connect(
-                    chord_instance,
-                    {
-                        "function": get_chord_intervals(chord_type)[
-                            chord_notes.index(note_name)
-                        ]
-                    },
+    # Every instance, its chord type, tonic and notes go out as rows of one
+    # query instead of a save() per instance and a connect() per relationship;
+    # the i-th chord note plays the i-th interval
+    rows = [
+        {
+            "name": f"{tonic}-{chord_type}",
+            "tonic": tonic,
+            "type": chord_type,
+            "members": [
+                {"note": note_name, "function": function}
+                for note_name, function in zip(
+                    get_chord_notes(tonic, chord_type),
+                    get_chord_intervals(chord_type),
                 )
+            ],
+        }
+        for tonic in TONICS
+        for chord_type in CHORD_TYPES
+    ]
+    db.cypher_query(
+        "UNWIND $rows AS row "
+        f"MATCH (chord:{Chord.__label__} {{name: row.type}}), "
+        f"(tonic:{Tone.__label__} {{name: row.tonic}}) "
+        f"CREATE (instance:{ChordInstance.__label__} {{name: row.name}})"
+        "-[:INSTANCE_OF]->(chord) "
+        "CREATE (instance)-[:HAS_TONIC]->(tonic) "
+        "WITH instance, row UNWIND row.members AS member "
+        f"MATCH (note:{Tone.__label__} {{name: member.note}}) "
+        "MERGE (note)-[:IN {function: member.function}]->(instance)",
+        {"rows": rows},
+    )
     logger.info("Chord instances initialized")
 
 
 def init_scale_instances() -> None:
     """Initialize scale instances for each tonic and scale type."""
-    for tonic in TONICS:
-        for scale_type in SCALE_TYPES:
-            scale_name = f"{tonic}-{scale_type}"
-            scale_instance = ScaleInstance(name=scale_name).save()
-            scale_obj = Scale.nodes.get(name=scale_type)
-            scale_instance.instance_of.connect(scale_obj)
-
-            # Get and connect notes
-            scale_notes = get_scale_notes(tonic, scale_type)
-            for note_name in scale_notes:
-                note_obj = Tone.nodes.get(name=note_name)
-                note_obj.in_scales.connect(scale_instance)
+    # Scales list the tonic again at the octave; dict.fromkeys drops the
+    # repeat while keeping the order
+    rows = [
+        {
+            "name": f"{tonic}-{scale_type}",
+            "type": scale_type,
+            "notes": list(dict.fromkeys(get_scale_notes(tonic, scale_type))),
+        }
+        for tonic in TONICS
+        for scale_type in SCALE_TYPES
+    ]
+    db.cypher_query(
+        "UNWIND $rows AS row "
+        f"MATCH (scale:{Scale.__label__} {{name: row.type}}) "
+        f"CREATE (instance:{ScaleInstance.__label__} {{name: row.name}})"
+        "-[:INSTANCE_OF]->(scale) "
+        "WITH instance, row UNWIND row.notes AS note_name "
+        f"MATCH (note:{Tone.__label__} {{name: note_name}}) "
+        "MERGE (note)-[:IN]->(instance)",
+        {"rows": rows},
+    )
     logger.info("Scale instances initialized")
 
 
@@ -402,13 +540,18 @@ def initialize_music_database(
     # Configure database connection
     config.DATABASE_URL = f"bolt://{username}:{password}@{uri.split('://')[-1]}"
 
+    # Clear before creating the uniqueness constraints, which would fail to
+    # validate against duplicate names left by an older, index-only setup
     if clear:
-        clear_database()
+        with db.transaction:
+            clear_database()
 
+    # Neo4j cannot mix schema changes and data writes in one transaction, so
+    # the indexes go first. The data writes then commit together, in a
+    # transaction that holds only the MERGE/CREATE work and never the clear
     init_indexes()
-    init_intervals()
-    init_scales()
-    init_chords()
+    with db.transaction:
+        init_type_nodes()
 
     logger.info("Music database initialized successfully")
 
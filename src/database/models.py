@@ -1,5 +1,7 @@
 """Database models for storing musical data using Neo4j and neomodel."""
 
+from types import MappingProxyType
+
 from neomodel import (
     FloatProperty,
     IntegerProperty,
@@ -105,8 +107,9 @@ class ScaleInstance(StructuredNode):
     notes = RelationshipFrom("Tone", "IN")
 
 
-# Constants for music theory
-TONICS = [
+# Constants for music theory. They are shared module-wide, so they are
+# immutable: a tuple of spellings and a read-only view of the name mapping.
+TONICS = (
     "A",
     "A#",
     "Bb",
@@ -124,20 +127,22 @@ TONICS = [
     "G",
     "G#",
     "Ab",
-]
-
-TWO_WAY_ALTERNATIVE_NAMES = {
-    "C#": "Db",
-    "Db": "C#",
-    "D#": "Eb",
-    "Eb": "D#",
-    "F#": "Gb",
-    "Gb": "F#",
-    "G#": "Ab",
-    "Ab": "G#",
-    "A#": "Bb",
-    "Bb": "A#",
-}
+)
+
+TWO_WAY_ALTERNATIVE_NAMES = MappingProxyType(
+    {
+        "C#": "Db",
+        "Db": "C#",
+        "D#": "Eb",
+        "Eb": "D#",
+        "F#": "Gb",
+        "Gb": "F#",
+        "G#": "Ab",
+        "Ab": "G#",
+        "A#": "Bb",
+        "Bb": "A#",
+    }
+)
 
 
 def get_alternative_name(note: str) -> str:
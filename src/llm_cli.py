@@ -8,8 +8,9 @@ allowing users to generate and control music through natural language.
 
 import asyncio
 import os
+import re
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -22,7 +23,11 @@ if __name__ == "__main__":
     src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, src_dir)
 
-from .config import get_default_bpm, get_openai_api_key
+from .config import (
+    get_default_bpm,
+    get_openai_api_key,
+    get_scheduling_lookahead_beats,
+)
 from .llm_composer import LLMComposer
 from .llm_composer.midi_tools import MIDIToolHandler, MIDIToolResult
 from .logging_config import get_logger, setup_logging
@@ -34,6 +39,55 @@ from .midi_generator.transport import PreciseTransport
 console = Console()
 logger = get_logger(__name__)
 
+# Prompts that unambiguously ask for something the CLI can do without the LLM,
+# mapped to the equivalent CLI command. Patterns match the whole prompt, so
+# anything more involved ("stop all music and start over") still goes to the LLM.
+DIRECT_INTENTS = (
+    (
+        re.compile(
+            r"(?:please\s+)?stop(?:\s+(?:all|everything|the))?(?:\s+(?:music|playback))?"
+            r"(?:\s+please)?[.!]*",
+            re.IGNORECASE,
+        ),
+        "stop",
+    ),
+    (
+        re.compile(
+            r"(?:list|show)(?:\s+(?:all|the|my))?\s+instruments[.?]*", re.IGNORECASE
+        ),
+        "instruments",
+    ),
+    (
+        re.compile(
+            r"(?:list|show)(?:\s+(?:all|the|my))?\s+sequences[.?]*", re.IGNORECASE
+        ),
+        "sequences",
+    ),
+    (
+        re.compile(
+            r"(?:what(?:'s|\s+is)\s+the\s+(?:bpm|tempo|status)|(?:show\s+)?status)[.?]*",
+            re.IGNORECASE,
+        ),
+        "status",
+    ),
+)
+
+
+def match_direct_intent(prompt: str) -> Optional[str]:
+    """Return the CLI command a prompt unambiguously asks for, if any.
+
+    Args:
+        prompt: User's natural language prompt
+
+    Returns:
+        Command name without the leading slash, or None if the LLM is needed
+    """
+    prompt = prompt.strip()
+    for pattern, command in DIRECT_INTENTS:
+        if pattern.fullmatch(prompt):
+            return command
+    return None
+
 
 class LLMCLISession:
     """Manages an LLM CLI session with state awareness."""
@@ -46,6 +100,10 @@ class LLMCLISession:
         self.instrument_manager = None
         self.llm_composer = None
         self.running = False
+        # Prompts seen and prompts answered without the LLM, for tuning
+        # DIRECT_INTENTS against real traffic
+        self.prompt_count = 0
+        self.direct_intent_count = 0
 
     def initialize_midi_system(self) -> bool:
         """Initialize the MIDI system.
@@ -56,7 +114,11 @@ class LLMCLISession:
         try:
             self.controller = MIDIController()
             self.transport = PreciseTransport(initial_bpm=get_default_bpm())
-            self.sequencer = MIDISequencer(self.controller, self.transport)
+            self.sequencer = MIDISequencer(
+                self.controller,
+                self.transport,
+                lookahead_beats=get_scheduling_lookahead_beats(),
+            )
 
             # Create adapters and instrument manager
             note_player = MIDIControllerAdapter(self.controller)
@@ -100,49 +162,58 @@ class LLMCLISession:
             logger.error(f"LLM composer initialization failed: {e}")
             return False
 
-    def get_system_status(self) -> str:
-        """Get current system status for LLM context.
-
-        Returns:
-            String describing current system state
-        """
-        status_parts = []
+    def _status_items(self) -> List[Tuple[str, str]]:
+        """Collect the current system state as (glyph, description) pairs."""
+        items = []
 
         # MIDI connection status
         if self.controller and self.controller.port:
-            status_parts.append("✓ MIDI output connected")
+            items.append(("✓", "MIDI output connected"))
         else:
-            status_parts.append("✗ No MIDI output connected")
+            items.append(("✗", "No MIDI output connected"))
 
         # Transport status
         if self.transport:
-            status_parts.append(f"♪ BPM: {self.transport.bpm}")
+            items.append(("♪", f"BPM: {self.transport.bpm}"))
             if hasattr(self.transport, "is_running") and self.transport.is_running:
-                status_parts.append("▶ Transport running")
+                items.append(("▶", "Transport running"))
             else:
-                status_parts.append("⏸ Transport stopped")
+                items.append(("⏸", "Transport stopped"))
 
         # Active instruments
         if self.instrument_manager:
             instruments = list(self.instrument_manager.instruments.keys())
             if instruments:
-                status_parts.append(f"🎹 Instruments: {', '.join(instruments)}")
+                items.append(("🎹", f"Instruments: {', '.join(instruments)}"))
             else:
-                status_parts.append("🎹 No instruments created")
+                items.append(("🎹", "No instruments created"))
 
         # Active sequences
         if self.sequencer:
             active_count = len(self.sequencer.active_sequences)
             if active_count > 0:
-                status_parts.append(f"🎵 {active_count} active sequences")
+                items.append(("🎵", f"{active_count} active sequences"))
             else:
-                status_parts.append("🎵 No active sequences")
+                items.append(("🎵", "No active sequences"))
+
+        return items
+
+    def get_system_status(self) -> str:
+        """Get current system status for LLM context.
+
+        The decorative glyphs shown by ``display_status`` are left out: they
+        cost several tokens each and carry nothing the model can use.
 
-        return " | ".join(status_parts)
+        Returns:
+            String describing current system state
+        """
+        return "; ".join(description for _, description in self._status_items())
 
     def display_status(self):
         """Display current system status."""
-        status = self.get_system_status()
+        status = " | ".join(
+            f"{glyph} {description}" for glyph, description in self._status_items()
+        )
         panel = Panel(
             status, title="[bold blue]System Status[/bold blue]", border_style="blue"
         )
@@ -159,17 +230,26 @@ class LLMCLISession:
             return
 
         for i, result in enumerate(results, 1):
-            if result.success:
-                console.print(f"[green]✓ Command {i}: {result.message}[/green]")
-            else:
-                console.print(f"[red]✗ Command {i}: {result.message}[/red]")
+            self.display_result(i, result)
+
+    def display_result(self, index: int, result: MIDIToolResult):
+        """Display a single LLM execution result.
+
+        Args:
+            index: 1-based position of the command in the response
+            result: MIDI tool result to display
+        """
+        if result.success:
+            console.print(f"[green]✓ Command {index}: {result.message}[/green]")
+        else:
+            console.print(f"[red]✗ Command {index}: {result.message}[/red]")
 
-            if result.data:
-                # Display additional data if present
-                table = Table(show_header=False, box=None, padding=(0, 1))
-                for key, value in result.data.items():
-                    table.add_row(f"[dim]{key}:[/dim]", str(value))
-                console.print(table)
+        if result.data:
+            # Display additional data if present
+            table = Table(show_header=False, box=None, padding=(0, 1))
+            for key, value in result.data.items():
+                table.add_row(f"[dim]{key}:[/dim]", str(value))
+            console.print(table)
 
     async def process_prompt(self, prompt: str) -> bool:
         """Process a user prompt with the LLM.
@@ -184,16 +264,42 @@ class LLMCLISession:
             console.print("[red]LLM composer not initialized[/red]")
             return True
 
+        self.prompt_count += 1
+        direct_command = match_direct_intent(prompt)
+        if direct_command:
+            self.direct_intent_count += 1
+            logger.info(
+                f"Prompt '{prompt}' handled directly as /{direct_command} "
+                f"({self.direct_intent_count}/{self.prompt_count} prompts)"
+            )
+            self._run_direct_intent(prompt, direct_command)
+            return True
+
         try:
-            # Add system context to the prompt
-            context = f"Current system status: {self.get_system_status()}\n\nUser request: {prompt}"
-            logger.info(f"Processing LLM prompt with context: {context}")
-            # Show thinking indicator
+            # System status travels separately from the request so the prompt
+            # prefix sent to the LLM stays cacheable
+            status = self.get_system_status()
+            logger.info(f"Processing LLM prompt '{prompt}' with status: {status}")
+            displayed = 0
+
+            def display_streamed(result: MIDIToolResult):
+                nonlocal displayed
+                displayed += 1
+                self.display_result(displayed, result)
+
+            # Show thinking indicator; command results print above it as they
+            # execute while the response is still streaming
             with console.status("[bold green]🎵 Composing..."):
-                results = await self.llm_composer.generate_and_execute(context)
+                results = await self.llm_composer.generate_and_execute(
+                    prompt, status, on_result=display_streamed
+                )
 
-            # Display results
-            self.display_results(results)
+            # Display results that were not streamed, such as request failures
+            if results:
+                for i, result in enumerate(results[displayed:], displayed + 1):
+                    self.display_result(i, result)
+            else:
+                self.display_results(results)
 
             return True
 
@@ -202,6 +308,23 @@ class LLMCLISession:
             logger.error(f"Error processing prompt '{prompt}': {e}")
             return True
 
+    def _run_direct_intent(self, prompt: str, command: str):
+        """Carry out a prompt matched by DIRECT_INTENTS.
+
+        Stopping goes through the composer so its memory records the stop as
+        it would for an LLM answer; the read-only intents use the CLI views.
+
+        Args:
+            prompt: User's natural language prompt
+            command: CLI command the prompt maps to
+        """
+        if command == "stop":
+            self.display_results(
+                self.llm_composer.execute_commands(prompt, [{"type": "stop_all"}])
+            )
+        else:
+            self._process_command(command)
+
     def handle_command(self, user_input: str) -> bool:
         """Handle special CLI commands.
 
@@ -0,0 +1,77 @@
+"""In-process cache of LLM responses for repeated prompts."""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize a prompt so trivially different phrasings compare equal.
+
+    Args:
+        text: Raw user prompt
+
+    Returns:
+        Lowercased prompt with whitespace runs collapsed to single spaces
+    """
+    return " ".join(text.lower().split())
+
+
+class ResponseCache:
+    """Least-recently-used cache of LLM responses.
+
+    Entries are keyed by the normalized prompt sent to the model, including any
+    memory context it was augmented with, together with the system status it
+    was answered in. A response is therefore only replayed for the same
+    request, with the same history, made against the same instruments and
+    transport state.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[CacheKey, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(prompt: str, status: str) -> CacheKey:
+        """Build the cache key for a prompt and system status."""
+        return normalize_prompt(prompt), status
+
+    def get(self, key: CacheKey) -> Optional[dict]:
+        """Return the cached response for a key, or None on a miss."""
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.debug(f"Response cache hit for '{key[0][:50]}'")
+        return response
+
+    def put(self, key: CacheKey, response: dict) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
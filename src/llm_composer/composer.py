@@ -1,31 +1,56 @@
 """Main composer module that interfaces with LLMs to generate MIDI commands."""
 
+import asyncio
 import json
-from typing import List, Optional
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
 
 from langchain.callbacks.base import BaseCallbackHandler
-from langchain.chains import LLMChain
 from langchain.prompts import ChatPromptTemplate
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_openai import ChatOpenAI
-from pydantic import ValidationError
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from pydantic import Field, TypeAdapter, ValidationError
 
 from ..config import get_config
 from ..logging_config import get_logger
+from .cache import CacheKey, ResponseCache
 from .context import ContextBuilder, PromptAugmenter
 from .memory import ComposerMemory, ConversationTurn
 from .midi_tools import MIDIToolHandler, MIDIToolResult
-from .models import (
-    CreateInstrumentCommand,
-    MIDICommand,
-    PlayNoteCommand,
-    PlaySequenceCommand,
-    RemoveInstrumentCommand,
-    StopAllCommand,
-    StopSequenceCommand,
-)
+from .models import MIDICommand, MIDICommandBatch
 
 logger = get_logger(__name__)
 
+ResultCallback = Callable[[MIDIToolResult], None]
+
+# Upper bound on LLM requests in flight for generate_and_execute_many
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Typical characters per token of English text for OpenAI tokenizers
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in text without loading a tokenizer.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate token count, rounded up
+    """
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+# Compiled once; the "type" discriminator sends each command straight to its
+# model instead of trying every member of the union
+_MIDI_COMMAND_ADAPTER = TypeAdapter(Annotated[MIDICommand, Field(discriminator="type")])
+
 
 def validate_midi_command(raw_cmd: dict) -> MIDICommand:
     """Validate and parse a raw command dictionary into a MIDICommand.
@@ -37,24 +62,9 @@ def validate_midi_command(raw_cmd: dict) -> MIDICommand:
         Validated MIDICommand instance
 
     Raises:
-        ValidationError: If command is invalid
+        ValidationError: If command is invalid or its type is unknown
     """
-    command_type = raw_cmd.get("type")
-
-    command_classes = {
-        "play_note": PlayNoteCommand,
-        "play_sequence": PlaySequenceCommand,
-        "create_instrument": CreateInstrumentCommand,
-        "remove_instrument": RemoveInstrumentCommand,
-        "stop_sequence": StopSequenceCommand,
-        "stop_all": StopAllCommand,
-    }
-
-    if command_type not in command_classes:
-        raise ValidationError(f"Unknown command type: {command_type}")
-
-    command_class = command_classes[command_type]
-    return command_class.model_validate(raw_cmd)
+    return _MIDI_COMMAND_ADAPTER.validate_python(raw_cmd)
 
 
 DEFAULT_SYSTEM_PROMPT = """You are a music composition assistant that generates MIDI commands. Your role is to translate natural language music requests into specific MIDI commands.
@@ -111,11 +121,10 @@ _sequence: Play a sequence of notes
      "type": "stop_all"
    }}
 
-Respond with valid JSON commands that match these schemas. You can send multiple commands in an array.
+Respond by calling the MIDICommandBatch function with the commands to execute, in order.
+Keep the arguments terse: omit optional fields that would use their default values.
 For musical notes, use MIDI note numbers (60 = middle C).
 
-IMPORTANT: Return only raw JSON - no markdown formatting, no code blocks, no additional text.
-
 Common musical patterns:
 - C major scale: [60, 62, 64, 65, 67, 69, 71, 72]
 - C minor scale: [60, 62, 63, 65, 67, 68, 70, 72]
@@ -123,6 +132,135 @@ Common musical patterns:
 - C minor chord: [60, 63, 67]
 """
 
+# Volatile per-request status is sent as its own message after the static
+# system prompt, so the prompt prefix stays byte-identical across requests and
+# is eligible for OpenAI's automatic prompt caching.
+STATUS_PROMPT_TEMPLATE = "Current system status: {status}"
+NO_STATUS = "unavailable"
+
+# Function the LLM is forced to call. The arguments are returned as plain dicts
+# so each command is validated on its own and one bad command does not discard
+# the rest of the response.
+COMMAND_TOOL = convert_to_openai_tool(MIDICommandBatch)
+
+# Transient API failures (rate limits, timeouts, 5xx) on which a request is
+# retried on the other configured model
+FALLBACK_EXCEPTIONS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Intents that resolve to a single simple command, which the fast model handles
+FAST_MODEL_INTENTS = frozenset({"stop_music", "change_tempo", "change_volume"})
+# Words and separators marking a multi-step request, kept on the main model
+_MULTI_STEP_PATTERN = re.compile(r"\b(?:and|then|after|while|also)\b|[,;]")
+
+
+def build_prompt(system_message: str, user_template: str) -> ChatPromptTemplate:
+    """Build the chat prompt with the static system message as its prefix.
+
+    Args:
+        system_message: Static system message
+        user_template: User message template
+
+    Returns:
+        Prompt template expecting ``status`` and the user template's variables
+    """
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", system_message),
+            ("system", STATUS_PROMPT_TEMPLATE),
+            ("user", user_template),
+        ]
+    )
+
+
+# The default template is immutable, so it is built once and shared by every
+# composer instance
+DEFAULT_PROMPT = build_prompt(DEFAULT_SYSTEM_PROMPT, "{input}")
+
+
+class PromptCacheLogger(BaseCallbackHandler):
+    """Log how many prompt tokens OpenAI served from its prompt cache."""
+
+    @staticmethod
+    def _usage_metadata(response: LLMResult) -> Optional[Dict[str, Any]]:
+        """Return the usage metadata of the first generated message, if any."""
+        if not response.generations or not response.generations[0]:
+            return None
+        message = getattr(response.generations[0][0], "message", None)
+        return getattr(message, "usage_metadata", None)
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Log the cached share of the prompt tokens for a finished request.
+
+        Streamed responses carry no ``llm_output``, so usage is read from the
+        message's ``usage_metadata`` and only falls back to the provider's
+        ``token_usage`` for responses that lack it.
+        """
+        usage = self._usage_metadata(response)
+        if usage is not None:
+            prompt_tokens = usage.get("input_tokens", 0)
+            details = usage.get("input_token_details") or {}
+            cached_tokens = details.get("cache_read", 0)
+        else:
+            token_usage = (response.llm_output or {}).get("token_usage") or {}
+            prompt_tokens = token_usage.get("prompt_tokens", 0)
+            details = token_usage.get("prompt_tokens_details") or {}
+            cached_tokens = details.get("cached_tokens", 0)
+        logger.debug(
+            f"Prompt cache: {cached_tokens}/{prompt_tokens} prompt tokens cached"
+        )
+
+
+@lru_cache(maxsize=8)
+def get_llm(
+    model_name: str,
+    temperature: float,
+    openai_api_key: Optional[str] = None,
+    openai_organization: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    timeout: Optional[int] = None,
+    callback_handler: Optional[BaseCallbackHandler] = None,
+) -> ChatOpenAI:
+    """Return a shared ChatOpenAI client for the given settings.
+
+    Composers created with the same settings reuse one client, and with it
+    one HTTP connection pool, instead of opening new connections each time.
+    Streamed responses request token usage so PromptCacheLogger can report it.
+
+    Args:
+        model_name: The name of the OpenAI model to use
+        temperature: The temperature for generation
+        openai_api_key: OpenAI API key (falls back to OPENAI_API_KEY)
+        openai_organization: OpenAI organization ID
+        max_tokens: Maximum number of tokens to generate
+        timeout: Request timeout in seconds
+        callback_handler: Optional callback handler for LangChain
+
+    Returns:
+        Configured ChatOpenAI client
+    """
+    callbacks = [PromptCacheLogger()]
+    if callback_handler:
+        callbacks.append(callback_handler)
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature,
+        openai_api_key=openai_api_key,
+        openai_organization=openai_organization,
+        max_tokens=max_tokens,
+        request_timeout=timeout,
+        stream_usage=True,
+        callbacks=callbacks,
+    )
+
+
+@dataclass
+class _CommandExecution:
+    """Commands executed so far for one request."""
+
+    results: List[MIDIToolResult] = field(default_factory=list)
+    executed_commands: List[MIDICommand] = field(default_factory=list)
+    validation_errors: int = 0
+
 
 class LLMComposer:
     """A class that uses LLMs to generate MIDI composition commands."""
@@ -134,6 +272,7 @@ class LLMComposer:
         temperature: Optional[float] = None,
         callback_handler: Optional[BaseCallbackHandler] = None,
         memory: Optional[ComposerMemory] = None,
+        fast_model_name: Optional[str] = None,
     ):
         """Initialize the LLM composer.
 
@@ -143,6 +282,8 @@ class LLMComposer:
             temperature: The temperature for generation (defaults to config)
             callback_handler: Optional callback handler for LangChain
             memory: Optional memory system (creates new one if None)
+            fast_model_name: Cheaper model for simple single-command prompts
+                (defaults to config; routing is disabled when unset)
         """
         logger.info("Initializing LLMComposer")
         config = get_config()
@@ -153,6 +294,9 @@ class LLMComposer:
         self.context_builder = ContextBuilder(self.memory)
         self.prompt_augmenter = PromptAugmenter(self.context_builder)
 
+        self.response_cache = ResponseCache(config.llm.response_cache_size)
+        self.max_prompt_tokens = config.llm.max_prompt_tokens
+
         logger.debug("Memory and context systems initialized")
 
         # Configure LLM
@@ -161,25 +305,86 @@ class LLMComposer:
 
         logger.info(f"Configuring LLM: model={model_to_use}, temperature={temp_to_use}")
 
-        self.llm = ChatOpenAI(
-            model_name=model_to_use,
-            temperature=temp_to_use,
-            openai_api_key=config.llm.openai_api_key,
-            openai_organization=config.llm.openai_organization_id,
-            max_tokens=config.llm.max_tokens,
-            request_timeout=config.llm.timeout,
-            callbacks=[callback_handler] if callback_handler else None,
-        )
+        def create_llm(name: str, temperature: float) -> ChatOpenAI:
+            return get_llm(
+                name,
+                temperature,
+                config.llm.openai_api_key,
+                config.llm.openai_organization_id,
+                config.llm.max_tokens,
+                config.llm.timeout,
+                callback_handler,
+            )
+
+        self.llm = create_llm(model_to_use, temp_to_use)
+
+        # Simple prompts are routed to a cheaper model at temperature 0
+        fast_model_to_use = fast_model_name or config.llm.fast_model_name
+        self.fast_llm = None
+        if fast_model_to_use and fast_model_to_use != model_to_use:
+            logger.info(f"Routing simple prompts to fast model {fast_model_to_use}")
+            self.fast_llm = create_llm(fast_model_to_use, 0)
 
         # Initialize default prompt template
-        self.prompt = ChatPromptTemplate.from_messages(
-            [("system", DEFAULT_SYSTEM_PROMPT), ("user", "{input}")]
-        )
+        self.prompt = DEFAULT_PROMPT
+        self._system_prompt_tokens = estimate_tokens(DEFAULT_SYSTEM_PROMPT)
 
-        self.chain = LLMChain(llm=self.llm, prompt=self.prompt)
+        self._build_chains()
 
         logger.info("LLMComposer initialization complete")
 
+    def _build_chain(
+        self, llm: ChatOpenAI, fallback_llm: Optional[ChatOpenAI] = None
+    ) -> Runnable:
+        """Chain the prompt into an LLM, forcing a MIDICommandBatch call.
+
+        Args:
+            llm: Model to send requests to
+            fallback_llm: Model to retry on after a transient API failure
+
+        Returns:
+            Runnable returning the MIDICommandBatch call arguments
+        """
+        model = llm.with_structured_output(COMMAND_TOOL, method="function_calling")
+        if fallback_llm is not None:
+            model = model.with_fallbacks(
+                [
+                    fallback_llm.with_structured_output(
+                        COMMAND_TOOL, method="function_calling"
+                    )
+                ],
+                exceptions_to_handle=FALLBACK_EXCEPTIONS,
+            )
+        return self.prompt | model
+
+    def _build_chains(self) -> None:
+        """Build the main and fast chains, each falling back to the other."""
+        self.chain = self._build_chain(self.llm, self.fast_llm)
+        self.fast_chain = (
+            self._build_chain(self.fast_llm, self.llm) if self.fast_llm else None
+        )
+
+    def _route(self, input_text: str, musical_intent: str) -> Tuple[Runnable, str]:
+        """Pick the chain for a prompt.
+
+        Single-command prompts with a simple intent go to the fast model when
+        one is configured; everything else goes to the main model.
+
+        Args:
+            input_text: User input text
+            musical_intent: Intent extracted from the user input
+
+        Returns:
+            Tuple of (chain, model name)
+        """
+        if (
+            self.fast_chain is not None
+            and musical_intent in FAST_MODEL_INTENTS
+            and not _MULTI_STEP_PATTERN.search(input_text.lower())
+        ):
+            return self.fast_chain, self.fast_llm.model_name
+        return self.chain, self.llm.model_name
+
     def _extract_musical_intent(self, user_prompt: str) -> str:
         """Extract musical intent from user prompt."""
         logger.debug(f"Extracting musical intent from prompt: '{user_prompt[:50]}...'")
@@ -371,75 +576,72 @@ class LLMComposer:
         # Default to melody
         return "melody"
 
-    async def _get_llm_response(self, input_text: str) -> dict:
-        """Get response from LLM with error handling.
+    def _chain_input(self, input_text: str, status: Optional[str]) -> Dict[str, str]:
+        """Build the chain variables for one request.
 
         Args:
             input_text: User input text
+            status: Current system status, if known
 
         Returns:
-            LLM response dictionary
-
-        Raises:
-            Exception: If LLM request fails
+            Prompt variables for the chain
         """
+        status = status or NO_STATUS
+
         # Augment prompt with context from memory
         logger.debug("Augmenting prompt with contextual information")
         augmented_prompt = self.prompt_augmenter.augment_prompt(input_text)
         logger.debug(f"Augmented prompt length: {len(augmented_prompt)} characters")
 
-        # Generate response from LLM
-        logger.info(f"Sending request to LLM (model: {self.llm.model_name})")
-        response = await self.chain.ainvoke({"input": augmented_prompt})
-        logger.debug(
-            f"LLM response received: {len(response.get('text', ''))} characters"
+        # Memory context is optional; drop it rather than exceed the budget
+        prompt_tokens = (
+            self._system_prompt_tokens
+            + estimate_tokens(status)
+            + estimate_tokens(augmented_prompt)
         )
-        return response
+        if prompt_tokens > self.max_prompt_tokens:
+            logger.warning(
+                f"Prompt of ~{prompt_tokens} tokens exceeds the budget of "
+                f"{self.max_prompt_tokens}; sending the request without memory context"
+            )
+            augmented_prompt = input_text
 
-    def _parse_llm_response(self, response_text: str) -> List[dict]:
-        """Parse LLM response and extract commands.
+        return {"input": augmented_prompt, "status": status}
+
+    def _extract_commands(self, response: Optional[dict]) -> Optional[List[dict]]:
+        """Extract the raw command list from MIDICommandBatch call arguments.
 
         Args:
-            response_text: Raw response text from LLM
+            response: Arguments of the MIDICommandBatch call
 
         Returns:
-            List of command dictionaries
-
-        Raises:
-            json.JSONDecodeError: If JSON parsing fails
+            List of command dictionaries, or None if the response has none
         """
-        logger.debug("Parsing LLM response as JSON")
-        cleaned_text = response_text.strip()
-
-        # Handle markdown-wrapped JSON
-        if cleaned_text.startswith("```json") and cleaned_text.endswith("```"):
-            logger.debug("Detected markdown-wrapped JSON, extracting content")
-            cleaned_text = cleaned_text[7:-3].strip()
-        elif cleaned_text.startswith("```") and cleaned_text.endswith("```"):
-            logger.debug("Detected markdown code block, extracting content")
-            cleaned_text = cleaned_text[3:-3].strip()
-
-        raw_commands = json.loads(cleaned_text)
-        if not isinstance(raw_commands, list):
-            raw_commands = [raw_commands]
-
-        logger.info(f"Parsed {len(raw_commands)} commands from LLM response")
-        return raw_commands
+        commands = response.get("commands") if isinstance(response, dict) else None
+        if not isinstance(commands, list) or not all(
+            isinstance(command, dict) for command in commands
+        ):
+            return None
+        return commands
 
-    def _execute_commands(self, raw_commands: List[dict]) -> tuple:
-        """Execute validated MIDI commands.
+    def _execute_pending(
+        self,
+        execution: "_CommandExecution",
+        raw_commands: List[dict],
+        count: int,
+        on_result: Optional[ResultCallback] = None,
+    ) -> None:
+        """Execute the commands up to ``count`` not yet run for a request.
 
         Args:
-            raw_commands: List of raw command dictionaries
-
-        Returns:
-            Tuple of (results, executed_commands, validation_errors)
+            execution: Commands executed so far for the request
+            raw_commands: Raw command dictionaries received so far
+            count: Number of leading commands that are complete
+            on_result: Called with each result as soon as it is available
         """
-        results = []
-        executed_commands = []
-        validation_errors = 0
-
-        for i, raw_cmd in enumerate(raw_commands):
+        while len(execution.results) < count:
+            i = len(execution.results)
+            raw_cmd = raw_commands[i]
             try:
                 logger.debug(
                     f"Validating command {i+1}: {raw_cmd.get('type', 'unknown type')}"
@@ -456,94 +658,323 @@ class LLMComposer:
                 else:
                     logger.warning(f"Command {i+1} execution failed: {result.message}")
 
-                results.append(result)
-                executed_commands.append(command)
+                execution.executed_commands.append(command)
             except ValidationError as e:
-                validation_errors += 1
+                execution.validation_errors += 1
                 logger.error(f"Command {i+1} validation failed: {str(e)}")
                 logger.debug(f"Invalid command data: {raw_cmd}")
-                results.append(
-                    MIDIToolResult(
-                        success=False,
-                        message=f"Invalid command format: {str(e)}",
-                        data={"raw_command": raw_cmd},
-                    )
+                result = MIDIToolResult(
+                    success=False,
+                    message=f"Invalid command format: {str(e)}",
+                    data={"raw_command": raw_cmd},
                 )
 
-        return results, executed_commands, validation_errors
+            execution.results.append(result)
+            if on_result:
+                on_result(result)
 
-    async def generate_and_execute(self, input_text: str) -> List[MIDIToolResult]:
-        """Generate and execute MIDI commands based on the input text.
+    def _execute_commands(self, raw_commands: List[dict]) -> tuple:
+        """Execute validated MIDI commands.
 
         Args:
-            input_text: The text description of the desired musical output
+            raw_commands: List of raw command dictionaries
 
         Returns:
-            List of MIDIToolResults from executing the commands
+            Tuple of (results, executed_commands, validation_errors)
+        """
+        execution = _CommandExecution()
+        self._execute_pending(execution, raw_commands, len(raw_commands))
+        return (
+            execution.results,
+            execution.executed_commands,
+            execution.validation_errors,
+        )
+
+    def _llm_failure(
+        self, input_text: str, error: BaseException
+    ) -> List[MIDIToolResult]:
+        """Build the result returned when the LLM request itself fails."""
+        logger.error(f"LLM request failed: {error}")
+        return [
+            MIDIToolResult(
+                success=False,
+                message=f"LLM request failed: {str(error)}",
+                data={"input_text": input_text},
+            )
+        ]
+
+    def _record_turn(
+        self,
+        input_text: str,
+        musical_intent: str,
+        response: Optional[dict],
+        execution: "_CommandExecution",
+    ) -> None:
+        """Record a finished request in memory.
+
+        Args:
+            input_text: The user input that produced the response
+            musical_intent: Intent extracted from the user input
+            response: Arguments of the MIDICommandBatch call
+            execution: Commands executed for the request
         """
         from datetime import datetime
 
+        results = execution.results
+
+        # Log execution summary
+        successful_commands = sum(1 for r in results if r.success)
+        failed_commands = len(results) - successful_commands
         logger.info(
-            f"Processing user input: '{input_text[:100]}{'...' if len(input_text) > 100 else ''}'"
+            f"Command execution summary: {successful_commands} successful, {failed_commands} failed, {execution.validation_errors} validation errors"
         )
 
-        # Extract musical intent
-        musical_intent = self._extract_musical_intent(input_text)
+        # Record interaction in memory
+        logger.debug("Recording conversation turn in memory")
+        conversation_turn = ConversationTurn(
+            timestamp=datetime.now(),
+            user_prompt=input_text,
+            llm_response=json.dumps(response),
+            commands_executed=execution.executed_commands,
+            musical_intent=musical_intent,
+            referenced_elements=self.memory.find_referenced_elements(input_text),
+        )
+        self.memory.add_conversation_turn(conversation_turn)
 
-        # Get LLM response
-        try:
-            response = await self._get_llm_response(input_text)
-        except Exception as e:
-            logger.error(f"LLM request failed: {e}")
-            return [
+        # Update memory based on successful commands
+        self._update_memory_from_results(execution.executed_commands, results)
+
+    def _handle_llm_response(
+        self,
+        input_text: str,
+        musical_intent: str,
+        response: Optional[dict],
+        cache_key: Optional[CacheKey] = None,
+        on_result: Optional[ResultCallback] = None,
+        execution: Optional["_CommandExecution"] = None,
+    ) -> List[MIDIToolResult]:
+        """Execute the commands in an LLM response and record the turn.
+
+        Args:
+            input_text: The user input that produced the response
+            musical_intent: Intent extracted from the user input
+            response: Arguments of the MIDICommandBatch call
+            cache_key: Response cache key to store the response under once it
+                is known to contain commands
+            on_result: Called with each result as soon as it is available
+            execution: Commands already executed while the response streamed
+
+        Returns:
+            List of MIDIToolResults from executing the commands
+        """
+        execution = execution or _CommandExecution()
+
+        raw_commands = self._extract_commands(response)
+        if raw_commands is None:
+            logger.error("LLM response did not contain a command list")
+            logger.debug(f"Invalid LLM response: {response}")
+            return execution.results + [
                 MIDIToolResult(
                     success=False,
-                    message=f"LLM request failed: {str(e)}",
-                    data={"input_text": input_text},
+                    message="LLM response did not contain MIDI commands",
+                    data={"raw_response": response},
                 )
             ]
 
-        # Parse and execute commands
+        logger.info(f"Received {len(raw_commands)} commands from LLM")
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
+        self._execute_pending(execution, raw_commands, len(raw_commands), on_result)
+        self._record_turn(input_text, musical_intent, response, execution)
+
+        return execution.results
+
+    async def _stream_and_execute(
+        self,
+        input_text: str,
+        chain_input: Dict[str, str],
+        musical_intent: str,
+        cache_key: CacheKey,
+        on_result: Optional[ResultCallback],
+    ) -> List[MIDIToolResult]:
+        """Stream the LLM response, executing each command as it completes.
+
+        Args:
+            input_text: User input text
+            chain_input: Prompt variables for the chain
+            musical_intent: Intent extracted from the user input
+            cache_key: Response cache key for the finished response
+            on_result: Called with each result as soon as it is available
+
+        Returns:
+            List of MIDIToolResults from executing the commands
+        """
+        chain, model_name = self._route(input_text, musical_intent)
+        execution = _CommandExecution()
+        response = None
+
+        logger.info(f"Streaming request from LLM (model: {model_name})")
         try:
-            raw_commands = self._parse_llm_response(response["text"])
-            results, executed_commands, validation_errors = self._execute_commands(
-                raw_commands
+            async for response in chain.astream(chain_input):
+                raw_commands = self._extract_commands(response)
+                # Each command is complete once the one after it has started
+                if raw_commands:
+                    self._execute_pending(
+                        execution, raw_commands, len(raw_commands) - 1, on_result
+                    )
+        except Exception as e:
+            if execution.results:
+                self._record_turn(input_text, musical_intent, response, execution)
+            return execution.results + self._llm_failure(input_text, e)
+
+        logger.debug("LLM response stream complete")
+        return self._handle_llm_response(
+            input_text, musical_intent, response, cache_key, on_result, execution
+        )
+
+    async def generate_and_execute(
+        self,
+        input_text: str,
+        status: Optional[str] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> List[MIDIToolResult]:
+        """Generate and execute MIDI commands based on the input text.
+
+        The LLM response is streamed and each command is executed as soon as
+        it is complete, so the first notes play before generation finishes.
+
+        Args:
+            input_text: The text description of the desired musical output
+            status: Current system status, sent separately from the request
+            on_result: Called with the result of each command as it executes
+
+        Returns:
+            List of MIDIToolResults from executing the commands
+        """
+        logger.info(
+            f"Processing user input: '{input_text[:100]}{'...' if len(input_text) > 100 else ''}'"
+        )
+
+        # Extract musical intent
+        musical_intent = self._extract_musical_intent(input_text)
+
+        # Reuse the answer to an identical earlier request. The key is the
+        # augmented prompt, so a change in memory context is a cache miss.
+        chain_input = self._chain_input(input_text, status)
+        cache_key = ResponseCache.key(chain_input["input"], chain_input["status"])
+        response = self.response_cache.get(cache_key)
+        if response is not None:
+            logger.info("Using cached LLM response")
+            return self._handle_llm_response(
+                input_text, musical_intent, response, cache_key, on_result
             )
 
-            # Log execution summary
-            successful_commands = sum(1 for r in results if r.success)
-            failed_commands = len(results) - successful_commands
+        return await self._stream_and_execute(
+            input_text, chain_input, musical_intent, cache_key, on_result
+        )
+
+    def execute_commands(
+        self,
+        input_text: str,
+        raw_commands: List[dict],
+        on_result: Optional[ResultCallback] = None,
+    ) -> List[MIDIToolResult]:
+        """Execute known commands for an input without asking the LLM.
+
+        The turn is recorded in memory exactly as if the LLM had answered with
+        these commands.
+
+        Args:
+            input_text: The user input the commands answer
+            raw_commands: Raw command dictionaries to execute
+            on_result: Called with the result of each command as it executes
+
+        Returns:
+            List of MIDIToolResults from executing the commands
+        """
+        logger.info(f"Executing {len(raw_commands)} commands without the LLM")
+        return self._handle_llm_response(
+            input_text,
+            self._extract_musical_intent(input_text),
+            {"commands": raw_commands},
+            on_result=on_result,
+        )
+
+    async def generate_and_execute_many(
+        self,
+        input_texts: List[str],
+        status: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[List[MIDIToolResult]]:
+        """Generate and execute MIDI commands for several inputs at once.
+
+        The LLM requests are sent concurrently through the chain's batch API so
+        their round trips overlap. The responses are then executed one input at
+        a time, in the order given, so MIDI commands and memory updates happen
+        exactly as they would for sequential ``generate_and_execute`` calls.
+
+        Args:
+            input_texts: Text descriptions of the desired musical output
+            status: Current system status, shared by every request
+            max_concurrency: Maximum number of LLM requests in flight
+
+        Returns:
+            One list of MIDIToolResults per input, in input order
+        """
+        if not input_texts:
+            return []
+
+        logger.info(f"Processing batch of {len(input_texts)} user inputs")
+        musical_intents = [self._extract_musical_intent(text) for text in input_texts]
+
+        # All prompts are augmented against the same memory snapshot
+        chain_inputs = [self._chain_input(text, status) for text in input_texts]
+        cache_keys = [
+            ResponseCache.key(chain_input["input"], chain_input["status"])
+            for chain_input in chain_inputs
+        ]
+        responses = [self.response_cache.get(key) for key in cache_keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+
+        # Group the misses by the model they are routed to
+        groups: Dict[str, Tuple[Runnable, List[int]]] = {}
+        for i in misses:
+            chain, model_name = self._route(input_texts[i], musical_intents[i])
+            groups.setdefault(model_name, (chain, []))[1].append(i)
+
+        async def run_group(model_name: str, chain: Runnable, indices: List[int]):
             logger.info(
-                f"Command execution summary: {successful_commands} successful, {failed_commands} failed, {validation_errors} validation errors"
+                f"Sending {len(indices)} batched requests to LLM "
+                f"(model: {model_name}, max_concurrency: {max_concurrency})"
             )
-
-            # Record interaction in memory
-            logger.debug("Recording conversation turn in memory")
-            conversation_turn = ConversationTurn(
-                timestamp=datetime.now(),
-                user_prompt=input_text,
-                llm_response=response["text"],
-                commands_executed=executed_commands,
-                musical_intent=musical_intent,
-                referenced_elements=self.memory.find_referenced_elements(input_text),
+            fetched = await chain.abatch(
+                [chain_inputs[i] for i in indices],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
             )
-            self.memory.add_conversation_turn(conversation_turn)
-
-            # Update memory based on successful commands
-            self._update_memory_from_results(executed_commands, results)
+            for i, response in zip(indices, fetched):
+                responses[i] = response
 
-            return results
+        await asyncio.gather(
+            *(
+                run_group(model_name, chain, indices)
+                for model_name, (chain, indices) in groups.items()
+            )
+        )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {str(e)}")
-            logger.debug(f"Invalid JSON response: {response['text']}")
-            return [
-                MIDIToolResult(
-                    success=False,
-                    message="Failed to parse LLM response as JSON",
-                    data={"raw_response": response["text"], "json_error": str(e)},
+        batch_results = []
+        for input_text, musical_intent, response, cache_key in zip(
+            input_texts, musical_intents, responses, cache_keys
+        ):
+            if isinstance(response, Exception):
+                batch_results.append(self._llm_failure(input_text, response))
+            else:
+                batch_results.append(
+                    self._handle_llm_response(
+                        input_text, musical_intent, response, cache_key
+                    )
                 )
-            ]
+        return batch_results
 
     def update_prompt(self, system_message: str, user_template: str) -> None:
         """Update the prompt template used by the composer.
@@ -556,9 +987,10 @@ class LLMComposer:
         logger.debug(f"New system message length: {len(system_message)} characters")
         logger.debug(f"New user template: {user_template}")
 
-        self.prompt = ChatPromptTemplate.from_messages(
-            [("system", system_message), ("user", user_template)]
-        )
-        self.chain = LLMChain(llm=self.llm, prompt=self.prompt)
+        self.prompt = build_prompt(system_message, user_template)
+        self._system_prompt_tokens = estimate_tokens(system_message)
+        self._build_chains()
+        # Cached responses were produced by the old prompt
+        self.response_cache.clear()
 
         logger.info("Prompt template updated successfully")
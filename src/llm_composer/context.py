@@ -96,9 +96,16 @@ class ContextBuilder:
             musical_style=musical_ctx.musical_style,
         )
 
-    def build_history_context(self, turns: int = 3) -> HistoryContext:
-        """Build conversation history context."""
-        recent_turns = self.memory.get_recent_conversation_context(turns)
+    def build_history_context(
+        self, turns: int = 3, query: Optional[str] = None
+    ) -> HistoryContext:
+        """Build conversation history context.
+
+        Only a fixed number of turns is included, chosen by relevance to
+        ``query`` when given, so the context stays the same size however long
+        the session runs.
+        """
+        recent_turns = self.memory.get_recent_conversation_context(turns, query)
 
         recent_requests = []
         musical_themes = set()
@@ -174,7 +181,9 @@ class PromptAugmenter:
             context_parts.append(self._format_music_context(music_context))
 
         if context_needs.get("history", False):
-            history_context = self.context_builder.build_history_context()
+            history_context = self.context_builder.build_history_context(
+                query=user_prompt
+            )
             context_parts.append(self._format_history_context(history_context))
 
         if context_needs.get("references", False):
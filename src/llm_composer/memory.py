@@ -1,5 +1,6 @@
 """Memory system for LLM Composer to track composition state."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -8,6 +9,17 @@ from typing import Dict, List, Optional, Set
 from ..midi_generator.structures import Note
 from .models import MIDICommand
 
+_WORD_PATTERN = re.compile(r"[a-z0-9#]+")
+# Words too common in requests to say anything about relevance
+_STOP_WORDS = frozenset(
+    {"a", "an", "and", "the", "to", "of", "in", "on", "it", "that", "this", "me"}
+)
+
+
+def _content_words(text: str) -> Set[str]:
+    """Return the lowercase content words of a request."""
+    return set(_WORD_PATTERN.findall(text.lower())) - _STOP_WORDS
+
 
 class MusicalRole(Enum):
     """Musical roles for instruments."""
@@ -237,9 +249,39 @@ class ComposerMemory:
         if len(self.conversation_history) > 50:
             self.conversation_history = self.conversation_history[-50:]
 
-    def get_recent_conversation_context(self, turns: int = 3) -> List[ConversationTurn]:
-        """Get recent conversation turns."""
-        return self.conversation_history[-turns:] if self.conversation_history else []
+    def get_recent_conversation_context(
+        self, turns: int = 3, query: Optional[str] = None
+    ) -> List[ConversationTurn]:
+        """Get recent conversation turns.
+
+        Args:
+            turns: Maximum number of turns to return
+            query: When given, return the turns whose requests share the most
+                words with it instead of simply the latest ones. The latest
+                turn is always included, since "previous"/"last" references
+                usually point at it.
+
+        Returns:
+            Conversation turns in chronological order
+        """
+        history = self.conversation_history
+        if turns <= 0:
+            return []
+        if query is None or len(history) <= turns:
+            return history[-turns:] if history else []
+
+        query_words = _content_words(query)
+        # Rank older turns by shared words, breaking ties by recency
+        ranked = sorted(
+            range(len(history) - 1),
+            key=lambda i: (
+                len(query_words & _content_words(history[i].user_prompt)),
+                i,
+            ),
+            reverse=True,
+        )
+        selected = sorted(ranked[: turns - 1]) + [len(history) - 1]
+        return [history[i] for i in selected]
 
     def find_referenced_elements(self, text: str) -> List[str]:
         """Find elements referenced in text (instruments, sequences, etc.)."""
@@ -82,3 +82,11 @@ MIDICommand = (
     | StopSequenceCommand
     | StopAllCommand
 )
+
+
+class MIDICommandBatch(BaseModel):
+    """MIDI commands to execute for the user's request."""
+
+    commands: List[MIDICommand] = Field(
+        ..., description="Commands to execute, in order"
+    )
@@ -1,25 +1,31 @@
 """Core music composition and generation functionality."""
 
-from .instrument import (
-    Instrument,
-    InstrumentConfig,
-    NotePlayerProtocol,
-    SequencePlayerProtocol,
-)
-from .instrument_adapters import (
-    CombinedAdapter,
-    MIDIControllerAdapter,
-    SequencerAdapter,
-)
-from .instrument_manager import InstrumentManager
-from .midi_controller import MIDIController
-from .structures import Note, Sequence
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .instrument import (
+        Instrument,
+        InstrumentConfig,
+        NotePlayerProtocol,
+        SequencePlayerProtocol,
+    )
+    from .instrument_adapters import (
+        CombinedAdapter,
+        MIDIControllerAdapter,
+        SequencerAdapter,
+    )
+    from .instrument_manager import InstrumentManager
+    from .midi_controller import MIDIController
+    from .parsing import parse_sequence
+    from .structures import Note, Sequence
 
 __all__ = [
     # Existing exports
     "MIDIController",
     "Note",
     "Sequence",
+    "parse_sequence",
     # New instrument exports
     "Instrument",
     "InstrumentConfig",
@@ -30,3 +36,36 @@ __all__ = [
     "CombinedAdapter",
     "InstrumentManager",
 ]
+
+# Exports are resolved on first access (PEP 562) so that importing one
+# lightweight submodule, such as structures or parsing, does not pull in mido
+# and the MIDI output stack.
+_EXPORT_MODULES = {
+    "MIDIController": ".midi_controller",
+    "Note": ".structures",
+    "Sequence": ".structures",
+    "parse_sequence": ".parsing",
+    "Instrument": ".instrument",
+    "InstrumentConfig": ".instrument",
+    "NotePlayerProtocol": ".instrument",
+    "SequencePlayerProtocol": ".instrument",
+    "MIDIControllerAdapter": ".instrument_adapters",
+    "SequencerAdapter": ".instrument_adapters",
+    "CombinedAdapter": ".instrument_adapters",
+    "InstrumentManager": ".instrument_manager",
+}
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first access."""
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the package's exports alongside its module attributes."""
+    return sorted(set(globals()) | set(__all__))
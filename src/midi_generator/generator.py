@@ -4,7 +4,13 @@ from typing import List, Optional
 
 
 class MusicGenerator:
-    """Base class for music generation."""
+    """Base class for music generation.
+
+    Model-backed subclasses should import heavy frameworks such as torch or
+    pretty_midi inside ``__init__`` or ``generate`` (or under ``TYPE_CHECKING``
+    for annotations) rather than at module level, so sessions that never
+    generate do not pay their import time and memory.
+    """
 
     def __init__(self, model_path: Optional[str] = None):
         """Initialize the music generator.
@@ -1,14 +1,17 @@
 """Instrument abstraction for musical instruments with MIDI channel management."""
 
-from dataclasses import dataclass
-from typing import Optional, Protocol
+from dataclasses import dataclass, replace
+from typing import Dict, KeysView, Optional, Protocol
 
 from .structures import Note, Sequence
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstrumentConfig:
-    """Configuration for an instrument."""
+    """Configuration for an instrument.
+
+    Instances are immutable; Instrument precomputes lookup tables from them.
+    """
 
     channel: int  # MIDI channel (0-15)
     name: Optional[str] = None
@@ -95,7 +98,12 @@ class Instrument:
         self.config = config
         self._note_player = note_player
         self._sequence_player = sequence_player
-        self._active_sequences = set()  # Track active sequence IDs
+        # Transposed pitch for every input pitch, clamped to the MIDI range
+        self._transpose_lut = bytes(
+            max(0, min(127, pitch + config.transpose)) for pitch in range(128)
+        )
+        # Active sequence IDs, kept in start order (values are unused)
+        self._active_sequences: Dict[int, None] = {}
 
     @property
     def channel(self) -> int:
@@ -116,8 +124,10 @@ class Instrument:
         Returns:
             Transposed pitch clamped to 0-127 range
         """
-        transposed = pitch + self.config.transpose
-        return max(0, min(127, transposed))
+        if 0 <= pitch <= 127:
+            return self._transpose_lut[pitch]
+        # Out-of-range input cannot index the table; clamp it arithmetically
+        return max(0, min(127, pitch + self.config.transpose))
 
     def play_note(
         self, pitch: int, velocity: Optional[int] = None, duration: float = 0.5
@@ -168,33 +178,39 @@ class Instrument:
         Returns:
             Sequence ID for later control
         """
-        # Create a copy of the sequence to avoid modifying the original
-        notes = []
-        for note in sequence.notes:
-            # Apply transpose
-            transposed_pitch = self._apply_transpose(note.pitch)
-
-            # Create new note with potentially modified channel and pitch
-            new_note = Note(
-                pitch=transposed_pitch,
-                velocity=note.velocity,
-                duration=note.duration,
-                start_beat=note.start_beat,
-                channel=(self.config.channel if override_channel else note.channel),
+        channel = self.config.channel
+
+        if self.config.transpose == 0 and (
+            not override_channel or sequence.uniform_channel == channel
+        ):
+            # Nothing to rewrite: a new sequence keeps per-playback state like
+            # loop independent of the original and shares only the note tuple,
+            # which cannot change underneath it
+            modified_sequence = replace(sequence)
+        else:
+            # Copy the notes to avoid modifying the original. Note pitches are
+            # already validated, so index the transpose table directly.
+            transpose_lut = self._transpose_lut
+            notes = [
+                Note(
+                    pitch=transpose_lut[note.pitch],
+                    velocity=note.velocity,
+                    duration=note.duration,
+                    start_beat=note.start_beat,
+                    channel=channel if override_channel else note.channel,
+                )
+                for note in sequence.notes
+            ]
+            modified_sequence = Sequence(
+                notes=notes,
+                tempo_bpm=sequence.tempo_bpm,
+                loop=sequence.loop,
+                name=sequence.name,
             )
-            notes.append(new_note)
-
-        # Create new sequence with modified notes
-        modified_sequence = Sequence(
-            notes=notes,
-            tempo_bpm=sequence.tempo_bpm,
-            loop=sequence.loop,
-            name=sequence.name,
-        )
 
         # Play the sequence and track it
         sequence_id = self._sequence_player.play_sequence(modified_sequence)
-        self._active_sequences.add(sequence_id)
+        self._active_sequences[sequence_id] = None
 
         return sequence_id
 
@@ -204,19 +220,26 @@ class Instrument:
         Args:
             sequence_id: ID of sequence to stop
         """
-        if sequence_id in self._active_sequences:
-            self._sequence_player.stop_sequence(sequence_id)
-            self._active_sequences.discard(sequence_id)
+        try:
+            # Values are all None, so pop(id, None) could not tell a hit from a
+            # miss; a single del doubles as the membership test instead
+            del self._active_sequences[sequence_id]
+        except KeyError:
+            return
+        self._sequence_player.stop_sequence(sequence_id)
 
     def stop_all_sequences(self) -> None:
         """Stop all sequences currently playing on this instrument."""
-        for sequence_id in list(self._active_sequences):
-            self.stop_sequence(sequence_id)
+        # Drain in place rather than iterating over a copied list
+        while self._active_sequences:
+            sequence_id, _ = self._active_sequences.popitem()
+            self._sequence_player.stop_sequence(sequence_id)
 
-    def get_active_sequences(self) -> set:
-        """Get set of currently active sequence IDs.
+    def get_active_sequences(self) -> KeysView[int]:
+        """Get the currently active sequence IDs.
 
         Returns:
-            Set of active sequence IDs
+            Read-only, set-like live view of active sequence IDs. It reflects
+            later play/stop calls; copy it with set() to keep a snapshot.
         """
-        return self._active_sequences.copy()
+        return self._active_sequences.keys()
@@ -11,6 +11,7 @@ from .instrument import (
     NotePlayerProtocol,
     SequencePlayerProtocol,
 )
+from .structures import Sequence
 
 console = Console()
 
@@ -96,6 +97,34 @@ class InstrumentManager:
             return True
         return False
 
+    def play_all(self, sequences: Dict[str, Sequence]) -> Dict[str, int]:
+        """Start one sequence on each of several instruments.
+
+        All instrument names are resolved before anything is scheduled, so a
+        typo cannot leave a multi-track arrangement half started. The tracks
+        are then scheduled back to back from the calling thread; the per-track
+        work is pure Python, so spreading it over threads would only add
+        contention.
+
+        Args:
+            sequences: Mapping of instrument name to the sequence it should play
+
+        Returns:
+            Mapping of instrument name to the started sequence ID
+
+        Raises:
+            KeyError: If any instrument name is unknown
+        """
+        missing = [name for name in sequences if name not in self.instruments]
+        if missing:
+            raise KeyError(f"Unknown instruments: {', '.join(missing)}")
+
+        instruments = self.instruments
+        return {
+            name: instruments[name].play_sequence(sequence)
+            for name, sequence in sequences.items()
+        }
+
     def stop_all_instruments(self) -> int:
         """Stop all sequences on all instruments.
 
@@ -1,6 +1,11 @@
 """MIDI controller module for handling MIDI output and playbook."""
 
+import heapq
+import itertools
+import os
+import threading
 import time
+from functools import lru_cache
 
 import mido
 from rich.console import Console
@@ -12,6 +17,135 @@ console = Console()
 # Get logger for this module
 logger = get_logger(__name__)
 
+# How long before a deadline the dispatcher stops sleeping and starts spinning.
+# OS sleeps routinely overshoot by a millisecond or more, so the last stretch is
+# spent polling perf_counter() instead.
+SPIN_MARGIN_SECONDS = 0.002
+
+# Channel-mode panic messages, built once: CC#123 All Notes Off and CC#120 All
+# Sound Off for every channel replace 2048 individual note_off messages.
+_ALL_NOTES_OFF = [
+    mido.Message("control_change", control=123, value=0, channel=channel)
+    for channel in range(16)
+]
+_ALL_SOUND_OFF = [
+    mido.Message("control_change", control=120, value=0, channel=channel)
+    for channel in range(16)
+]
+# The same panic as raw (status, data1, data2) tuples for the rtmidi fast path
+_PANIC_BYTES = [tuple(msg.bytes()) for msg in _ALL_NOTES_OFF + _ALL_SOUND_OFF]
+
+
+@lru_cache(maxsize=None)
+def _note_off_message(note: int, channel: int) -> mido.Message:
+    """Return a shared note_off message for the given note and channel.
+
+    At most 16x128 distinct messages exist, so the cache is unbounded; they are
+    built on first use rather than all at import time.
+    """
+    return mido.Message("note_off", note=note, velocity=0, channel=channel)
+
+
+@lru_cache(maxsize=8192)
+def _note_on_message(note: int, velocity: int, channel: int) -> mido.Message:
+    """Return a shared note_on message for the given parameters.
+
+    Messages handed to port.send() are never mutated (mido sends a copy), so a
+    single instance per (note, velocity, channel) can be reused safely.
+    """
+    return mido.Message("note_on", note=note, velocity=velocity, channel=channel)
+
+
+class _DeadlineQueue:
+    """Dispatch MIDI messages at absolute perf_counter() deadlines.
+
+    A single daemon thread owns the heap and sends each message once its
+    deadline is reached. Callers never block: they push a message together with
+    the absolute time it should go out and return immediately, so note-offs for
+    overlapping notes no longer serialize behind one another.
+    """
+
+    def __init__(self, send, spin_margin: float = SPIN_MARGIN_SECONDS):
+        """Initialize the queue.
+
+        Args:
+            send: Callable invoked with each message when its deadline is due.
+            spin_margin: Seconds before a deadline to switch from sleeping to
+                spin-waiting.
+        """
+        self._send = send
+        self._spin_margin = spin_margin
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="MIDIDeadlineQueue", daemon=True
+        )
+        self._thread.start()
+
+    def push(self, deadline: float, msg) -> None:
+        """Queue a message for delivery at an absolute perf_counter() time.
+
+        Args:
+            deadline: Absolute time in seconds, as returned by perf_counter().
+            msg: Message handed to the send callable at the deadline.
+        """
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, next(self._counter), msg))
+            self._condition.notify()
+
+    def clear(self) -> None:
+        """Drop all pending messages without stopping the dispatcher."""
+        with self._condition:
+            self._heap.clear()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the dispatcher thread, dropping any pending messages."""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._condition.notify()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        """Dispatcher loop: wait for the earliest deadline and send it."""
+        _elevate_thread_priority()
+        while True:
+            with self._condition:
+                while self._running and not self._heap:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+                deadline, _, msg = self._heap[0]
+                remaining = deadline - time.perf_counter()
+                if remaining > self._spin_margin:
+                    # Wakes early if an earlier deadline gets pushed meanwhile
+                    self._condition.wait(remaining - self._spin_margin)
+                    continue
+                heapq.heappop(self._heap)
+
+            while time.perf_counter() < deadline:
+                pass
+
+            try:
+                self._send(msg)
+            except Exception as e:
+                logger.error(f"Failed to send deadline message {msg}: {e}")
+
+
+def _elevate_thread_priority() -> None:
+    """Best-effort request for real-time scheduling of the calling thread."""
+    try:
+        # On Linux pid 0 targets the calling thread
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+        logger.debug("MIDI dispatcher running with SCHED_FIFO priority")
+    except (AttributeError, OSError) as e:
+        # Unsupported platform or missing privileges; default priority is fine
+        logger.debug(f"Could not elevate MIDI dispatcher priority: {e}")
+
 
 class MIDIController:
     """Controller class for handling MIDI output and playback functionality."""
@@ -21,6 +155,10 @@ class MIDIController:
         self.port = None
         self.current_sequence = None
         self.is_playing = False
+        self._deadline_queue = None
+        # Underlying python-rtmidi output when the rtmidi backend is in use
+        self._rt = None
+        self._rt_lock = threading.Lock()
         logger.debug("MIDIController initialized")
 
     def list_ports(self):
@@ -64,6 +202,7 @@ class MIDIController:
             port_name = available_ports[port_number]
             logger.debug(f"Opening MIDI output port: {port_name}")
             self.port = mido.open_output(port_name)
+            self._rt = getattr(self.port, "_rt", None)
             console.print(f"[green]Connected to: {port_name}[/green]")
             logger.info(f"Successfully connected to MIDI port: {port_name}")
             return True
@@ -80,13 +219,16 @@ class MIDIController:
             velocity: Note velocity (0-127)
             channel: MIDI channel (0-15)
         """
+        # Lazy %-formatting: this runs per event, usually with debug disabled
         logger.debug(
-            f"Sending note_on: note={note}, velocity={velocity}, channel={channel}"
+            "Sending note_on: note=%s, velocity=%s, channel=%s", note, velocity, channel
         )
-        if self.port:
-            msg = mido.Message("note_on", note=note, velocity=velocity, channel=channel)
+        if self._rt is not None:
+            self.send_raw(0x90 | channel, note, velocity)
+        elif self.port:
+            msg = _note_on_message(note, velocity, channel)
             self.port.send(msg)
-            logger.debug(f"Note on message sent successfully: {msg}")
+            logger.debug("Note on message sent successfully: %s", msg)
         else:
             logger.warning("Attempted to send note_on but no MIDI port is connected")
 
@@ -97,21 +239,47 @@ class MIDIController:
             note: MIDI note number (0-127)
             channel: MIDI channel (0-15)
         """
-        logger.debug(f"Sending note_off: note={note}, channel={channel}")
-        if self.port:
-            msg = mido.Message("note_off", note=note, velocity=0, channel=channel)
+        logger.debug("Sending note_off: note=%s, channel=%s", note, channel)
+        if self._rt is not None:
+            self.send_raw(0x80 | channel, note, 0)
+        elif self.port:
+            msg = _note_off_message(note, channel)
             self.port.send(msg)
-            logger.debug(f"Note off message sent successfully: {msg}")
+            logger.debug("Note off message sent successfully: %s", msg)
         else:
             logger.warning("Attempted to send note_off but no MIDI port is connected")
 
+    def send_raw(self, status: int, data1: int, data2: int) -> None:
+        """Send a three-byte channel message.
+
+        With the python-rtmidi backend the bytes go straight to the underlying
+        RtMidiOut, skipping mido's message type check and copy on every send.
+        Other backends fall back to sending a regular mido message.
+
+        Args:
+            status: Status byte, with the channel in the low nibble
+            data1: First data byte (0-127)
+            data2: Second data byte (0-127)
+        """
+        if self._rt is not None:
+            with self._rt_lock:
+                self._rt.send_message((status, data1, data2))
+        elif self.port:
+            self.port.send(mido.Message.from_bytes((status, data1, data2)))
+        else:
+            logger.warning(
+                "Attempted to send raw message but no MIDI port is connected"
+            )
+
     def send_note(
         self, note: int, velocity: int, channel: int = 0, duration: float = 0.5
     ):
-        """Send a single MIDI note with blocking timing.
+        """Send a single MIDI note without blocking the caller.
 
-        This is a low-level utility method that uses simple sleep-based timing.
-        For more precise musical timing, use MIDISequencer instead.
+        The note_on goes out immediately and the matching note_off is queued for
+        an absolute deadline on a dedicated dispatcher thread, so repeated calls
+        overlap instead of serializing for the full note duration. For sequenced
+        musical timing, use MIDISequencer instead.
 
         Args:
             note: MIDI note number (0-127).
@@ -120,8 +288,12 @@ class MIDIController:
             duration: Note duration in seconds.
         """
         logger.debug(
-            f"Sending note with duration: note={note}, velocity={velocity}, "
-            f"channel={channel}, duration={duration}s"
+            "Sending note with duration: note=%s, velocity=%s, channel=%s, "
+            "duration=%ss",
+            note,
+            velocity,
+            channel,
+            duration,
         )
 
         if not self.port:
@@ -130,32 +302,51 @@ class MIDIController:
             return
 
         self.send_note_on(note, velocity, channel)
-        logger.debug(f"Sleeping for {duration}s")
-        time.sleep(duration)
+        deadline = time.perf_counter() + duration
+        if self._deadline_queue is None:
+            self._deadline_queue = _DeadlineQueue(self._send_deadline_message)
+        self._deadline_queue.push(deadline, (note, channel))
+        logger.debug("Queued note_off for note %s in %ss", note, duration)
+
+    def _send_deadline_message(self, msg) -> None:
+        """Send a note_off queued by send_note once its deadline is reached."""
+        note, channel = msg
         self.send_note_off(note, channel)
-        logger.debug(f"Note sequence completed for note {note}")
+
+    def send_all_notes_off(self) -> None:
+        """Silence every channel with All Notes Off and All Sound Off messages."""
+        if self._rt is not None:
+            with self._rt_lock:
+                for message in _PANIC_BYTES:
+                    self._rt.send_message(message)
+            logger.debug("Sent all notes off and all sound off on all channels")
+        elif self.port:
+            for msg in _ALL_NOTES_OFF:
+                self.port.send(msg)
+            for msg in _ALL_SOUND_OFF:
+                self.port.send(msg)
+            logger.debug("Sent all notes off and all sound off on all channels")
+        else:
+            logger.warning("Cannot send all notes off: no MIDI port connected")
 
     def stop_sequence(self):
         """Stop the currently playing sequence and send all notes off."""
         logger.debug("Stopping sequence and sending all notes off")
         self.is_playing = False
-
-        # Send all notes off on all channels
-        if self.port:
-            notes_sent = 0
-            for channel in range(16):
-                for note in range(128):
-                    self.send_note_off(note, channel)
-                    notes_sent += 1
-            logger.debug(f"Sent {notes_sent} note_off messages across all channels")
-        else:
-            logger.warning("Cannot stop sequence: no MIDI port connected")
+        # Pending releases are redundant once every channel has been silenced
+        if self._deadline_queue is not None:
+            self._deadline_queue.clear()
+        self.send_all_notes_off()
 
     def close(self):
         """Close the MIDI connection and clean up resources."""
         logger.debug("Closing MIDI controller")
+        if self._deadline_queue is not None:
+            self._deadline_queue.close()
+            self._deadline_queue = None
         if self.port:
             self.stop_sequence()
+            self._rt = None
             self.port.close()
             logger.info("MIDI port closed successfully")
         else:
@@ -0,0 +1,129 @@
+"""Parsing of the compact text format for note sequences."""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .structures import Sequence
+
+# Note lengths written in practice cluster on a few straight and dotted values;
+# a dict hit is cheaper than running float()'s full parser on them.
+_COMMON_DURATIONS = {
+    text: float(text)
+    for text in (
+        "0.125",
+        "0.25",
+        "0.5",
+        "0.75",
+        "1",
+        "1.0",
+        "1.5",
+        "2",
+        "2.0",
+        "4",
+        "4.0",
+    )
+}
+
+# Canonical spellings of every 7-bit value. MIDI fields are almost always
+# written this way, so one dict probe replaces a call into int()'s parser.
+_UINT7 = {str(value): value for value in range(128)}
+
+
+def parse_sequence(sequence_str: str) -> Sequence:
+    """Parse a sequence string into a Sequence object.
+
+    Format: note,velocity,channel,duration;note,velocity,channel,duration;...
+
+    Args:
+        sequence_str: String containing semicolon-separated note definitions.
+
+    Returns:
+        Sequence object containing the parsed notes.
+
+    Raises:
+        ValueError: If the sequence format is invalid.
+    """
+    return Sequence.from_tuple_list(list(_parse_rows(sequence_str)))
+
+
+@lru_cache(maxsize=256)
+def _parse_rows(sequence_str: str) -> Tuple[tuple, ...]:
+    """Tokenize and validate a sequence string into note rows.
+
+    Results are memoized so replaying the same sequence string (common while
+    experimenting with loops) skips tokenizing entirely. Rows are immutable
+    tuples; fresh Note objects are built from them on every call.
+
+    Args:
+        sequence_str: String containing semicolon-separated note definitions.
+
+    Returns:
+        Tuple of (pitch, velocity, channel, duration) rows.
+
+    Raises:
+        ValueError: If the sequence format is invalid.
+    """
+    rows = []
+    append = rows.append
+
+    # Stage plain (pitch, velocity, channel, duration) rows in a single pass and
+    # only build Note objects once the whole string has been tokenized.
+    for note_str in sequence_str.split(";"):
+        if not note_str or note_str.isspace():
+            continue
+        parts = note_str.split(",")
+        n_parts = len(parts)
+        if n_parts == 4:
+            # Fully specified notes are the common case; unpack them directly
+            note_num, velocity, channel, duration = parts
+            row = (
+                _UINT7.get(note_num),
+                _UINT7.get(velocity),
+                _UINT7.get(channel),
+                _COMMON_DURATIONS.get(duration),
+            )
+            if None in row:
+                # Some field is spelled unusually (padding, sign, exponent, or
+                # simply out of range); convert the whole row the slow way
+                row = (int(note_num), int(velocity), int(channel), float(duration))
+            append(row)
+            continue
+        if n_parts < 2:
+            raise ValueError("Each note must have at least note and velocity values")
+
+        note_num = int(parts[0])
+        velocity = int(parts[1])
+        channel = int(parts[2]) if n_parts > 2 else 0
+        if n_parts > 3:
+            duration = _COMMON_DURATIONS.get(parts[3])
+            if duration is None:
+                duration = float(parts[3])
+        else:
+            duration = 0.5
+
+        append((note_num, velocity, channel, duration))
+
+    bad_index = _first_invalid_row(rows)
+    if bad_index is not None:
+        raise ValueError(f"Invalid note parameters (note {bad_index + 1})")
+
+    return tuple(rows)
+
+
+def _first_invalid_row(rows: List[tuple]) -> Optional[int]:
+    """Find the first staged row whose MIDI parameters are out of range.
+
+    Pitch and velocity must fit in 7 bits and channel in 4 bits, so any set bit
+    above those widths (including the sign bit of a negative value) marks the
+    row as invalid.
+
+    Args:
+        rows: Staged (pitch, velocity, channel, duration) tuples.
+
+    Returns:
+        Index of the first invalid row, or None if every row is valid.
+    """
+    for index, (note_num, velocity, channel, _) in enumerate(rows):
+        if (note_num | velocity) >> 7 or channel >> 4:
+            return index
+    return None
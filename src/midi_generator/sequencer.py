@@ -1,5 +1,7 @@
 """MIDI sequencer module for connecting MIDIController with PreciseTransport."""
 
+import itertools
+import logging
 from dataclasses import dataclass
 from typing import Dict, List, Union
 
@@ -25,18 +27,29 @@ class SequenceState:
 class MIDISequencer:
     """Handles sequencing of MIDI events using precise timing."""
 
-    def __init__(self, midi_controller: MIDIController, transport: PreciseTransport):
+    def __init__(
+        self,
+        midi_controller: MIDIController,
+        transport: PreciseTransport,
+        lookahead_beats: float = 0.0,
+    ):
         """Initialize the sequencer.
 
         Args:
             midi_controller: Instance of MIDIController for MIDI output
             transport: Instance of PreciseTransport for timing
+            lookahead_beats: How far ahead of playback sequences are scheduled.
+                New sequences start this many beats after the current beat, and
+                each loop iteration is queued this many beats before it is due,
+                so scheduling work never lands on an audible deadline.
         """
         logger.debug("Initializing MIDISequencer")
         self.midi_controller = midi_controller
         self.transport = transport
+        self.lookahead_beats = max(0.0, lookahead_beats)
         self.active_sequences: Dict[int, SequenceState] = {}
-        self._next_sequence_id = 0
+        # next() on a count is a single atomic step under the GIL
+        self._sequence_ids = itertools.count()
         logger.debug(f"MIDISequencer initialized with transport BPM: {transport.bpm}")
 
     def schedule_note(
@@ -61,19 +74,15 @@ class MIDISequencer:
             f"velocity={velocity}, channel={channel}, duration={duration}"
         )
 
-        def note_on():
-            logger.debug(f"Executing note_on for note {note}")
-            self.midi_controller.send_note_on(
-                note=note, velocity=velocity, channel=channel
-            )
-
-        def note_off():
-            logger.debug(f"Executing note_off for note {note}")
-            self.midi_controller.send_note_off(note=note, channel=channel)
-
-        # Schedule note on and off events
-        self.transport.schedule_event(beat, note_on)
-        self.transport.schedule_event(beat + duration, note_off)
+        # Schedule note on and off events together
+        self.transport.schedule_event_pair(
+            beat,
+            self.midi_controller.send_note_on,
+            beat + duration,
+            self.midi_controller.send_note_off,
+            first_args=(note, velocity, channel),
+            second_args=(note, channel),
+        )
 
         logger.debug(
             f"Note scheduled - events submitted for note {note} at beat {beat}"
@@ -107,8 +116,7 @@ class MIDISequencer:
                 f"loop={seq_obj.loop}"
             )
 
-        sequence_id = self._next_sequence_id
-        self._next_sequence_id += 1
+        sequence_id = next(self._sequence_ids)
 
         # Calculate total sequence length
         sequence_length = seq_obj.total_duration()
@@ -126,13 +134,11 @@ class MIDISequencer:
         )
         self.active_sequences[sequence_id] = state
 
-        # Schedule the first iteration starting at the current beat position
-        # This prevents scheduling events in the past which causes jitter
-        current_beat = self.transport.current_beat
-        logger.debug(
-            f"Scheduling sequence {sequence_id} starting at beat {current_beat}"
-        )
-        self._schedule_iteration(sequence_id, current_beat)
+        # Start one lookahead past the current beat so the first notes are
+        # queued ahead of their deadlines rather than already past due
+        start_beat = self.transport.current_beat + self.lookahead_beats
+        logger.debug(f"Scheduling sequence {sequence_id} starting at beat {start_beat}")
+        self._schedule_iteration(sequence_id, start_beat)
 
         logger.info(
             f"Sequence {sequence_id} scheduled successfully with "
@@ -162,43 +168,45 @@ class MIDISequencer:
             f"{sequence_id} starting at beat {start_beat}"
         )
 
-        # Schedule all notes in the sequence
+        # Checked once per iteration; per-note messages are only built when
+        # debug logging is actually enabled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Collect every note event first so the transport can queue them all
+        # under a single lock acquisition
+        events = []
+        # Resolve the bound send methods once: each attribute access would
+        # otherwise create a fresh bound-method object per event
+        send_note_on = self.midi_controller.send_note_on
+        send_note_off = self.midi_controller.send_note_off
         notes_scheduled = 0
         for note in seq_obj.notes:
             # Calculate absolute beat position
             absolute_beat = start_beat + note.start_beat
 
-            # Use default parameters to properly capture loop variables
-            def make_note_on(
-                n=note.pitch, v=note.velocity, c=note.channel, seq_id=sequence_id
-            ):
-                def note_on_callback():
-                    logger.debug(
-                        f"Executing note_on for sequence {seq_id}: note={n}, "
-                        f"velocity={v}, channel={c}"
-                    )
-                    self.midi_controller.send_note_on(note=n, velocity=v, channel=c)
-
-                return note_on_callback
-
-            def make_note_off(n=note.pitch, c=note.channel, seq_id=sequence_id):
-                def note_off_callback():
-                    logger.debug(
-                        f"Executing note_off for sequence {seq_id}: note={n}, "
-                        f"channel={c}"
-                    )
-                    self.midi_controller.send_note_off(note=n, channel=c)
-
-                return note_off_callback
-
-            self.transport.schedule_event(absolute_beat, make_note_on())
-            self.transport.schedule_event(
-                absolute_beat + note.duration, make_note_off()
+            # Each event is a (beat, callback, args) record; no per-note closures
+            events.append(
+                (
+                    absolute_beat,
+                    send_note_on,
+                    (note.pitch, note.velocity, note.channel),
+                )
             )
-            logger.debug(
-                f"Sequence {sequence_id} note {notes_scheduled}: scheduled at "
-                f"beat {absolute_beat}, duration {note.duration}"
+            events.append(
+                (
+                    absolute_beat + note.duration,
+                    send_note_off,
+                    (note.pitch, note.channel),
+                )
             )
+            if debug_enabled:
+                logger.debug(
+                    "Sequence %s note %s: scheduled at beat %s, duration %s",
+                    sequence_id,
+                    notes_scheduled,
+                    absolute_beat,
+                    note.duration,
+                )
 
             notes_scheduled += 1
 
@@ -217,17 +225,20 @@ class MIDISequencer:
                 f"{state.current_iteration} at beat {next_start}"
             )
 
-            def schedule_next():
-                logger.debug(f"Triggering next iteration of sequence {sequence_id}")
-                self._schedule_iteration(sequence_id, next_start)
-
-            self.transport.schedule_event(next_start, schedule_next)
+            # Re-arm in the same batch as the notes, one lookahead early so the
+            # next iteration is already queued when it starts
+            rearm_beat = max(start_beat, next_start - self.lookahead_beats)
+            events.append(
+                (rearm_beat, self._schedule_iteration, (sequence_id, next_start))
+            )
         else:
             logger.debug(
                 f"Sequence {sequence_id} iteration {state.current_iteration} "
                 f"is final (no loop)"
             )
 
+        self.transport.schedule_event_batch(events)
+
     def start_loop(self, sequence_id: int) -> None:
         """Enable looping for a sequence.
 
@@ -244,11 +255,11 @@ class MIDISequencer:
             was_looping = state.sequence.loop
 
             if not was_looping:
-                current_beat = self.transport.current_beat
+                start_beat = self.transport.current_beat + self.lookahead_beats
                 logger.debug(
-                    f"Scheduling sequence {sequence_id} starting at beat {current_beat}"
+                    f"Scheduling sequence {sequence_id} starting at beat {start_beat}"
                 )
-                self._schedule_iteration(sequence_id, current_beat)
+                self._schedule_iteration(sequence_id, start_beat)
             else:
                 logger.warning(f"Sequence {sequence_id} was already looping")
         else:
@@ -289,9 +300,8 @@ class MIDISequencer:
         """
         logger.debug(f"Removing sequence {sequence_id}")
 
-        if sequence_id in self.active_sequences:
-            state = self.active_sequences[sequence_id]
-            del self.active_sequences[sequence_id]
+        state = self.active_sequences.pop(sequence_id, None)
+        if state is not None:
             logger.info(
                 f"Sequence {sequence_id} removed (was at iteration "
                 f"{state.current_iteration})"
@@ -314,13 +324,4 @@ class MIDISequencer:
     def all_notes_off(self) -> None:
         """Send all notes off messages on all channels."""
         logger.debug("Sending all notes off on all channels")
-
-        if self.midi_controller.port:
-            notes_sent = 0
-            for channel in range(16):
-                for note in range(128):
-                    self.midi_controller.send_note_off(note=note, channel=channel)
-                    notes_sent += 1
-            logger.debug(f"Sent {notes_sent} note_off messages across all channels")
-        else:
-            logger.warning("Cannot send all notes off: no MIDI port connected")
+        self.midi_controller.send_all_notes_off()
@@ -1,12 +1,16 @@
 """Data structures for musical composition and MIDI sequencing."""
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Note:
-    """Represents a musical note with timing and expression."""
+    """Represents a musical note with timing and expression.
+
+    Notes are immutable and slotted: sequences can share them freely, and each
+    instance carries no per-object ``__dict__``.
+    """
 
     pitch: int  # MIDI note number (0-127)
     velocity: int  # Note velocity (0-127)
@@ -16,11 +20,14 @@ class Note:
 
     def __post_init__(self):
         """Validate note parameters."""
-        if not (0 <= self.pitch <= 127):
-            raise ValueError(f"Pitch must be 0-127, got {self.pitch}")
-        if not (0 <= self.velocity <= 127):
-            raise ValueError(f"Velocity must be 0-127, got {self.velocity}")
-        if not (0 <= self.channel <= 15):
+        # One mask test covers all three ranges: any bit above the 7-bit
+        # (pitch, velocity) or 4-bit (channel) width, including the sign of a
+        # negative value, is out of range. Only then is the culprit named.
+        if (self.pitch | self.velocity) >> 7 or self.channel >> 4:
+            if not (0 <= self.pitch <= 127):
+                raise ValueError(f"Pitch must be 0-127, got {self.pitch}")
+            if not (0 <= self.velocity <= 127):
+                raise ValueError(f"Velocity must be 0-127, got {self.velocity}")
             raise ValueError(f"Channel must be 0-15, got {self.channel}")
         if self.duration <= 0:
             raise ValueError(f"Duration must be positive, got {self.duration}")
@@ -38,20 +45,53 @@ class Note:
 
 @dataclass
 class Sequence:
-    """Represents a musical sequence."""
+    """Represents a musical sequence.
 
-    notes: List[Note]
+    ``notes`` is stored as a tuple of immutable notes, so it cannot be changed
+    in place. Assigning a new collection of notes recomputes the cached
+    duration and channel.
+    """
+
+    notes: Tuple[Note, ...]
     tempo_bpm: Optional[float] = None  # Override global tempo
     loop: bool = False
     name: Optional[str] = None
 
     def __post_init__(self):
         """Validate sequence parameters."""
-        if not self.notes:
-            raise ValueError("Sequence must contain at least one note")
         if self.tempo_bpm is not None and self.tempo_bpm <= 0:
             raise ValueError(f"Tempo must be positive, got {self.tempo_bpm}")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, indexing the notes whenever they are assigned."""
+        if name == "notes":
+            value = tuple(value)
+            if not value:
+                raise ValueError("Sequence must contain at least one note")
+            # Total length in beats, read on every schedule and loop re-arm
+            object.__setattr__(
+                self,
+                "_total_duration",
+                max(note.start_beat + note.duration for note in value),
+            )
+            # Channel shared by every note, or None for mixed channels
+            first_channel = value[0].channel
+            object.__setattr__(
+                self,
+                "_uniform_channel",
+                (
+                    first_channel
+                    if all(note.channel == first_channel for note in value)
+                    else None
+                ),
+            )
+        object.__setattr__(self, name, value)
+
+    @property
+    def uniform_channel(self) -> Optional[int]:
+        """Get the channel shared by all notes, or None if channels are mixed."""
+        return self._uniform_channel
+
     def to_tuple_list(self) -> List[tuple]:
         """Convert to legacy tuple list format for backward compatibility.
 
@@ -61,14 +101,14 @@ class Sequence:
         return [note.to_tuple() for note in self.notes]
 
     def total_duration(self) -> float:
-        """Calculate the total duration of the sequence in beats.
+        """Get the total duration of the sequence in beats.
+
+        The duration is computed when the notes are assigned, not on each call.
 
         Returns:
             Total duration in beats.
         """
-        if not self.notes:
-            return 0.0
-        return max(note.start_beat + note.duration for note in self.notes)
+        return self._total_duration
 
     @classmethod
     def from_tuple_list(cls, tuples: List[tuple], **kwargs) -> "Sequence":
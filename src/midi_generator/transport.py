@@ -6,7 +6,7 @@ import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from ..logging_config import get_logger
 
@@ -29,14 +29,20 @@ else:  # Linux and others
     logger.debug("Using Linux/POSIX high-precision timer (clock_gettime)")
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedEvent:
-    """Represents a precisely timed musical event."""
+    """Represents a precisely timed musical event.
+
+    The callback is stored together with its positional arguments rather than
+    as a closure, so scheduling a MIDI message costs one small args tuple
+    instead of a function object plus its cells.
+    """
 
     timestamp_ns: int  # Nanosecond precision timestamp
     callback: Callable
     event_id: Optional[int] = None  # Optional ID for event tracking/removal
     concurrent: bool = True  # Whether this event can be executed concurrently
+    args: tuple = ()  # Positional arguments passed to the callback
 
     def __lt__(self, other):
         """Compare two events by timestamp for heap ordering."""
@@ -143,9 +149,11 @@ class PreciseTransport:
             events_to_execute = self._collect_ready_events(now_ns)
 
             # Process events - execute immediately or submit to thread pool
-            for event in events_to_execute:
-                events_processed += 1
-                self._handle_event_execution(event, now_ns)
+            if events_to_execute:
+                events_processed += len(events_to_execute)
+                for event in events_to_execute:
+                    self._handle_event_execution(event, now_ns)
+                self._execute_ready_events(events_to_execute)
 
             # Clean up completed futures periodically
             self._cleanup_completed_futures()
@@ -168,7 +176,7 @@ class PreciseTransport:
         return events_to_execute
 
     def _handle_event_execution(self, event: TimedEvent, now_ns: int):
-        """Handle the execution of a single event with jitter tracking."""
+        """Track the timing jitter of an event that is about to execute."""
         jitter = now_ns - event.timestamp_ns
         abs_jitter = abs(jitter)
 
@@ -178,9 +186,6 @@ class PreciseTransport:
         # Log jitter based on severity
         self._log_jitter(event, jitter, abs_jitter)
 
-        # Execute callback based on concurrency preference
-        self._execute_event_callback(event)
-
     def _update_jitter_stats(self, abs_jitter: int):
         """Update jitter statistics."""
         self._jitter_stats["count"] += 1
@@ -221,17 +226,27 @@ class PreciseTransport:
                 f"{jitter/1_000:.1f}μs"
             )
 
-    def _execute_event_callback(self, event: TimedEvent):
-        """Execute an event callback either in thread pool or immediately."""
-        if event.concurrent and self._thread_pool:
-            # Submit to thread pool for concurrent execution
-            future = self._thread_pool.submit(self._execute_callback_safe, event)
+    def _execute_ready_events(self, events: List[TimedEvent]):
+        """Execute a tick's due events in the thread pool or immediately.
+
+        All concurrent events that fell due together go to the pool as a single
+        task, run in timestamp order. That costs one submission and future per
+        tick instead of one per event, and keeps e.g. a note_off and the next
+        note_on for the same pitch from racing each other on separate workers.
+        """
+        batch = []
+        for event in events:
+            if event.concurrent and self._thread_pool:
+                batch.append(event)
+            else:
+                # Execute immediately in timing thread for critical events
+                self._execute_callback_safe(event)
+                logger.debug(f"Event {event.event_id} executed immediately")
+
+        if batch:
+            future = self._thread_pool.submit(self._execute_callbacks_safe, batch)
             self._active_futures.append(future)
-            logger.debug(f"Event {event.event_id} submitted to thread pool")
-        else:
-            # Execute immediately in timing thread for critical events
-            self._execute_callback_safe(event)
-            logger.debug(f"Event {event.event_id} executed immediately")
+            logger.debug(f"{len(batch)} events submitted to thread pool")
 
     def _wait_for_next_event(self):
         """Wait for the next event with appropriate timing strategy."""
@@ -278,12 +293,17 @@ class PreciseTransport:
     def _execute_callback_safe(self, event: TimedEvent):
         """Safely execute an event callback with error handling."""
         try:
-            event.callback()
+            event.callback(*event.args)
             logger.debug(f"Event {event.event_id} callback executed successfully")
         except Exception as e:
             logger.error(f"Error executing event {event.event_id}: {e}")
             print(f"Error executing event: {e}")
 
+    def _execute_callbacks_safe(self, events: List[TimedEvent]):
+        """Safely execute a batch of event callbacks in order."""
+        for event in events:
+            self._execute_callback_safe(event)
+
     def _cleanup_completed_futures(self):
         """Remove completed futures from the active list."""
         initial_count = len(self._active_futures)
@@ -293,7 +313,12 @@ class PreciseTransport:
             logger.debug(f"Cleaned up {completed_count} completed futures")
 
     def schedule_event(
-        self, beat: float, callback: Callable, concurrent: bool = True
+        self,
+        beat: float,
+        callback: Callable,
+        concurrent: bool = True,
+        *,
+        args: tuple = (),
     ) -> int:
         """Schedule an event to occur at a specific beat.
 
@@ -301,6 +326,8 @@ class PreciseTransport:
             beat: Beat position when the event should occur
             callback: Function to call at the specified beat
             concurrent: Whether the callback can be executed concurrently (default: True)
+            args: Positional arguments for the callback, so callers can pass a
+                bound method and its arguments instead of building a closure
 
         Returns:
             Event ID that can be used to remove the event later
@@ -325,7 +352,7 @@ class PreciseTransport:
             )
             # Execute immediately in the calling thread to avoid scheduling delay
             try:
-                callback()
+                callback(*args)
                 logger.debug(f"Immediate event {event_id} executed successfully")
                 return event_id
             except Exception as e:
@@ -337,6 +364,7 @@ class PreciseTransport:
             callback=callback,
             event_id=event_id,
             concurrent=concurrent,
+            args=args,
         )
 
         logger.debug(
@@ -352,6 +380,102 @@ class PreciseTransport:
 
         return event_id
 
+    def schedule_event_batch(
+        self, events: Iterable[Tuple[float, Callable, tuple]], concurrent: bool = True
+    ) -> List[int]:
+        """Schedule several events while taking the queue lock only once.
+
+        Past-due events are executed in the calling thread after the lock is
+        released, in the order they were given, exactly as schedule_event would.
+
+        Args:
+            events: Iterable of (beat, callback, args) triples; each callback
+                is invoked as callback(*args)
+            concurrent: Whether the callbacks can be executed concurrently
+
+        Returns:
+            Event IDs in the same order as events, or an empty list if the
+            transport is not playing
+        """
+        if not self._is_playing:
+            logger.warning("Cannot schedule event batch: transport not playing")
+            return []
+
+        event_ids = []
+        immediate = []
+        current_time_ns = time_get_time()
+
+        with self._lock:
+            start_time_ns = self._start_time_ns
+            ns_per_beat = self._ns_per_beat
+            for beat, callback, args in events:
+                event_id = self._next_event_id
+                self._next_event_id += 1
+                event_ids.append(event_id)
+
+                timestamp_ns = start_time_ns + int(beat * ns_per_beat)
+                if timestamp_ns <= current_time_ns:
+                    immediate.append((event_id, callback, args))
+                    continue
+
+                heapq.heappush(
+                    self._events,
+                    TimedEvent(
+                        timestamp_ns=timestamp_ns,
+                        callback=callback,
+                        event_id=event_id,
+                        concurrent=concurrent,
+                        args=args,
+                    ),
+                )
+            queue_size = len(self._events)
+
+        logger.debug(
+            f"Scheduled batch of {len(event_ids)} events "
+            f"({len(immediate)} immediate). Queue size: {queue_size}"
+        )
+
+        for event_id, callback, args in immediate:
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error executing immediate event {event_id}: {e}")
+
+        return event_ids
+
+    def schedule_event_pair(
+        self,
+        first_beat: float,
+        first_callback: Callable,
+        second_beat: float,
+        second_callback: Callable,
+        *,
+        first_args: tuple = (),
+        second_args: tuple = (),
+        concurrent: bool = True,
+    ) -> List[int]:
+        """Schedule two related events, such as a note on/off, in one batch.
+
+        Args:
+            first_beat: Beat position of the first event
+            first_callback: Function to call at the first beat
+            second_beat: Beat position of the second event
+            second_callback: Function to call at the second beat
+            first_args: Positional arguments for the first callback
+            second_args: Positional arguments for the second callback
+            concurrent: Whether the callbacks can be executed concurrently
+
+        Returns:
+            The two event IDs, or an empty list if the transport is not playing
+        """
+        return self.schedule_event_batch(
+            (
+                (first_beat, first_callback, first_args),
+                (second_beat, second_callback, second_args),
+            ),
+            concurrent=concurrent,
+        )
+
     def remove_event(self, event_id: int) -> None:
         """Remove a scheduled event by its ID.
 
@@ -414,6 +538,8 @@ class PreciseTransport:
                             timestamp_ns=new_timestamp,
                             callback=event.callback,
                             event_id=event.event_id,
+                            concurrent=event.concurrent,
+                            args=event.args,
                         )
                         heapq.heappush(self._events, new_event)
                         events_rescheduled += 1
@@ -544,7 +670,9 @@ class PreciseTransport:
             "active_futures": len(self._active_futures),
         }
 
-    def schedule_critical_event(self, beat: float, callback: Callable) -> int:
+    def schedule_critical_event(
+        self, beat: float, callback: Callable, *, args: tuple = ()
+    ) -> int:
         """Schedule a critical event that must execute immediately in timing thread.
 
         Critical events bypass the thread pool and execute in the main timing
@@ -553,8 +681,9 @@ class PreciseTransport:
         Args:
             beat: Beat position when the event should occur
             callback: Function to call at the specified beat
+            args: Positional arguments for the callback
 
         Returns:
             Event ID that can be used to remove the event later
         """
-        return self.schedule_event(beat, callback, concurrent=False)
+        return self.schedule_event(beat, callback, concurrent=False, args=args)
@@ -0,0 +1,39 @@
+"""Tests for the LLM response cache."""
+
+from src.llm_composer.cache import ResponseCache, normalize_prompt
+
+
+class TestResponseCache:
+    """Test ResponseCache lookups and eviction."""
+
+    def test_normalize_prompt(self):
+        """Test case and whitespace differences are ignored."""
+        assert normalize_prompt("  Play a C\tMajor   scale ") == "play a c major scale"
+
+    def test_key_includes_status(self):
+        """Test the same prompt in different states gets different keys."""
+        assert ResponseCache.key("Stop", "BPM: 90") == ResponseCache.key(
+            "stop ", "BPM: 90"
+        )
+        assert ResponseCache.key("stop", "BPM: 90") != ResponseCache.key(
+            "stop", "BPM: 120"
+        )
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        cache = ResponseCache(maxsize=2)
+        cache.put(("a", ""), {"text": "a"})
+        cache.put(("b", ""), {"text": "b"})
+        cache.get(("a", ""))
+        cache.put(("c", ""), {"text": "c"})
+
+        assert cache.get(("b", "")) is None
+        assert cache.get(("a", "")) == {"text": "a"}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_zero_size_disables_cache(self):
+        """Test a cache of size 0 stores nothing."""
+        cache = ResponseCache(maxsize=0)
+        cache.put(("a", ""), {"text": "a"})
+
+        assert len(cache) == 0
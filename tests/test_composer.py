@@ -0,0 +1,470 @@
+"""Tests for the LLMComposer request pipeline."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk, LLMResult
+from pydantic import ValidationError
+
+from src.llm_composer.cache import ResponseCache
+from src.llm_composer.composer import (
+    COMMAND_TOOL,
+    DEFAULT_PROMPT,
+    DEFAULT_SYSTEM_PROMPT,
+    FALLBACK_EXCEPTIONS,
+    NO_STATUS,
+    LLMComposer,
+    PromptCacheLogger,
+    estimate_tokens,
+    validate_midi_command,
+)
+from src.llm_composer.midi_tools import MIDIToolHandler, MIDIToolResult
+from src.llm_composer.models import CreateInstrumentCommand
+
+
+class _UsageStreamingModel(BaseChatModel):
+    """Chat model that streams one chunk carrying token usage."""
+
+    usage: dict
+
+    @property
+    def _llm_type(self) -> str:
+        return "usage-streaming"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content="{}", usage_metadata=self.usage)
+        )
+
+
+class TestValidateMIDICommand:
+    """Test validation of raw command dictionaries."""
+
+    def test_dispatches_on_type(self):
+        """Test each command validates to the model named by its type."""
+        command = validate_midi_command(
+            {"type": "create_instrument", "name": "bass", "channel": 1}
+        )
+
+        assert isinstance(command, CreateInstrumentCommand)
+        assert command.channel == 1
+
+    @pytest.mark.parametrize("raw_cmd", [{"type": "bogus"}, {"name": "bass"}])
+    def test_unknown_type_raises_validation_error(self, raw_cmd):
+        """Test unknown or missing types are reported as validation errors."""
+        with pytest.raises(ValidationError):
+            validate_midi_command(raw_cmd)
+
+
+def _streaming(*responses):
+    """Build an astream mock yielding the given partial responses."""
+
+    async def stream(*args, **kwargs):
+        for response in responses:
+            yield response
+
+    return Mock(side_effect=stream)
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    """Provide the API key ChatOpenAI requires at construction."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+@pytest.fixture
+def handler():
+    """Create a mocked MIDI handler whose commands all succeed."""
+    handler = Mock(spec=MIDIToolHandler)
+    handler.execute_command.return_value = MIDIToolResult(success=True, message="ok")
+    return handler
+
+
+@pytest.fixture
+def composer(handler):
+    """Create a composer whose chain and MIDI handler are mocked."""
+    composer = LLMComposer(handler)
+    composer.chain = Mock()
+    return composer
+
+
+class TestLLMComposerBatch:
+    """Test batched prompt handling in LLMComposer."""
+
+    def test_batch_sends_one_abatch_call(self, composer):
+        """Test all prompts go to the chain in a single batch call."""
+        composer.chain.abatch = AsyncMock(
+            return_value=[{"commands": [{"type": "stop_all"}]}] * 2
+        )
+
+        results = asyncio.run(
+            composer.generate_and_execute_many(["stop", "halt"], max_concurrency=3)
+        )
+
+        composer.chain.abatch.assert_awaited_once()
+        args, kwargs = composer.chain.abatch.call_args
+        assert len(args[0]) == 2
+        assert kwargs["config"] == {"max_concurrency": 3}
+        assert kwargs["return_exceptions"] is True
+        assert [[r.success for r in rs] for rs in results] == [[True], [True]]
+        assert len(composer.memory.conversation_history) == 2
+
+    def test_batch_isolates_failures(self, composer):
+        """Test a failed request only fails its own input."""
+        composer.chain.abatch = AsyncMock(
+            return_value=[RuntimeError("timeout"), None]
+        )
+
+        results = asyncio.run(composer.generate_and_execute_many(["a", "b"]))
+
+        assert results[0][0].message == "LLM request failed: timeout"
+        assert results[1][0].message == "LLM response did not contain MIDI commands"
+        composer.midi_tool_handler.execute_command.assert_not_called()
+
+    def test_empty_batch(self, composer):
+        """Test an empty batch makes no LLM requests."""
+        composer.chain.abatch = AsyncMock()
+
+        assert asyncio.run(composer.generate_and_execute_many([])) == []
+        composer.chain.abatch.assert_not_called()
+
+
+class TestLLMComposerPrompt:
+    """Test the prompt layout sent to the LLM."""
+
+    @pytest.fixture
+    def composer(self, composer):
+        """Stub the chain to stream an empty command batch."""
+        composer.chain.astream = _streaming({"commands": []})
+        return composer
+
+    def test_static_system_prompt_comes_first(self, composer):
+        """Test the volatile status follows the static system prefix."""
+        messages = composer.prompt.format_messages(input="play", status="BPM: 90")
+
+        assert messages[0].content == DEFAULT_SYSTEM_PROMPT.replace(
+            "{{", "{"
+        ).replace("}}", "}")
+        assert messages[1].content == "Current system status: BPM: 90"
+        assert messages[2].content == "play"
+
+    def test_status_is_passed_separately(self, composer):
+        """Test the status is a chain variable, not part of the user input."""
+        asyncio.run(composer.generate_and_execute("stop", status="BPM: 90"))
+
+        chain_input = composer.chain.astream.call_args.args[0]
+        assert chain_input["status"] == "BPM: 90"
+        assert "BPM" not in chain_input["input"]
+        assert composer.memory.conversation_history[-1].user_prompt == "stop"
+
+    def test_missing_status_uses_placeholder(self, composer):
+        """Test requests without a status still fill the status message."""
+        asyncio.run(composer.generate_and_execute("stop"))
+
+        assert composer.chain.astream.call_args.args[0]["status"] == NO_STATUS
+
+    def test_estimate_tokens(self):
+        """Test token estimates round up to whole tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("stop") == 1
+        assert estimate_tokens("stop!") == 2
+
+    def test_over_budget_prompt_drops_memory_context(self, composer):
+        """Test memory context is left out when the prompt exceeds the budget."""
+        asyncio.run(composer.generate_and_execute("play", status="idle"))
+        assert composer.chain.astream.call_args.args[0]["input"] != "play"
+
+        composer.max_prompt_tokens = composer._system_prompt_tokens + 5
+        asyncio.run(composer.generate_and_execute("play it", status="idle"))
+
+        assert composer.chain.astream.call_args.args[0] == {
+            "input": "play it",
+            "status": "idle",
+        }
+
+    def test_default_prompt_is_shared(self, composer):
+        """Test composers reuse the module-level default template."""
+        other = LLMComposer(Mock(spec=MIDIToolHandler))
+
+        assert composer.prompt is DEFAULT_PROMPT
+        assert other.prompt is DEFAULT_PROMPT
+
+
+class TestPromptCacheLogger:
+    """Test prompt cache usage logging."""
+
+    def test_handles_missing_usage(self):
+        """Test responses without token usage are ignored."""
+        PromptCacheLogger().on_llm_end(LLMResult(generations=[], llm_output=None))
+
+    def test_logs_cached_tokens(self, caplog):
+        """Test the cached token count is reported."""
+        usage = {
+            "prompt_tokens": 1200,
+            "prompt_tokens_details": {"cached_tokens": 1024},
+        }
+        result = LLMResult(generations=[], llm_output={"token_usage": usage})
+
+        with caplog.at_level(logging.DEBUG, logger="src.llm_composer.composer"):
+            PromptCacheLogger().on_llm_end(result)
+
+        assert "1024/1200 prompt tokens cached" in caplog.text
+
+    def test_logs_streamed_usage_metadata(self, caplog):
+        """Test usage reported on a streamed message reaches the log."""
+        usage = {
+            "input_tokens": 1500,
+            "output_tokens": 20,
+            "total_tokens": 1520,
+            "input_token_details": {"cache_read": 1280},
+        }
+        model = _UsageStreamingModel(usage=usage)
+
+        async def consume():
+            config = {"callbacks": [PromptCacheLogger()]}
+            async for _ in model.astream("play", config=config):
+                pass
+
+        with caplog.at_level(logging.DEBUG, logger="src.llm_composer.composer"):
+            asyncio.run(consume())
+
+        assert "1280/1500 prompt tokens cached" in caplog.text
+
+    def test_get_llm_requests_stream_usage(self, composer):
+        """Test shared clients ask OpenAI for usage on streamed responses."""
+        assert composer.llm.stream_usage
+
+
+class TestLLMComposerResponseCache:
+    """Test reuse of LLM responses for repeated prompts."""
+
+    @pytest.fixture
+    def composer(self, composer):
+        """Stub the chain to stream a single stop_all command."""
+        composer.chain.astream = _streaming({"commands": [{"type": "stop_all"}]})
+        return composer
+
+    def test_repeated_prompt_skips_llm(self, composer):
+        """Test a repeated prompt in the same state is answered from cache."""
+        asyncio.run(composer.generate_and_execute("Stop everything", "idle"))
+        results = asyncio.run(composer.generate_and_execute("stop  everything", "idle"))
+
+        composer.chain.astream.assert_called_once()
+        assert results[0].success
+        assert composer.midi_tool_handler.execute_command.call_count == 2
+
+    def test_status_change_misses_cache(self, composer):
+        """Test the same prompt under a different status asks the LLM again."""
+        asyncio.run(composer.generate_and_execute("stop", "idle"))
+        asyncio.run(composer.generate_and_execute("stop", "playing"))
+
+        assert composer.chain.astream.call_count == 2
+
+    def test_history_change_misses_cache(self, composer):
+        """Test a prompt that refers back is re-sent once history changes."""
+        for prompt in ("add a piano", "same as before", "add a bass"):
+            asyncio.run(composer.generate_and_execute(prompt, "idle"))
+        asyncio.run(composer.generate_and_execute("same as before", "idle"))
+
+        assert composer.chain.astream.call_count == 4
+        sent = [call.args[0]["input"] for call in composer.chain.astream.call_args_list]
+        assert sent[1] != sent[3]
+        assert "add a bass" in sent[3]
+
+    def test_response_without_commands_not_cached(self, composer):
+        """Test responses without a command list are requested again."""
+        composer.chain.astream = _streaming()
+        asyncio.run(composer.generate_and_execute("stop"))
+        asyncio.run(composer.generate_and_execute("stop"))
+
+        assert composer.chain.astream.call_count == 2
+
+    def test_batch_only_requests_misses(self, composer):
+        """Test batched prompts already in the cache are not re-sent."""
+        asyncio.run(composer.generate_and_execute("stop"))
+        composer.chain.abatch = AsyncMock(return_value=[{"commands": []}])
+
+        results = asyncio.run(composer.generate_and_execute_many(["stop", "play"]))
+
+        assert len(composer.chain.abatch.call_args.args[0]) == 1
+        assert results[0][0].success
+        assert results[1] == []
+
+
+class TestLLMComposerStructuredOutput:
+    """Test command extraction from the forced MIDICommandBatch call."""
+
+    @pytest.fixture
+    def composer(self, handler):
+        """Create a composer with a real chain and a mocked MIDI handler."""
+        return LLMComposer(handler)
+
+    def test_chain_forces_command_function(self, composer):
+        """Test the LLM is bound to call the MIDICommandBatch function."""
+        llm_step = composer.chain.steps[1]
+
+        assert llm_step.kwargs["tool_choice"]["function"]["name"] == "MIDICommandBatch"
+        assert llm_step.kwargs["tools"] == [COMMAND_TOOL]
+
+    def test_invalid_command_does_not_discard_others(self, composer):
+        """Test each command in the batch is validated on its own."""
+        response = {
+            "commands": [
+                {"type": "create_instrument", "name": "bass", "channel": 99},
+                {"type": "stop_all"},
+            ]
+        }
+
+        results = composer._handle_llm_response("stop", "stop_music", response)
+
+        assert [r.success for r in results] == [False, True]
+        composer.midi_tool_handler.execute_command.assert_called_once()
+
+    def test_execute_commands_records_turn(self, composer):
+        """Test commands run without the LLM are still recorded in memory."""
+        results = composer.execute_commands("stop", [{"type": "stop_all"}])
+
+        assert [r.success for r in results] == [True]
+        assert composer.memory.conversation_history[-1].user_prompt == "stop"
+
+
+class TestLLMComposerRouting:
+    """Test routing of simple prompts to the fast model."""
+
+    @pytest.fixture
+    def routed_composer(self, handler):
+        """Create a composer with a fast model and real chains."""
+        return LLMComposer(handler, model_name="gpt-4o", fast_model_name="gpt-4o-mini")
+
+    @pytest.fixture
+    def composer(self, routed_composer):
+        """Stub both chains to answer with empty command batches."""
+        composer = routed_composer
+        for name in ("chain", "fast_chain"):
+            chain = Mock()
+            chain.astream = _streaming({"commands": []})
+            chain.abatch = AsyncMock(
+                side_effect=lambda inputs, **_: [{"commands": []}] * len(inputs)
+            )
+            setattr(composer, name, chain)
+        return composer
+
+    def test_fast_llm_runs_at_zero_temperature(self, composer):
+        """Test the fast model is configured separately from the main model."""
+        assert composer.fast_llm.model_name == "gpt-4o-mini"
+        assert composer.fast_llm.temperature == 0
+
+    @pytest.mark.parametrize(
+        "prompt, fast",
+        [
+            ("stop everything", True),
+            ("a bit faster", True),
+            ("stop the drums and add a bass line", False),
+            ("create a jazzy piano melody", False),
+        ],
+    )
+    def test_route(self, composer, prompt, fast):
+        """Test simple single-command prompts are routed to the fast model."""
+        asyncio.run(composer.generate_and_execute(prompt))
+
+        assert composer.fast_chain.astream.call_count == int(fast)
+        assert composer.chain.astream.call_count == int(not fast)
+
+    def test_batch_splits_by_model(self, composer):
+        """Test a batch sends each prompt to its routed model."""
+        asyncio.run(
+            composer.generate_and_execute_many(["stop", "create a piano", "louder"])
+        )
+
+        assert len(composer.fast_chain.abatch.call_args.args[0]) == 2
+        assert len(composer.chain.abatch.call_args.args[0]) == 1
+
+    def test_models_fall_back_to_each_other(self, routed_composer):
+        """Test each chain retries on the other model after transient errors."""
+        composer = routed_composer
+
+        for chain, fallback_llm in (
+            (composer.chain, composer.fast_llm),
+            (composer.fast_chain, composer.llm),
+        ):
+            model = chain.steps[1]
+            assert model.exceptions_to_handle == FALLBACK_EXCEPTIONS
+            assert model.fallbacks[0].first.bound is fallback_llm
+
+    def test_routing_disabled_without_fast_model(self, handler):
+        """Test every prompt uses the main model when no fast model is set."""
+        composer = LLMComposer(handler)
+
+        assert composer.fast_chain is None
+        assert composer._route("stop", "stop_music")[0] is composer.chain
+
+
+class TestLLMComposerStreaming:
+    """Test incremental execution of streamed LLM responses."""
+
+    def test_commands_execute_as_they_complete(self, composer):
+        """Test each command runs once the next one starts streaming."""
+        piano = {"type": "create_instrument", "name": "piano", "channel": 0}
+        executed_at = []
+
+        execute_command = composer.midi_tool_handler.execute_command
+
+        async def stream(*args, **kwargs):
+            for response in (
+                {"commands": [{"type": "create_inst"}]},
+                {"commands": [piano]},
+                {"commands": [piano, {}]},
+                {"commands": [piano, {"type": "stop_all"}]},
+            ):
+                executed_at.append(execute_command.call_count)
+                yield response
+
+        composer.chain.astream = Mock(side_effect=stream)
+        streamed = []
+
+        results = asyncio.run(
+            composer.generate_and_execute("add a piano", on_result=streamed.append)
+        )
+
+        assert executed_at == [0, 0, 0, 1]
+        assert len(results) == 2
+        assert streamed == results
+        chain_input = composer.chain.astream.call_args.args[0]
+        assert composer.response_cache.get(
+            ResponseCache.key(chain_input["input"], chain_input["status"])
+        ) == {"commands": [piano, {"type": "stop_all"}]}
+
+    def test_stream_failure_keeps_executed_results(self, composer):
+        """Test commands run before a stream error are still reported."""
+
+        async def stream(*args, **kwargs):
+            yield {"commands": [{"type": "stop_all"}, {}]}
+            raise RuntimeError("connection reset")
+
+        composer.chain.astream = Mock(side_effect=stream)
+
+        results = asyncio.run(composer.generate_and_execute("stop"))
+
+        assert [r.success for r in results] == [True, False]
+        assert results[1].message == "LLM request failed: connection reset"
+        assert len(composer.memory.conversation_history) == 1
+
+
+class TestLLMClientSharing:
+    """Test reuse of ChatOpenAI clients across composers."""
+
+    def test_same_settings_share_client(self):
+        """Test composers with the same settings reuse one client."""
+        first = LLMComposer(Mock(spec=MIDIToolHandler))
+        second = LLMComposer(Mock(spec=MIDIToolHandler))
+        other = LLMComposer(Mock(spec=MIDIToolHandler), model_name="gpt-4o")
+
+        assert first.llm is second.llm
+        assert other.llm is not first.llm
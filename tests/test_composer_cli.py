@@ -0,0 +1,108 @@
+"""Tests for the composer CLI helpers."""
+
+import sys
+from unittest.mock import Mock
+
+from src.composer_cli import CommandContext, _tokenize, handle_command
+
+
+class TestHandleCommand:
+    """Test command dispatch."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.ctx = CommandContext(
+            controller=Mock(),
+            sequencer=Mock(),
+            transport=Mock(),
+            instrument_manager=Mock(),
+        )
+
+    def test_dispatches_to_component(self):
+        """Test a known command reaches the matching component."""
+        assert handle_command(self.ctx, ["start"]) is None
+        self.ctx.transport.start.assert_called_once()
+
+    def test_exit_stops_everything(self):
+        """Test exit tears down playback and requests shutdown."""
+        assert handle_command(self.ctx, ["exit"]) is True
+        self.ctx.instrument_manager.stop_all_instruments.assert_called_once()
+        self.ctx.sequencer.clear_all_sequences.assert_called_once()
+        self.ctx.transport.stop.assert_called_once()
+
+    def test_note_sends_valid_note(self):
+        """Test a valid note command reaches the controller."""
+        handle_command(self.ctx, ["note", "60", "100", "15", "0.25"])
+        self.ctx.controller.send_note.assert_called_once_with(60, 100, 15, 0.25)
+
+    def test_note_rejects_out_of_range_values(self):
+        """Test out-of-range or negative note parameters are not sent."""
+        for parts in (
+            ["note", "128", "100"],
+            ["note", "60", "-1"],
+            ["note", "60", "100", "16"],
+        ):
+            handle_command(self.ctx, parts)
+        self.ctx.controller.send_note.assert_not_called()
+
+    def test_sequence_uses_raw_line(self):
+        """Test the sequence string and trailing --loop come from the raw line."""
+        self.ctx.sequencer.schedule_sequence.return_value = 7
+        raw = "Sequence 60,100,0,0.5; 64,100,0,0.5  --LOOP "
+        handle_command(self.ctx, raw.lower().split(), raw)
+
+        sequence = self.ctx.sequencer.schedule_sequence.call_args.args[0]
+        assert sequence.loop is True
+        assert [note.pitch for note in sequence.notes] == [60, 64]
+
+    def test_playseq_without_loop_flag(self):
+        """Test playseq passes the sequence after the instrument name."""
+        instrument = self.ctx.instrument_manager.get_instrument.return_value
+        handle_command(self.ctx, ["playseq", "lead", "60,100"])
+
+        sequence = instrument.play_sequence.call_args.args[0]
+        assert sequence.loop is False
+        assert [note.pitch for note in sequence.notes] == [60]
+
+    def test_playseq_loop_flag_before_sequence(self):
+        """Test --loop is recognized wherever it appears in the arguments."""
+        instrument = self.ctx.instrument_manager.get_instrument.return_value
+        raw = "playseq lead --loop 60,100;64,100"
+        handle_command(self.ctx, raw.split(), raw)
+
+        sequence = instrument.play_sequence.call_args.args[0]
+        assert sequence.loop is True
+        assert [note.pitch for note in sequence.notes] == [60, 64]
+
+    def test_instrument_subcommands(self):
+        """Test instrument subcommands reach the instrument manager."""
+        manager = self.ctx.instrument_manager
+        handle_command(self.ctx, ["instrument", "create", "lead", "2"])
+        handle_command(self.ctx, ["instrument", "list"])
+        handle_command(self.ctx, ["instrument", "remove", "lead"])
+        handle_command(self.ctx, ["instrument", "bogus"])
+
+        manager.create_instrument.assert_called_once_with("lead", 2, 100, 0)
+        manager.print_instruments_table.assert_called_once()
+        manager.remove_instrument.assert_called_once_with("lead")
+
+    def test_unknown_command(self):
+        """Test an unknown command touches no component."""
+        assert handle_command(self.ctx, ["bogus"]) is None
+        self.ctx.transport.start.assert_not_called()
+
+
+class TestTokenize:
+    """Test REPL input tokenizing."""
+
+    def test_lowercases_and_splits(self):
+        """Test surrounding and repeated whitespace is ignored."""
+        assert _tokenize("  Note 60\t100  ") == ["note", "60", "100"]
+
+    def test_command_keyword_is_interned(self):
+        """Test the keyword is the interned string used as a dispatch key."""
+        assert _tokenize("".join(["ST", "ART"]))[0] is sys.intern("start")
+
+    def test_blank_line(self):
+        """Test a whitespace-only line yields no tokens."""
+        assert _tokenize(" \t ") == []
@@ -0,0 +1,59 @@
+"""Tests for the application configuration."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src import config as config_module
+from src.config import AppConfig
+
+
+class TestAppConfig:
+    """Test environment overrides and validation."""
+
+    def test_environment_overrides(self, monkeypatch):
+        """Test set variables are parsed onto their fields."""
+        monkeypatch.setenv("NEO4J_PORT", "7688")
+        monkeypatch.setenv("MIDI_DEFAULT_BPM", "90")
+        monkeypatch.setenv("MIDI_LOG_LEVEL", "debug")
+        monkeypatch.setenv("DEBUG", "yes")
+
+        config = AppConfig()
+
+        assert config.database.port == 7688
+        assert config.database.url.endswith(":7688")
+        assert config.midi.default_bpm == 90.0
+        assert config.logging.midi_log_level == "DEBUG"
+        assert config.debug is True
+
+    def test_unset_variables_keep_defaults(self, monkeypatch):
+        """Test fields without an environment variable keep their default."""
+        monkeypatch.delenv("MIDI_DEFAULT_VELOCITY", raising=False)
+        monkeypatch.delenv("DEBUG", raising=False)
+
+        config = AppConfig()
+
+        assert config.midi.default_velocity == 100
+        assert config.debug is False
+
+    def test_configs_are_slotted(self):
+        """Test the config dataclasses carry no per-instance __dict__."""
+        config = AppConfig()
+        for section in (config, config.database, config.llm, config.midi):
+            assert not hasattr(section, "__dict__")
+
+    def test_invalid_log_level_rejected(self, monkeypatch):
+        """Test an unknown log level fails validation."""
+        monkeypatch.setenv("LOG_LEVEL", "verbose")
+
+        with pytest.raises(ValueError, match="Invalid LOG_LEVEL"):
+            AppConfig()
+
+    def test_dotenv_only_read_on_request(self):
+        """Test constructing a config does not re-read the .env file."""
+        with patch.object(config_module, "load_dotenv") as load_dotenv:
+            AppConfig()
+            load_dotenv.assert_not_called()
+
+            config_module.reload_config(reload_dotenv=True)
+            load_dotenv.assert_called_once_with(override=True)
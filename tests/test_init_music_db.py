@@ -0,0 +1,240 @@
+"""Tests for the music theory helpers used to seed the database."""
+
+from unittest.mock import patch
+
+import pytest
+from neo4j.exceptions import ClientError
+
+from src.database import init_music_db, models
+from src.database.init_music_db import (
+    get_chord_intervals,
+    get_chord_notes,
+    get_note_chroma,
+    get_scale_notes,
+    normalize_note_name,
+)
+
+
+class _ClientError(ClientError):
+    """ClientError carrying a given Neo4j status code."""
+
+    def __init__(self, code):
+        """Initialize the error with its status code."""
+        super().__init__(code)
+        self._status = code
+
+    code = property(lambda self: self._status)
+    message = property(lambda self: self._status)
+
+
+class TestMusicTheoryHelpers:
+    """Test scale and chord note generation."""
+
+    def test_major_scale(self):
+        """Test a major scale lists its degrees up to the octave."""
+        assert get_scale_notes("C", "major") == ["C", "D", "E", "F", "G", "A", "B", "C"]
+
+    def test_scale_notes_are_normalized(self):
+        """Test enharmonic spellings are mapped onto the TONICS names."""
+        assert get_scale_notes("Eb", "minor")[:3] == ["D#", "F", "F#"]
+
+    def test_chord_notes(self):
+        """Test chords stack their intervals on the root."""
+        assert get_chord_notes("C", "dominant-seventh") == ["C", "E", "G", "A#"]
+        assert get_chord_notes("A", "diminished") == ["A", "C", "D#"]
+
+    def test_chord_masks_follow_intervals(self):
+        """Test chord types are packed as pitch-class sets above the root."""
+        assert init_music_db._CHORD_MASKS["major"] == 0b000010010001
+        assert init_music_db._CHORD_MASKS["diminished-seventh"] == 0b001001001001
+
+    def test_unusual_tonic_spelling(self):
+        """Test tonics outside the spelling tables still resolve."""
+        assert get_chord_notes("C##", "major") == ["D", "F#", "A"]
+
+    def test_cached_notes_are_copied(self):
+        """Test callers cannot corrupt the cached note tables."""
+        notes = get_chord_notes("C", "major")
+        notes.append("B")
+        assert get_chord_notes("C", "major") == ["C", "E", "G"]
+
+    def test_chord_intervals(self):
+        """Test chord intervals are shared tuples with a unison fallback."""
+        assert get_chord_intervals("minor-seventh") == ("P1", "m3", "P5", "m7")
+        assert get_chord_intervals("major") is get_chord_intervals("major")
+        assert get_chord_intervals("bogus") == ("P1",)
+
+    def test_shared_tables_are_immutable(self):
+        """Test the tonic list and alternative-name mapping cannot be modified."""
+        assert isinstance(init_music_db.TONICS, tuple)
+        with pytest.raises(TypeError):
+            models.TWO_WAY_ALTERNATIVE_NAMES["C#"] = "B##"
+
+    def test_note_chroma_is_memoized(self):
+        """Test repeated chroma lookups are served from the cache."""
+        assert get_note_chroma("Gb") == 6
+        hits = get_note_chroma.cache_info().hits
+        assert get_note_chroma("Gb") == 6
+        assert get_note_chroma.cache_info().hits == hits + 1
+
+    def test_interval_names_follow_spelling(self):
+        """Test interval names distinguish enharmonic spellings."""
+        assert init_music_db._interval_name("A", "A#") == "A1"
+        assert init_music_db._interval_name("A", "Bb") == "m2"
+        assert init_music_db._interval_name("A#", "A") == "d1"
+        assert init_music_db._interval_name("C", "F#") == "A4"
+        assert init_music_db._interval_name("C", "Gb") == "d5"
+
+    def test_unsupported_types_rejected(self):
+        """Test unknown scale and chord types raise ValueError."""
+        with pytest.raises(ValueError):
+            get_scale_notes("C", "bebop")
+        with pytest.raises(ValueError):
+            get_chord_notes("C", "power")
+
+    def test_normalize_note_name(self):
+        """Test spellings map onto the first matching TONICS entry."""
+        assert normalize_note_name("Bb") == "A#"
+        assert normalize_note_name("E#") == "F"
+        assert normalize_note_name("C") == "C"
+
+
+class TestNodeInitialization:
+    """Test node creation is batched into single queries."""
+
+    def test_init_intervals_uses_one_query(self):
+        """Test every interval is created by one UNWIND query."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_intervals()
+
+        db.cypher_query.assert_called_once()
+        query, params = db.cypher_query.call_args.args
+        assert query.startswith("UNWIND $names")
+        assert ":Interval" in query
+        assert params == {"names": init_music_db.INTERVALS}
+
+    def test_init_indexes_creates_unique_constraints(self):
+        """Test each label gets an idempotent uniqueness constraint on name."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_indexes()
+
+        queries = [call.args[0] for call in db.cypher_query.call_args_list]
+        assert len(queries) == 6
+        assert (
+            "CREATE CONSTRAINT constraint_unique_Tone_name IF NOT EXISTS "
+            "FOR (n:Tone) REQUIRE n.name IS UNIQUE"
+        ) in queries
+
+    def test_init_indexes_keeps_legacy_index(self):
+        """Test an existing index on name is tolerated but other errors raise."""
+        with patch.object(init_music_db, "db") as db:
+            db.cypher_query.side_effect = _ClientError(
+                "Neo.ClientError.Schema.IndexAlreadyExists"
+            )
+            init_music_db.init_indexes()
+
+            db.cypher_query.side_effect = _ClientError(
+                "Neo.ClientError.Statement.SyntaxError"
+            )
+            with pytest.raises(ClientError):
+                init_music_db.init_indexes()
+
+    def test_init_type_nodes_uses_one_query(self):
+        """Test intervals, scales and chords are created in one statement."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_type_nodes()
+
+        db.cypher_query.assert_called_once()
+        query, params = db.cypher_query.call_args.args
+        assert query.count("CALL {") == 3
+        assert ":Scale" in query and ":Chord" in query
+        assert init_music_db.CHORD_TYPES in params.values()
+
+    def test_init_notes_sends_tone_rows(self):
+        """Test tones are created with chroma and alternative names."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_notes()
+
+        query, params = db.cypher_query.call_args.args
+        assert "(:Tone {name: row.name, chroma: row.chroma" in query
+        assert {"name": "C#", "chroma": 1, "alternative_name": "Db"} in params["rows"]
+
+    def test_generate_note_distances_uses_one_query(self):
+        """Test every tone pair is sent in a single query."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.generate_note_distances()
+
+        db.cypher_query.assert_called_once()
+        query, params = db.cypher_query.call_args.args
+        assert query.startswith("MATCH (source:Tone), (target:Tone)")
+        distances = params["distances"]
+        assert len(distances) == len(init_music_db.TONICS) ** 2
+        assert distances["A|C"] == "M6"
+        assert distances["A|Bb"] == "m2"
+
+    def test_connect_chord_intervals_uses_one_query(self):
+        """Test chord/interval pairs are merged without per-node lookups."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.connect_chord_intervals({"major": ["P1", "M3", "P5"]})
+
+        db.cypher_query.assert_called_once()
+        rows = db.cypher_query.call_args.args[1]["rows"]
+        assert {"chord": "major", "interval": "M3"} in rows
+        assert len(rows) == 3
+
+    def test_chord_instances_use_one_query(self):
+        """Test chord instances carry their notes and functions as rows."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_chord_instances()
+
+        db.cypher_query.assert_called_once()
+        rows = db.cypher_query.call_args.args[1]["rows"]
+        assert len(rows) == len(init_music_db.TONICS) * len(init_music_db.CHORD_TYPES)
+        row = next(row for row in rows if row["name"] == "A-diminished")
+        assert row["members"] == [
+            {"note": "A", "function": "P1"},
+            {"note": "C", "function": "m3"},
+            {"note": "D#", "function": "d5"},
+        ]
+
+    def test_scale_instances_drop_octave_repeat(self):
+        """Test each scale instance lists its tonic once."""
+        with patch.object(init_music_db, "db") as db:
+            init_music_db.init_scale_instances()
+
+        db.cypher_query.assert_called_once()
+        rows = db.cypher_query.call_args.args[1]["rows"]
+        row = next(row for row in rows if row["name"] == "C-major")
+        assert row["notes"] == ["C", "D", "E", "F", "G", "A", "B"]
+
+    def test_initialize_clears_before_creating_constraints(self):
+        """Test the clear commits on its own before constraints and data writes."""
+        with patch.object(init_music_db, "db") as db, patch.object(
+            init_music_db, "config"
+        ):
+            init_music_db.initialize_music_database(clear=True)
+
+        calls = [
+            name if name != "cypher_query" else args[0].split()[0]
+            for name, args, _ in db.mock_calls
+        ]
+        assert calls == [
+            "transaction.__enter__",
+            "MATCH",
+            "transaction.__exit__",
+            *["CREATE"] * 6,
+            "transaction.__enter__",
+            "CALL",
+            "transaction.__exit__",
+        ]
+
+    def test_initialize_without_clear_uses_one_transaction(self):
+        """Test data writes commit in a single transaction that deletes nothing."""
+        with patch.object(init_music_db, "db") as db, patch.object(
+            init_music_db, "config"
+        ):
+            init_music_db.initialize_music_database()
+
+        db.transaction.__enter__.assert_called_once()
+        queries = [call.args[0] for call in db.cypher_query.call_args_list]
+        assert not any("DELETE" in query for query in queries)
@@ -1,5 +1,7 @@
 """Tests for the Instrument abstraction."""
 
+import dataclasses
+
 import pytest
 
 from src.midi_generator import Instrument, InstrumentConfig, Note, Sequence
@@ -81,6 +83,12 @@ class TestInstrumentConfig:
         with pytest.raises(ValueError, match="Transpose must be -127 to 127"):
             InstrumentConfig(channel=0, transpose=-128)
 
+    def test_config_is_immutable(self):
+        """Test configs cannot be changed after construction."""
+        config = InstrumentConfig(channel=0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.transpose = 12
+
 
 class TestInstrument:
     """Test Instrument functionality."""
@@ -123,6 +131,11 @@ class TestInstrument:
         assert instrument._apply_transpose(60) == 50
         assert instrument._apply_transpose(5) == 0  # Clamped to minimum
 
+        # Out-of-range input pitches are clamped rather than rejected
+        assert instrument._apply_transpose(200) == 127
+        assert instrument._apply_transpose(-1) == 0
+        assert instrument._apply_transpose(135) == 125
+
     def test_play_note_basic(self):
         """Test basic note playing."""
         self.instrument.play_note(60, velocity=100, duration=1.0)
@@ -206,6 +219,49 @@ class TestInstrument:
         assert played_sequence.notes[0].channel == 5  # Original channel preserved
         assert played_sequence.notes[0].pitch == 65  # But transpose still applied
 
+    def test_play_sequence_passthrough_without_rewrite(self):
+        """Test notes are passed through when no rewrite is needed."""
+        instrument = Instrument(
+            InstrumentConfig(channel=3), self.note_player, self.sequence_player
+        )
+        notes = [
+            Note(pitch=60, velocity=100, duration=0.5, channel=3),
+            Note(pitch=64, velocity=90, duration=0.5, start_beat=0.5, channel=3),
+        ]
+        sequence = Sequence(notes=notes, loop=True)
+
+        instrument.play_sequence(sequence)
+
+        played_sequence = self.sequence_player.played_sequences[0][1]
+        assert played_sequence is not sequence
+        assert played_sequence.notes == tuple(notes)
+        assert played_sequence.loop is True
+
+        # Loop state stays independent of the caller's sequence
+        played_sequence.loop = False
+        assert sequence.loop is True
+
+        # Replacing the caller's notes leaves the playing sequence untouched
+        sequence.notes = [Note(pitch=72, velocity=100, duration=4.0, channel=5)]
+        assert played_sequence.notes == tuple(notes)
+        assert played_sequence.total_duration() == 1.0
+        assert played_sequence.uniform_channel == 3
+
+    def test_play_sequence_rewrites_mixed_channels(self):
+        """Test mixed-channel sequences are still rewritten to one channel."""
+        instrument = Instrument(
+            InstrumentConfig(channel=3), self.note_player, self.sequence_player
+        )
+        notes = [
+            Note(pitch=60, velocity=100, duration=0.5, channel=3),
+            Note(pitch=64, velocity=90, duration=0.5, start_beat=0.5, channel=4),
+        ]
+
+        instrument.play_sequence(Sequence(notes=notes))
+
+        played_sequence = self.sequence_player.played_sequences[0][1]
+        assert [note.channel for note in played_sequence.notes] == [3, 3]
+
     def test_stop_sequence(self):
         """Test sequence stopping."""
         notes = [Note(pitch=60, velocity=100, duration=0.5, start_beat=0.0)]
@@ -237,6 +293,17 @@ class TestInstrument:
         assert len(self.sequence_player.stopped_sequences) == 2
         assert len(self.instrument.get_active_sequences()) == 0
 
+    def test_active_sequences_view_is_live(self):
+        """Test the returned view tracks later play/stop calls."""
+        notes = [Note(pitch=60, velocity=100, duration=0.5, start_beat=0.0)]
+        active = self.instrument.get_active_sequences()
+
+        seq_id = self.instrument.play_sequence(Sequence(notes=notes))
+        assert set(active) == {seq_id}
+
+        self.instrument.stop_sequence(seq_id)
+        assert len(active) == 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
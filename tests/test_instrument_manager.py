@@ -142,6 +142,33 @@ class TestInstrumentManager:
         result = self.manager.remove_instrument("nonexistent")
         assert result is False
 
+    def test_play_all(self):
+        """Test starting sequences on several instruments at once."""
+        self.manager.create_instrument("piano", 0)
+        self.manager.create_instrument("bass", 1)
+        notes = [Note(pitch=60, velocity=100, duration=0.5, start_beat=0.0)]
+
+        sequence_ids = self.manager.play_all(
+            {"piano": Sequence(notes=notes), "bass": Sequence(notes=notes)}
+        )
+
+        assert set(sequence_ids) == {"piano", "bass"}
+        assert len(self.sequence_player.played_sequences) == 2
+        piano = self.manager.get_instrument("piano")
+        assert sequence_ids["piano"] in piano.get_active_sequences()
+
+    def test_play_all_unknown_instrument(self):
+        """Test nothing is started when any instrument name is unknown."""
+        self.manager.create_instrument("piano", 0)
+        notes = [Note(pitch=60, velocity=100, duration=0.5, start_beat=0.0)]
+
+        with pytest.raises(KeyError, match="drums"):
+            self.manager.play_all(
+                {"piano": Sequence(notes=notes), "drums": Sequence(notes=notes)}
+            )
+
+        assert self.sequence_player.played_sequences == []
+
     def test_stop_all_instruments(self):
         """Test stopping all sequences on all instruments."""
         # Create instruments with sequences
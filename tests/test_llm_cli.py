@@ -0,0 +1,103 @@
+"""Tests for the LLM CLI session."""
+
+import asyncio
+from unittest.mock import MagicMock, Mock, call
+
+import pytest
+
+from src import llm_cli
+from src.llm_cli import LLMCLISession, match_direct_intent
+from src.llm_composer.midi_tools import MIDIToolResult
+
+
+class TestSystemStatus:
+    """Test the system status reported to the LLM and the user."""
+
+    def setup_method(self):
+        """Set up a session with mocked MIDI components."""
+        self.session = LLMCLISession()
+        self.session.controller = Mock(port=object())
+        self.session.transport = Mock(bpm=120, is_running=True)
+        self.session.instrument_manager = Mock(instruments={"piano": Mock()})
+        self.session.sequencer = Mock(active_sequences={1: Mock()})
+
+    def test_llm_status_has_no_glyphs(self):
+        """Test the LLM-facing status is plain text."""
+        assert self.session.get_system_status() == (
+            "MIDI output connected; BPM: 120; Transport running; "
+            "Instruments: piano; 1 active sequences"
+        )
+
+    def test_display_status_keeps_glyphs(self, monkeypatch):
+        """Test the status panel still shows the decorated status."""
+        console = Mock()
+        monkeypatch.setattr(llm_cli, "console", console)
+
+        self.session.display_status()
+
+        panel = console.print.call_args.args[0]
+        assert panel.renderable == (
+            "✓ MIDI output connected | ♪ BPM: 120 | ▶ Transport running | "
+            "🎹 Instruments: piano | 🎵 1 active sequences"
+        )
+
+
+class TestProcessPrompt:
+    """Test how prompt results are shown to the user."""
+
+    def test_streamed_results_are_not_repeated(self, monkeypatch):
+        """Test results shown while streaming are not displayed again."""
+        monkeypatch.setattr(llm_cli, "console", MagicMock())
+        session = LLMCLISession()
+        streamed = MIDIToolResult(success=True, message="played")
+        failed = MIDIToolResult(success=False, message="LLM request failed")
+
+        async def generate_and_execute(prompt, status, on_result=None):
+            on_result(streamed)
+            return [streamed, failed]
+
+        session.llm_composer = Mock(generate_and_execute=generate_and_execute)
+        session.display_result = Mock()
+
+        assert asyncio.run(session.process_prompt("play")) is True
+        assert session.display_result.call_args_list == [
+            call(1, streamed),
+            call(2, failed),
+        ]
+
+
+class TestDirectIntents:
+    """Test prompts answered without an LLM round trip."""
+
+    @pytest.mark.parametrize(
+        "prompt, command",
+        [
+            ("stop", "stop"),
+            ("Stop all music!", "stop"),
+            ("please stop everything", "stop"),
+            ("show my instruments", "instruments"),
+            ("list sequences", "sequences"),
+            ("what's the bpm?", "status"),
+            ("stop all music and start over", None),
+            ("stop the bass", None),
+            ("create a piano instrument", None),
+        ],
+    )
+    def test_match_direct_intent(self, prompt, command):
+        """Test only whole, unambiguous prompts are matched."""
+        assert match_direct_intent(prompt) == command
+
+    def test_stop_skips_llm(self, monkeypatch):
+        """Test a direct stop runs through the composer without the LLM."""
+        monkeypatch.setattr(llm_cli, "console", MagicMock())
+        session = LLMCLISession()
+        session.llm_composer = Mock()
+        session.llm_composer.execute_commands.return_value = []
+
+        asyncio.run(session.process_prompt("stop everything"))
+
+        session.llm_composer.execute_commands.assert_called_once_with(
+            "stop everything", [{"type": "stop_all"}]
+        )
+        session.llm_composer.generate_and_execute.assert_not_called()
+        assert (session.direct_intent_count, session.prompt_count) == (1, 1)
@@ -0,0 +1,56 @@
+"""Tests for the composer memory system."""
+
+from datetime import datetime
+
+from src.llm_composer.memory import ComposerMemory, ConversationTurn
+
+
+class TestConversationRetrieval:
+    """Test selection of conversation turns for prompt context."""
+
+    def setup_method(self):
+        """Set up a memory with several recorded turns."""
+        self.memory = ComposerMemory()
+        for prompt in [
+            "create a jazz piano",
+            "add a walking bass line",
+            "play a C major scale on the piano",
+            "make the drums louder",
+            "slow the tempo down",
+        ]:
+            self.memory.add_conversation_turn(
+                ConversationTurn(
+                    timestamp=datetime.now(),
+                    user_prompt=prompt,
+                    llm_response="{}",
+                    commands_executed=[],
+                    musical_intent="general_musical_request",
+                )
+            )
+
+    def _prompts(self, turns):
+        """Return the user prompts of the given turns."""
+        return [turn.user_prompt for turn in turns]
+
+    def test_without_query_returns_latest(self):
+        """Test the latest turns are returned when no query is given."""
+        assert self._prompts(self.memory.get_recent_conversation_context(2)) == [
+            "make the drums louder",
+            "slow the tempo down",
+        ]
+
+    def test_query_selects_relevant_turns(self):
+        """Test turns sharing words with the query are preferred."""
+        turns = self.memory.get_recent_conversation_context(
+            3, query="use the previous piano again"
+        )
+
+        assert self._prompts(turns) == [
+            "create a jazz piano",
+            "play a C major scale on the piano",
+            "slow the tempo down",
+        ]
+
+    def test_zero_turns(self):
+        """Test asking for no turns returns none."""
+        assert self.memory.get_recent_conversation_context(0, query="piano") == []
@@ -0,0 +1,144 @@
+"""Tests for the MIDIController."""
+
+import time
+
+from src.midi_generator import MIDIController
+
+
+class MockPort:
+    """Mock mido output port that records sent messages."""
+
+    def __init__(self):
+        """Initialize the mock port."""
+        self.sent = []
+        self.closed = False
+
+    def send(self, msg) -> None:
+        """Mock send method."""
+        self.sent.append(msg)
+
+    def close(self) -> None:
+        """Mock close method."""
+        self.closed = True
+
+
+class TestMIDIController:
+    """Test MIDIController message output."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.controller = MIDIController()
+        self.port = MockPort()
+        self.controller.port = self.port
+
+    def teardown_method(self):
+        """Stop any dispatcher thread started by a test."""
+        self.controller.close()
+
+    def test_send_note_does_not_block(self):
+        """Test send_note returns before the note duration elapses."""
+        start = time.perf_counter()
+        self.controller.send_note(60, 100, channel=1, duration=0.5)
+        assert time.perf_counter() - start < 0.1
+
+        assert len(self.port.sent) == 1
+        assert self.port.sent[0].type == "note_on"
+        assert self.port.sent[0].note == 60
+        assert self.port.sent[0].channel == 1
+
+    def test_send_note_releases_at_deadline(self):
+        """Test the queued note_off is sent once the duration has passed."""
+        self.controller.send_note(60, 100, channel=1, duration=0.02)
+        time.sleep(0.1)
+
+        assert [msg.type for msg in self.port.sent] == ["note_on", "note_off"]
+        assert self.port.sent[1].note == 60
+        assert self.port.sent[1].channel == 1
+
+    def test_overlapping_notes_release_in_deadline_order(self):
+        """Test note_offs are dispatched by deadline, not by call order."""
+        self.controller.send_note(60, 100, duration=0.06)
+        self.controller.send_note(64, 100, duration=0.02)
+        time.sleep(0.15)
+
+        note_offs = [msg.note for msg in self.port.sent if msg.type == "note_off"]
+        assert note_offs == [64, 60]
+
+    def test_stop_sequence_drops_pending_releases(self):
+        """Test stop_sequence cancels queued note_offs after the panic."""
+        self.controller.send_note(60, 100, duration=0.05)
+        self.controller.stop_sequence()
+        time.sleep(0.1)
+
+        assert not any(msg.type == "note_off" for msg in self.port.sent)
+
+    def test_send_note_without_port(self):
+        """Test send_note is a no-op when no port is connected."""
+        self.controller.port = None
+        self.controller.send_note(60, 100)
+        assert self.port.sent == []
+
+    def test_stop_sequence_sends_channel_mode_messages(self):
+        """Test stop_sequence silences each channel with CC#123 and CC#120."""
+        self.controller.stop_sequence()
+
+        assert len(self.port.sent) == 32
+        assert all(msg.type == "control_change" for msg in self.port.sent)
+        assert {(msg.channel, msg.control) for msg in self.port.sent} == {
+            (channel, control) for channel in range(16) for control in (120, 123)
+        }
+
+
+class MockRtMidiOut:
+    """Mock python-rtmidi MidiOut that records raw messages."""
+
+    def __init__(self):
+        """Initialize the mock rtmidi output."""
+        self.messages = []
+
+    def send_message(self, message) -> None:
+        """Mock send_message method."""
+        self.messages.append(tuple(message))
+
+
+class TestMIDIControllerRawOutput:
+    """Test the raw rtmidi fast path."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.controller = MIDIController()
+        self.port = MockPort()
+        self.rt = MockRtMidiOut()
+        self.controller.port = self.port
+        self.controller._rt = self.rt
+
+    def test_note_messages_bypass_mido(self):
+        """Test note_on/note_off go straight to the rtmidi output."""
+        self.controller.send_note_on(60, 100, channel=2)
+        self.controller.send_note_off(60, channel=2)
+
+        assert self.rt.messages == [(0x92, 60, 100), (0x82, 60, 0)]
+        assert self.port.sent == []
+
+    def test_send_raw_falls_back_to_port(self):
+        """Test send_raw builds a mido message when rtmidi is unavailable."""
+        self.controller._rt = None
+        self.controller.send_raw(0xB3, 7, 90)
+
+        assert len(self.port.sent) == 1
+        msg = self.port.sent[0]
+        assert (msg.type, msg.channel, msg.control, msg.value) == (
+            "control_change",
+            3,
+            7,
+            90,
+        )
+
+    def test_all_notes_off_uses_raw_messages(self):
+        """Test the panic path sends raw channel-mode messages."""
+        self.controller.send_all_notes_off()
+
+        assert len(self.rt.messages) == 32
+        assert (0xB0, 123, 0) in self.rt.messages
+        assert (0xBF, 120, 0) in self.rt.messages
+        assert self.port.sent == []
@@ -0,0 +1,67 @@
+"""Tests for sequence string parsing."""
+
+import pytest
+
+from src.midi_generator.parsing import parse_sequence
+
+
+class TestParseSequence:
+    """Test parsing of the CLI sequence format."""
+
+    def test_parse_full_fields(self):
+        """Test notes with every field are laid out back to back."""
+        sequence = parse_sequence("60,100,1,0.5;64,90,1,1.0;67,80,1,0.25")
+
+        assert [note.to_tuple() for note in sequence.notes] == [
+            (60, 100, 1, 0.5),
+            (64, 90, 1, 1.0),
+            (67, 80, 1, 0.25),
+        ]
+        assert [note.start_beat for note in sequence.notes] == [0.0, 0.5, 1.5]
+        assert sequence.total_duration() == 1.75
+
+    def test_parse_defaults_and_blank_segments(self):
+        """Test optional fields default and empty segments are skipped."""
+        sequence = parse_sequence("60,100;; ;62,100,2;")
+
+        assert [note.to_tuple() for note in sequence.notes] == [
+            (60, 100, 0, 0.5),
+            (62, 100, 2, 0.5),
+        ]
+
+    def test_repeated_parse_returns_independent_notes(self):
+        """Test cached parses still hand out fresh, unshared notes."""
+        first = parse_sequence("60,100,0,0.5;64,100,0,0.5")
+        second = parse_sequence("60,100,0,0.5;64,100,0,0.5")
+
+        assert first.notes == second.notes
+        assert first.notes[0] is not second.notes[0]
+
+    def test_parse_rejects_missing_velocity(self):
+        """Test a note without a velocity is rejected."""
+        with pytest.raises(ValueError, match="at least note and velocity"):
+            parse_sequence("60,100;62")
+
+    def test_parse_rejects_out_of_range(self):
+        """Test out-of-range parameters are rejected."""
+        with pytest.raises(ValueError, match="Invalid note parameters"):
+            parse_sequence("60,100,16,0.5")
+
+    def test_parse_reports_invalid_note_position(self):
+        """Test the error names the first offending note."""
+        with pytest.raises(ValueError, match=r"note 2\)"):
+            parse_sequence("60,100;60,-1;200,100")
+
+    def test_parse_durations_as_floats(self):
+        """Test common and uncommon duration spellings parse to floats."""
+        sequence = parse_sequence("60,100,0,1;62,100,0,0.3;64,100,0,2.0")
+
+        durations = [note.duration for note in sequence.notes]
+        assert durations == [1.0, 0.3, 2.0]
+        assert all(type(duration) is float for duration in durations)
+
+    def test_parse_unusual_spellings(self):
+        """Test padded, signed or zero-prefixed fields still parse."""
+        sequence = parse_sequence(" 060, +100,0 ,1e-1")
+
+        assert [note.to_tuple() for note in sequence.notes] == [(60, 100, 0, 0.1)]
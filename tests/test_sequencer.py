@@ -0,0 +1,83 @@
+"""Tests for the MIDISequencer."""
+
+import time
+
+from src.midi_generator import Note, Sequence
+from src.midi_generator.sequencer import MIDISequencer
+from src.midi_generator.transport import PreciseTransport
+
+
+class MockMIDIController:
+    """Mock MIDIController that records note events."""
+
+    def __init__(self):
+        """Initialize the mock controller."""
+        self.port = object()
+        self.events = []
+
+    def send_note_on(self, note: int, velocity: int, channel: int = 0) -> None:
+        """Mock send_note_on method."""
+        self.events.append(("on", note, velocity, channel))
+
+    def send_note_off(self, note: int, channel: int = 0) -> None:
+        """Mock send_note_off method."""
+        self.events.append(("off", note, channel))
+
+
+class TestMIDISequencer:
+    """Test scheduling through MIDISequencer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.controller = MockMIDIController()
+        self.transport = PreciseTransport(initial_bpm=1200.0)
+        self.sequencer = MIDISequencer(self.controller, self.transport)
+        self.transport.start()
+
+    def teardown_method(self):
+        """Stop the transport."""
+        self.transport.stop()
+
+    def test_schedule_note(self):
+        """Test a single note produces a note_on then a note_off."""
+        beat = self.transport.current_beat
+        self.sequencer.schedule_note(beat + 0.2, 60, 100, channel=2, duration=0.2)
+        time.sleep(0.1)
+
+        assert self.controller.events == [("on", 60, 100, 2), ("off", 60, 2)]
+
+    def test_schedule_sequence_plays_all_notes(self):
+        """Test every note of a sequence is sent once when not looping."""
+        sequence = Sequence(
+            notes=[
+                Note(pitch=60, velocity=100, duration=0.25, channel=1),
+                Note(pitch=64, velocity=90, duration=0.25, start_beat=0.25, channel=1),
+            ]
+        )
+        self.sequencer.schedule_sequence(sequence)
+        time.sleep(0.1)
+
+        note_ons = [event for event in self.controller.events if event[0] == "on"]
+        assert note_ons == [("on", 60, 100, 1), ("on", 64, 90, 1)]
+
+    def test_looping_sequence_rearms(self):
+        """Test a looping sequence keeps scheduling new iterations."""
+        sequence = Sequence(
+            notes=[Note(pitch=60, velocity=100, duration=0.5)], loop=True
+        )
+        sequence_id = self.sequencer.schedule_sequence(sequence)
+        time.sleep(0.15)
+        self.sequencer.stop_loop(sequence_id)
+
+        state = self.sequencer.active_sequences[sequence_id]
+        assert state.current_iteration >= 3
+
+    def test_lookahead_delays_sequence_start(self):
+        """Test new sequences start one lookahead after the current beat."""
+        sequencer = MIDISequencer(self.controller, self.transport, lookahead_beats=2.0)
+        sequence = Sequence(notes=[Note(pitch=60, velocity=100, duration=0.25)])
+        sequencer.schedule_sequence(sequence)
+
+        assert self.controller.events == []
+        time.sleep(0.15)
+        assert self.controller.events[0] == ("on", 60, 100, 0)
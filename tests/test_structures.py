@@ -0,0 +1,88 @@
+"""Tests for the Note and Sequence data structures."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.midi_generator import Note, Sequence
+
+
+class TestNote:
+    """Test Note validation and immutability."""
+
+    def test_invalid_pitch_rejected(self):
+        """Test out-of-range pitches are rejected."""
+        with pytest.raises(ValueError, match="Pitch"):
+            Note(pitch=128, velocity=100, duration=0.5)
+
+    def test_range_errors_name_the_field(self):
+        """Test negative and oversized values report the offending field."""
+        with pytest.raises(ValueError, match="Velocity"):
+            Note(pitch=60, velocity=-1, duration=0.5)
+        with pytest.raises(ValueError, match="Channel"):
+            Note(pitch=60, velocity=100, duration=0.5, channel=16)
+        assert Note(pitch=127, velocity=0, duration=0.5, channel=15).channel == 15
+
+    def test_note_is_immutable(self):
+        """Test notes cannot be modified after construction."""
+        note = Note(pitch=60, velocity=100, duration=0.5)
+        with pytest.raises(FrozenInstanceError):
+            note.pitch = 61
+
+    def test_note_has_no_instance_dict(self):
+        """Test notes are slotted."""
+        assert not hasattr(Note(pitch=60, velocity=100, duration=0.5), "__dict__")
+
+
+class TestSequence:
+    """Test Sequence construction and derived values."""
+
+    def test_empty_sequence_rejected(self):
+        """Test a sequence needs at least one note."""
+        with pytest.raises(ValueError):
+            Sequence(notes=[])
+
+    def test_total_duration(self):
+        """Test total duration covers the note that ends last."""
+        sequence = Sequence(
+            notes=[
+                Note(pitch=60, velocity=100, duration=2.0),
+                Note(pitch=64, velocity=100, duration=0.5, start_beat=1.0),
+            ]
+        )
+        assert sequence.total_duration() == 2.0
+
+    def test_from_tuple_list_accumulates_start_beats(self):
+        """Test tuple notes are laid out back to back."""
+        sequence = Sequence.from_tuple_list([(60, 100, 0, 0.5), (64, 100, 0, 1.0)])
+        assert [note.start_beat for note in sequence.notes] == [0.0, 0.5]
+        assert sequence.total_duration() == 1.5
+
+    def test_uniform_channel(self):
+        """Test the shared channel is reported only when all notes agree."""
+        same = Sequence.from_tuple_list([(60, 100, 2, 0.5), (64, 100, 2, 0.5)])
+        mixed = Sequence.from_tuple_list([(60, 100, 2, 0.5), (64, 100, 3, 0.5)])
+
+        assert same.uniform_channel == 2
+        assert mixed.uniform_channel is None
+
+    def test_notes_cannot_change_in_place(self):
+        """Test the notes are stored as a tuple that cannot be appended to."""
+        sequence = Sequence.from_tuple_list([(60, 100, 0, 0.5)])
+
+        assert isinstance(sequence.notes, tuple)
+        with pytest.raises(AttributeError):
+            sequence.notes.append(Note(pitch=64, velocity=100, duration=1.0))
+
+    def test_reassigned_notes_refresh_cached_values(self):
+        """Test assigning new notes updates the duration and channel."""
+        sequence = Sequence.from_tuple_list([(60, 100, 2, 0.5)])
+        sequence.notes = [
+            Note(pitch=60, velocity=100, duration=0.5, channel=2),
+            Note(pitch=64, velocity=100, duration=1.0, start_beat=0.5, channel=3),
+        ]
+
+        assert sequence.total_duration() == 1.5
+        assert sequence.uniform_channel is None
+        with pytest.raises(ValueError):
+            sequence.notes = []
@@ -0,0 +1,84 @@
+"""Tests for the PreciseTransport scheduler."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.midi_generator.transport import PreciseTransport, TimedEvent
+
+
+class TestPreciseTransport:
+    """Test event scheduling on PreciseTransport."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.transport = PreciseTransport(initial_bpm=600.0)
+        self.calls = []
+
+    def teardown_method(self):
+        """Stop the transport if a test started it."""
+        if self.transport._is_playing:
+            self.transport.stop()
+
+    def test_schedule_event_batch_requires_playing(self):
+        """Test batches are rejected while the transport is stopped."""
+        event_ids = self.transport.schedule_event_batch(
+            [(0.0, self.calls.append, ("a",))]
+        )
+        assert event_ids == []
+        assert self.calls == []
+
+    def test_schedule_event_batch_runs_events_in_beat_order(self):
+        """Test batched events get unique IDs and fire in beat order."""
+        self.transport.start()
+        beat = self.transport.current_beat
+        event_ids = self.transport.schedule_event_batch(
+            [
+                (beat + 0.2, self.calls.append, ("late",)),
+                (beat + 0.1, self.calls.append, ("early",)),
+            ],
+            concurrent=False,
+        )
+        time.sleep(0.1)
+
+        assert len(set(event_ids)) == 2
+        assert self.calls == ["early", "late"]
+
+    def test_schedule_event_batch_executes_past_due_immediately(self):
+        """Test past-due events run in the calling thread before returning."""
+        self.transport.start()
+        self.transport.schedule_event_batch([(0.0, self.calls.append, ("now",))])
+        assert self.calls == ["now"]
+
+    def test_schedule_event_passes_args(self):
+        """Test schedule_event invokes the callback with the given args."""
+        self.transport.start()
+        beat = self.transport.current_beat
+        self.transport.schedule_event(beat + 0.1, self.calls.append, args=("queued",))
+        self.transport.schedule_event(0.0, self.calls.append, args=("immediate",))
+        time.sleep(0.05)
+
+        assert self.calls == ["immediate", "queued"]
+
+    def test_schedule_event_keeps_positional_concurrent(self):
+        """Test a positional third argument is still the concurrent flag."""
+        self.transport.start()
+        self.transport.schedule_event(0.0, lambda: self.calls.append("now"), False)
+
+        assert self.calls == ["now"]
+
+    def test_due_concurrent_events_share_one_pool_task(self):
+        """Test events due together are submitted as one ordered pool task."""
+        self.transport._thread_pool = ThreadPoolExecutor(max_workers=2)
+        events = [
+            TimedEvent(timestamp_ns=i, callback=self.calls.append, args=(i,))
+            for i in range(5)
+        ]
+        try:
+            self.transport._execute_ready_events(events)
+            assert len(self.transport._active_futures) == 1
+            self.transport._active_futures[0].result(timeout=1.0)
+        finally:
+            self.transport._thread_pool.shutdown(wait=True)
+            self.transport._thread_pool = None
+
+        assert self.calls == [0, 1, 2, 3, 4]